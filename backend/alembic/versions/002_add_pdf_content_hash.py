@@ -0,0 +1,36 @@
+"""Add content hash to policy documents for upload deduplication
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'policy_documents',
+        sa.Column('pdf_content_hash', sa.String(64), nullable=True)
+    )
+    op.create_index(
+        'ix_policy_documents_payer_content_hash',
+        'policy_documents',
+        ['payer_id', 'pdf_content_hash'],
+        unique=True,
+        postgresql_where=sa.text('is_deleted = false')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_policy_documents_payer_content_hash', table_name='policy_documents')
+    op.drop_column('policy_documents', 'pdf_content_hash')
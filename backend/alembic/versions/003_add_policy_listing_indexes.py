@@ -0,0 +1,38 @@
+"""Add partial indexes for keyset pagination of policy listings
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Newest-first listing walks these backwards; count(*) can use index-only scans
+    op.create_index(
+        'ix_policy_documents_created_at_id',
+        'policy_documents',
+        ['created_at', 'id'],
+        postgresql_where=sa.text('is_deleted = false')
+    )
+    op.create_index(
+        'ix_policy_documents_payer_created_at_id',
+        'policy_documents',
+        ['payer_id', 'created_at', 'id'],
+        postgresql_where=sa.text('is_deleted = false')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_policy_documents_payer_created_at_id', table_name='policy_documents')
+    op.drop_index('ix_policy_documents_created_at_id', table_name='policy_documents')
@@ -0,0 +1,53 @@
+"""Add generated tsvector columns and GIN indexes for full-text search
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Titles and procedure names weigh most in ts_rank_cd, supporting text least
+SEARCH_VECTORS = {
+    'policy_sections': (
+        "setweight(to_tsvector('english', title), 'A') || "
+        "setweight(to_tsvector('english', content_text), 'B')"
+    ),
+    'coverage_criteria': (
+        "setweight(to_tsvector('english', procedure_name || ' ' || coalesce(procedure_code, '')), 'A') || "
+        "setweight(to_tsvector('english', covered_scenarios), 'B') || "
+        "setweight(to_tsvector('english', coalesce(required_documentation, '')), 'C')"
+    ),
+    'exclusions': (
+        "setweight(to_tsvector('english', excluded_procedure), 'A') || "
+        "setweight(to_tsvector('english', coalesce(exclusion_rationale, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(exceptions_to_exclusion, '')), 'C')"
+    ),
+}
+
+
+def upgrade() -> None:
+    # Stored generated columns rewrite each table once; PostgreSQL keeps them current on write
+    for table, expression in SEARCH_VECTORS.items():
+        op.add_column(
+            table,
+            sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(expression, persisted=True))
+        )
+        op.create_index(f'ix_{table}_search_vector', table, ['search_vector'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    for table in reversed(list(SEARCH_VECTORS)):
+        op.drop_index(f'ix_{table}_search_vector', table_name=table)
+        op.drop_column(table, 'search_vector')
@@ -0,0 +1,168 @@
+"""Benchmark persisting one policy's extraction: per-row ORM flushes versus bulk INSERTs.
+
+Builds a synthetic extraction (80 sections, 400 coverage criteria, 80
+exclusions by default) and writes it three ways inside a transaction that
+is rolled back after every run:
+  - db.add + flush per row (one round trip per row)
+  - db.add for every row, one flush at the end (ORM unit of work)
+  - ExtractionWriter (three multi-row INSERT ... RETURNING statements)
+
+Requires a migrated PostgreSQL database (default: DATABASE_URL). Row
+building, which needs no database, is timed first.
+
+Usage:
+    python scripts/benchmark_bulk_writer.py --sections 80 --criteria 5 --repeats 5
+"""
+import argparse
+import asyncio
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from uuid import uuid4
+
+# Add backend to path so package-relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.config import settings
+from src.models.coverage_criteria import CoverageCriteria
+from src.models.exclusion import Exclusion
+from src.models.payer import Payer
+from src.models.policy_document import DocumentType, PolicyDocument, ProcessingStatus
+from src.models.policy_section import PolicySection
+from src.services.extraction.schemas import CoverageExtraction, ExclusionExtraction, PolicySectionExtraction
+from src.services.ingestion.document_chunker import DocumentChunker
+from src.services.ingestion.extraction_writer import ExtractionWriter
+
+
+SECTION_TEXT = (
+    "Total knee arthroplasty (CPT 27447) is considered medically necessary when the member has "
+    "radiographic evidence of advanced joint disease and has failed three months of conservative therapy. "
+) * 6
+
+
+def make_extraction(sections: int, criteria: int, exclusions: int):
+    """Chunks and section results shaped like a long coverage policy."""
+    text = "\n".join(f"\nSECTION {n}: Coverage Criteria\n{SECTION_TEXT}" for n in range(1, sections + 1))
+    chunks = DocumentChunker().chunk_by_sections(text)
+    results = [
+        PolicySectionExtraction(
+            section_type="COVERAGE_CRITERIA",
+            title=chunk.title,
+            section_number=str(index + 1),
+            content_summary="Criteria for knee replacement coverage",
+            coverage_criteria=[
+                CoverageExtraction(
+                    procedure_name=f"Total Knee Arthroplasty variant {n}",
+                    procedure_code="27447",
+                    covered_scenarios="Advanced joint disease after failed conservative therapy",
+                    required_documentation="Radiographs and therapy notes",
+                    prior_authorization_required=True,
+                    confidence_score=0.9
+                )
+                for n in range(criteria)
+            ],
+            exclusions=[
+                ExclusionExtraction(
+                    excluded_procedure=f"Arthroscopic lavage variant {n}",
+                    exclusion_rationale="Not effective for osteoarthritis",
+                    confidence_score=0.85
+                )
+                for n in range(exclusions)
+            ],
+            confidence_score=0.9
+        )
+        for index, chunk in enumerate(chunks)
+    ]
+    return chunks, results
+
+
+async def write_orm(db: AsyncSession, policy_document_id, writer: ExtractionWriter, chunks, results, flush_each: bool):
+    """Write the same rows as ORM objects, flushing per row or once."""
+    rows = writer.build_rows(policy_document_id, chunks, results)
+    for model, table_rows in (
+        (PolicySection, rows.sections),
+        (CoverageCriteria, rows.coverage_criteria),
+        (Exclusion, rows.exclusions),
+    ):
+        for row in table_rows:
+            db.add(model(**row))
+            if flush_each:
+                await db.flush()
+    await db.flush()
+
+
+async def run(args):
+    writer = ExtractionWriter()
+    chunks, results = make_extraction(args.sections, args.criteria, args.exclusions)
+    rows = writer.build_rows(uuid4(), chunks, results)
+    row_count = len(rows.sections) + len(rows.coverage_criteria) + len(rows.exclusions)
+    
+    start = time.perf_counter()
+    for _ in range(args.repeats):
+        writer.build_rows(uuid4(), chunks, results)
+    build_ms = (time.perf_counter() - start) * 1000 / args.repeats
+    
+    print(
+        f"💾 {len(rows.sections)} sections, {len(rows.coverage_criteria)} criteria, "
+        f"{len(rows.exclusions)} exclusions ({row_count} rows), best of {args.repeats} runs"
+    )
+    print(f"{'build rows':>22} {build_ms:>7.1f}ms")
+    
+    engine = create_async_engine(args.database_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    
+    methods = {
+        "flush per row": lambda db, doc_id: write_orm(db, doc_id, writer, chunks, results, flush_each=True),
+        "orm, one flush": lambda db, doc_id: write_orm(db, doc_id, writer, chunks, results, flush_each=False),
+        "bulk insert": lambda db, doc_id: writer.write(db, doc_id, chunks, results),
+    }
+    
+    try:
+        for name, method in methods.items():
+            timings = []
+            for _ in range(args.repeats):
+                async with session_factory() as db:
+                    payer = Payer(name=f"Bulk Writer Benchmark {uuid4()}")
+                    db.add(payer)
+                    await db.flush()
+                    policy_doc = PolicyDocument(
+                        payer_id=payer.id,
+                        policy_name="Bulk Writer Benchmark",
+                        effective_date=date(2024, 1, 1),
+                        document_type=DocumentType.MEDICAL,
+                        pdf_storage_path="benchmark/bulk_writer.pdf",
+                        pdf_file_size_bytes=0,
+                        pdf_page_count=1,
+                        processing_status=ProcessingStatus.STRUCTURING_DATA
+                    )
+                    db.add(policy_doc)
+                    await db.flush()
+                    
+                    start = time.perf_counter()
+                    await method(db, policy_doc.id)
+                    timings.append(time.perf_counter() - start)
+                    await db.rollback()
+            
+            best = min(timings)
+            print(f"{name:>22} {best * 1000:>7.1f}ms {row_count / best:>9.0f} rows/s")
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=80)
+    parser.add_argument("--criteria", type=int, default=5, help="Coverage criteria per section")
+    parser.add_argument("--exclusions", type=int, default=1, help="Exclusions per section")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--database-url", default=settings.database_url)
+    args = parser.parse_args()
+    
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Compare LLM calls per document for character-sized and token-budget chunks.
+
+Generates synthetic policies with sections of varied length and reports, for
+each chunking mode, how many chunks (one LLM call each) a document needs, how
+full the average call is relative to the token budget, and how many chunks
+overflow it.
+
+Usage:
+    python scripts/benchmark_chunk_budget.py --docs 50 --budget 3000 --overlap 150
+"""
+import argparse
+import random
+import statistics
+import sys
+from pathlib import Path
+
+# Add backend to path so package-relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.ingestion.document_chunker import DocumentChunker
+from src.utils.token_counter import get_token_counter
+
+
+HEADERS = [
+    "Coverage Criteria",
+    "Exclusions",
+    "Requirements",
+    "Definitions",
+    "Prior Authorization",
+    "Limitations",
+    "Appeals Process",
+]
+
+SENTENCES = [
+    "The plan covers total knee arthroplasty (CPT 27447) when the member has radiographic evidence of advanced joint disease.",
+    "Arthroscopic lavage and debridement (CPT 29870, 29877) are not covered for osteoarthritis of the knee.",
+    "Documentation must include at least three months of failed conservative therapy, including physical therapy and NSAIDs.",
+    "Prior authorization is required for elective procedures performed in an inpatient setting.",
+    "Requests are reviewed against current clinical evidence and nationally recognized guidelines.",
+    "Frequency is limited to one procedure per joint per lifetime unless revision criteria are met.",
+]
+
+
+def make_policy(rng: random.Random) -> str:
+    """Build a policy with a few short and a few very long sections."""
+    parts = ["Medical Policy"]
+    
+    for section_num in range(1, rng.randint(5, 9)):
+        parts.append(f"\nSECTION {section_num}: {rng.choice(HEADERS)}\n")
+        
+        paragraph_count = rng.choice([1, 2, 4, 12, 40])
+        for _ in range(paragraph_count):
+            parts.append(" ".join(rng.choice(SENTENCES) for _ in range(rng.randint(2, 8))))
+            parts.append("")
+    
+    return "\n".join(parts)
+
+
+def summarize(chunks_per_doc, token_counts, budget):
+    """Format calls/doc, fill, and overflow for one mode."""
+    fill = statistics.mean(token_counts) / budget
+    overflow = sum(1 for tokens in token_counts if tokens > budget)
+    return (
+        f"{statistics.mean(chunks_per_doc):>10.1f} {fill:>8.0%} "
+        f"{max(token_counts):>11} {overflow:>9}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=50)
+    parser.add_argument("--budget", type=int, default=3000, help="Token budget per chunk")
+    parser.add_argument("--overlap", type=int, default=150, help="Overlap tokens in token mode")
+    parser.add_argument("--chars", type=int, default=4000, help="Characters per chunk in character mode")
+    parser.add_argument("--model", default="gpt-4")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+    
+    counter = get_token_counter(args.model)
+    rng = random.Random(args.seed)
+    policies = [make_policy(rng) for _ in range(args.docs)]
+    
+    modes = {
+        f"{args.chars} chars": DocumentChunker(max_chunk_size=args.chars),
+        f"{args.budget} tokens": DocumentChunker(
+            max_chunk_tokens=args.budget,
+            overlap_tokens=args.overlap,
+            token_counter=counter
+        ),
+    }
+    
+    tokenizer = "tokenizer" if counter.is_exact else "offline estimate"
+    print(f"🧮 {args.docs} documents, {args.model} ({tokenizer}), budget {args.budget} tokens")
+    print(f"{'mode':>14} {'calls/doc':>10} {'fill':>8} {'max tokens':>11} {'overflow':>9}")
+    
+    for name, chunker in modes.items():
+        chunks_per_doc = []
+        token_counts = []
+        
+        for policy in policies:
+            chunks = chunker.chunk_by_sections(policy)
+            chunks_per_doc.append(len(chunks))
+            token_counts.extend(counter.count(chunk.text) for chunk in chunks)
+        
+        print(f"{name:>14} {summarize(chunks_per_doc, token_counts, args.budget)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Benchmark the single-pass section boundary scanner against the ten-pass original.
+
+Generates synthetic policy texts of increasing size, checks that
+DocumentChunker.chunk_by_sections produces exactly the same sections as the
+legacy scanner (one re.finditer pass per pattern, merged and sorted), and
+reports timings.
+
+Usage:
+    python scripts/benchmark_chunker.py --sizes 100000 1000000 5000000
+"""
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path so package-relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.ingestion.document_chunker import DocumentChunker
+
+
+LEGACY_PATTERNS = [
+    r'\n\s*(?:SECTION|Section)\s+\d+[:\.\s]+(.+?)\n',
+    r'\n\s*(?:COVERAGE|Coverage)\s+(?:CRITERIA|Criteria)[:\s]*\n',
+    r'\n\s*(?:EXCLUSIONS|Exclusions)[:\s]*\n',
+    r'\n\s*(?:REQUIREMENTS|Requirements)[:\s]*\n',
+    r'\n\s*(?:DEFINITIONS|Definitions)[:\s]*\n',
+    r'\n\s*(?:PRIOR AUTHORIZATION|Prior Authorization)[:\s]*\n',
+    r'\n\s*(?:LIMITATIONS|Limitations)[:\s]*\n',
+    r'\n\s*(?:APPEALS|Appeals)\s+(?:PROCESS|Process)[:\s]*\n',
+    r'\n\s*\d+\.\s+(.+?)\n',
+    r'\n\s*[A-Z][:\.\s]+(.+?)\n',
+]
+
+HEADERS = [
+    "SECTION {n}: Coverage Policy",
+    "Coverage Criteria:",
+    "Exclusions",
+    "REQUIREMENTS:",
+    "Definitions",
+    "Prior Authorization",
+    "Limitations:",
+    "Appeals Process",
+]
+
+LINES = [
+    "The plan covers total knee arthroplasty (CPT 27447) when criteria are met.",
+    "Services must be ordered by a board-certified orthopedic surgeon and performed in an accredited facility.",
+    "Requests are reviewed against current clinical evidence and nationally recognized guidelines.",
+    "Coverage is subject to the member's benefit plan, including applicable copayments and deductibles.",
+    "Imaging performed within the preceding twelve months must accompany the request for review.",
+    "A member must have failed at least three months of conservative therapy.",
+    "I. Radiographic evidence of advanced joint disease is documented.",
+    "{n}. Documentation of functional limitation is submitted.",
+    "B. Arthroscopic lavage (CPT 29870) is not covered for osteoarthritis.",
+    "Prior authorization is required for all elective procedures.",
+    "",
+]
+
+
+class LegacyChunker(DocumentChunker):
+    """DocumentChunker with the original one-finditer-per-pattern scanner."""
+    
+    def _find_boundaries(self, text):
+        boundaries = []
+        for pattern in LEGACY_PATTERNS:
+            for match in re.finditer(pattern, text, re.IGNORECASE):
+                boundaries.append({
+                    'position': match.start(),
+                    'title': match.group(0).strip(),
+                    'pattern': pattern
+                })
+        
+        boundaries.sort(key=lambda x: x['position'])
+        return boundaries
+
+
+def make_text(target_chars: int, seed: int) -> str:
+    """Build policy-like text with headers, numbered and lettered lines."""
+    rng = random.Random(seed)
+    parts = []
+    size = 0
+    n = 0
+    
+    while size < target_chars:
+        n += 1
+        if rng.random() < 0.08:
+            line = rng.choice(HEADERS).format(n=n)
+            if rng.random() < 0.3:
+                line = "\n" + line
+        else:
+            line = rng.choice(LINES).format(n=n % 20 + 1)
+        parts.append(line)
+        size += len(line) + 1
+    
+    return "\n".join(parts)
+
+
+def best_of(fn, repeats: int) -> float:
+    """Return the fastest wall-clock time of several runs."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000, 5_000_000])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    
+    chunker = DocumentChunker()
+    legacy = LegacyChunker()
+    
+    print(f"✂️  Section boundary scan, best of {args.repeats} runs")
+    print(
+        f"{'chars':>10} {'sections':>9} {'scan legacy':>12} {'scan single':>12} {'speedup':>8} "
+        f"{'chunk legacy':>13} {'chunk single':>13} {'speedup':>8}"
+    )
+    
+    for size in args.sizes:
+        text = make_text(size, args.seed)
+        
+        expected = legacy.chunk_by_sections(text)
+        actual = chunker.chunk_by_sections(text)
+        assert [(s.title, s.start, s.end) for s in actual] == [(s.title, s.start, s.end) for s in expected], \
+            "section output differs from legacy scanner"
+        
+        legacy_scan = best_of(lambda: legacy._find_boundaries(text), args.repeats)
+        single_scan = best_of(lambda: chunker._find_boundaries(text), args.repeats)
+        legacy_chunk = best_of(lambda: legacy.chunk_by_sections(text), args.repeats)
+        single_chunk = best_of(lambda: chunker.chunk_by_sections(text), args.repeats)
+        
+        print(
+            f"{len(text):>10} {len(actual):>9} "
+            f"{legacy_scan * 1000:>10.0f}ms {single_scan * 1000:>10.0f}ms {legacy_scan / single_scan:>7.2f}x "
+            f"{legacy_chunk * 1000:>11.0f}ms {single_chunk * 1000:>11.0f}ms {legacy_chunk / single_chunk:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark concurrent upload latency against the local storage backend.
+
+Compares blocking uploads run inline on the event loop with the async,
+executor-backed upload path, and measures how long the event loop stalls
+while uploads are in flight.
+
+Usage:
+    python scripts/benchmark_concurrent_uploads.py --uploads 16 --size-mb 50
+"""
+import argparse
+import asyncio
+import io
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Force the local backend into a throwaway directory before settings load
+_storage_dir = tempfile.mkdtemp(prefix="policy-upload-bench-")
+os.environ["AZURE_STORAGE_CONNECTION_STRING"] = ""
+os.environ["LOCAL_STORAGE_PATH"] = _storage_dir
+
+# Add backend to path so package-relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import settings
+from src.services.ingestion.uploader import PDFUploader
+from src.utils.azure_storage import AzureStorageService
+
+
+def make_payload(size_mb: int) -> bytes:
+    """Build a fake PDF payload of the requested size."""
+    body = os.urandom(size_mb * 1024 * 1024 - 9)
+    return b"%PDF-1.7\n" + body
+
+
+async def heartbeat(stop: asyncio.Event, lags: list[float], interval: float = 0.01):
+    """Record how late the event loop wakes up a periodic task."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def upload_blocking(uploader: PDFUploader, payload: bytes, index: int) -> float:
+    """Upload on the event loop thread (previous behavior)."""
+    start = time.perf_counter()
+    uploader.upload_pdf_stream(
+        io.BytesIO(payload),
+        f"bench_{index}.pdf",
+        "benchmark",
+        chunk_size=settings.upload_chunk_size_bytes,
+        max_size_mb=len(payload) // (1024 * 1024) + 1
+    )
+    return time.perf_counter() - start
+
+
+async def upload_async(uploader: PDFUploader, payload: bytes, index: int) -> float:
+    """Upload through the executor-backed async path."""
+    start = time.perf_counter()
+    await uploader.upload_pdf_stream_async(
+        io.BytesIO(payload),
+        f"bench_{index}.pdf",
+        "benchmark",
+        chunk_size=settings.upload_chunk_size_bytes,
+        max_size_mb=len(payload) // (1024 * 1024) + 1
+    )
+    return time.perf_counter() - start
+
+
+async def run_mode(name: str, upload_fn, uploader: PDFUploader, payload: bytes, uploads: int):
+    """Run one benchmark mode and print latency and loop-stall statistics."""
+    stop = asyncio.Event()
+    lags: list[float] = []
+    ticker = asyncio.create_task(heartbeat(stop, lags))
+    
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(upload_fn(uploader, payload, i) for i in range(uploads)))
+    wall = time.perf_counter() - start
+    
+    stop.set()
+    await ticker
+    
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"\n{name}")
+    print(f"  wall time:          {wall:.2f}s")
+    print(f"  upload latency p50: {statistics.median(latencies) * 1000:.0f}ms")
+    print(f"  upload latency p95: {p95 * 1000:.0f}ms")
+    print(f"  max loop stall:     {max(lags, default=0.0) * 1000:.0f}ms")
+    print(f"  heartbeats:         {len(lags)}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uploads", type=int, default=16, help="Concurrent uploads")
+    parser.add_argument("--size-mb", type=int, default=50, help="Payload size per upload")
+    args = parser.parse_args()
+    
+    payload = make_payload(args.size_mb)
+    uploader = PDFUploader(AzureStorageService())
+    
+    print(f"📦 {args.uploads} concurrent uploads of {args.size_mb}MB to {_storage_dir}")
+    await run_mode("Blocking (inline on event loop)", upload_blocking, uploader, payload, args.uploads)
+    await run_mode("Async (storage I/O thread pool)", upload_async, uploader, payload, args.uploads)
+    
+    shutil.rmtree(_storage_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
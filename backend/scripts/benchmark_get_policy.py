@@ -0,0 +1,163 @@
+"""Benchmark policy details: three ORM queries versus one JSON-building query.
+
+Seeds one policy with long sections (200 by default), then times and
+measures Python allocations (tracemalloc peak) for:
+  - the previous handler: policy, sections, and payer loaded as ORM objects
+    in three queries, section text cut to 500 characters in Python
+  - get_policy: one query where PostgreSQL joins the payer, cuts the text,
+    and aggregates the sections into the response JSON
+
+Seeded rows are deleted afterwards. Requires a migrated PostgreSQL
+database (default: DATABASE_URL).
+
+Usage:
+    python scripts/benchmark_get_policy.py --sections 200 --section-chars 8000
+"""
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+from uuid import uuid4
+
+# Add backend to path so package-relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.api.routes.policies import get_policy
+from src.config import settings
+from src.models.payer import Payer
+from src.models.policy_document import DocumentType, PolicyDocument, ProcessingStatus
+from src.models.policy_section import PolicySection, SectionType
+
+
+async def seed(session_factory, sections: int, section_chars: int):
+    """Insert a payer, one policy, and its sections; returns both IDs."""
+    payer_id = uuid4()
+    policy_id = uuid4()
+    content = ("Coverage applies when criteria are met. " * (section_chars // 40 + 1))[:section_chars]
+    
+    async with session_factory() as db:
+        db.add(Payer(id=payer_id, name=f"Get Policy Benchmark {payer_id}"))
+        db.add(PolicyDocument(
+            id=policy_id,
+            payer_id=payer_id,
+            policy_name="Get Policy Benchmark",
+            effective_date=date(2024, 1, 1),
+            document_type=DocumentType.MEDICAL,
+            pdf_storage_path="benchmark/get_policy.pdf",
+            pdf_file_size_bytes=0,
+            pdf_page_count=sections,
+            processing_status=ProcessingStatus.COMPLETE
+        ))
+        await db.flush()
+        await db.execute(
+            insert(PolicySection.__table__).returning(PolicySection.id),
+            [
+                {
+                    "id": uuid4(),
+                    "policy_document_id": policy_id,
+                    "section_type": SectionType.COVERAGE_CRITERIA,
+                    "section_number": str(n + 1),
+                    "title": f"Section {n + 1}",
+                    "content_text": content,
+                    "order_index": n,
+                }
+                for n in range(sections)
+            ]
+        )
+        await db.commit()
+    
+    return payer_id, policy_id
+
+
+async def three_queries(db: AsyncSession, policy_id):
+    """The previous get_policy body: three round trips and ORM hydration."""
+    policy = (await db.execute(
+        select(PolicyDocument).where(PolicyDocument.id == policy_id, PolicyDocument.is_deleted == False)
+    )).scalar_one()
+    sections = (await db.execute(
+        select(PolicySection)
+        .where(PolicySection.policy_document_id == policy_id)
+        .order_by(PolicySection.order_index)
+    )).scalars().all()
+    payer = (await db.execute(select(Payer).where(Payer.id == policy.payer_id))).scalar_one_or_none()
+    
+    return {
+        "policy": {
+            "id": str(policy.id),
+            "payer_name": payer.name if payer else None,
+            "policy_name": policy.policy_name,
+            "created_at": policy.created_at.isoformat(),
+        },
+        "sections": [
+            {
+                "id": str(s.id),
+                "title": s.title,
+                "content_text": s.content_text[:500] + "..." if len(s.content_text) > 500 else s.content_text,
+                "order_index": s.order_index,
+            }
+            for s in sections
+        ],
+    }
+
+
+async def measure(session_factory, fn, repeats: int):
+    """Fastest run in milliseconds and the largest tracemalloc peak in KiB."""
+    timings = []
+    peak = 0
+    for _ in range(repeats):
+        # Fresh session each run so the identity map does not serve cached rows
+        async with session_factory() as db:
+            tracemalloc.start()
+            start = time.perf_counter()
+            await fn(db)
+            timings.append(time.perf_counter() - start)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+    return min(timings) * 1000, peak / 1024
+
+
+async def run(args):
+    engine = create_async_engine(args.database_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    
+    print(f"📄 seeding one policy with {args.sections} sections of {args.section_chars} chars...")
+    payer_id, policy_id = await seed(session_factory, args.sections, args.section_chars)
+    
+    methods = {
+        "three orm queries": lambda db: three_queries(db, policy_id),
+        "one json query": lambda db: get_policy(policy_id=str(policy_id), db=db),
+    }
+    
+    try:
+        print(f"{'method':>20} {'time':>9} {'py alloc peak':>14}")
+        for name, fn in methods.items():
+            elapsed_ms, peak_kib = await measure(session_factory, fn, args.repeats)
+            print(f"{name:>20} {elapsed_ms:>7.1f}ms {peak_kib:>11.0f}KiB")
+    finally:
+        async with session_factory() as db:
+            await db.execute(delete(PolicySection).where(PolicySection.policy_document_id == policy_id))
+            await db.execute(delete(PolicyDocument).where(PolicyDocument.id == policy_id))
+            await db.execute(delete(Payer).where(Payer.id == payer_id))
+            await db.commit()
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=200)
+    parser.add_argument("--section-chars", type=int, default=8000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--database-url", default=settings.database_url)
+    args = parser.parse_args()
+    
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
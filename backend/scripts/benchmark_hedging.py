@@ -0,0 +1,131 @@
+"""Show how hedged and fallback-model requests shrink LLM tail latency.
+
+Runs PolicyExtractionAgent against local function models with heavy-tailed
+latency (a lognormal body plus occasional stragglers), with hedging off,
+hedging to the same model at the p95 latency, and hedging to a faster
+fallback model. Reports caller-visible latency quantiles, a histogram, and
+the extra requests hedging cost.
+
+Usage:
+    python scripts/benchmark_hedging.py --calls 1000 --straggler-rate 0.05
+"""
+import argparse
+import asyncio
+import math
+import random
+import sys
+from pathlib import Path
+
+# Add backend to path so package-relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from src.services.extraction.latency import LatencyPolicy
+from src.services.extraction.llm_agent import PolicyExtractionAgent
+from src.services.extraction.rate_limiter import RateLimiter
+from src.services.ingestion.document_chunker import DocumentChunker
+
+
+SECTION_RESULT = {
+    "section_type": "COVERAGE_CRITERIA",
+    "title": "Coverage Criteria",
+    "content_summary": "Criteria for knee replacement coverage",
+    "confidence_score": 0.9
+}
+
+BUCKETS = (0.05, 0.1, 0.2, 0.5, 1, 2)
+
+
+class SlowTailModel:
+    """Function model with lognormal latency and occasional very slow responses."""
+    
+    def __init__(self, median: float, straggler_rate: float, straggler_factor: float, seed: int):
+        self.median = median
+        self.straggler_rate = straggler_rate
+        self.straggler_factor = straggler_factor
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.model = FunctionModel(self.respond)
+    
+    async def respond(self, messages, info: AgentInfo) -> ModelResponse:
+        self.requests += 1
+        latency = self.median * math.exp(self.rng.gauss(0, 0.3))
+        if self.rng.random() < self.straggler_rate:
+            latency *= self.straggler_factor
+        
+        await asyncio.sleep(latency)
+        return ModelResponse(parts=[ToolCallPart.from_dict(info.result_tools[0].name, SECTION_RESULT)])
+
+
+async def run(args):
+    text = "\n".join(
+        f"\nSECTION {n}: Coverage Criteria\nKnee arthroplasty is covered when criteria {n} are met.\n"
+        for n in range(1, args.calls + 1)
+    )
+    sections = DocumentChunker().chunk_by_sections(text)
+    
+    print(
+        f"⏱️  {len(sections)} section calls, median {args.median * 1000:.0f}ms, "
+        f"{args.straggler_rate:.0%} stragglers at {args.straggler_factor:g}x"
+    )
+    print(
+        f"{'mode':>18} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>7} {'extra req':>10} {'hedges won':>11}"
+    )
+    
+    modes = {
+        "no hedging": (None, False),
+        "hedge p95": (0.95, False),
+        "hedge p95 fallback": (0.95, True),
+    }
+    
+    histograms = {}
+    for name, (quantile, use_fallback) in modes.items():
+        primary = SlowTailModel(args.median, args.straggler_rate, args.straggler_factor, seed=1)
+        fallback = SlowTailModel(args.median * 0.6, 0.0, 1.0, seed=2)
+        agent = PolicyExtractionAgent(
+            model=primary.model,
+            max_concurrency=args.concurrency,
+            rate_limiter=RateLimiter(),
+            latency_policy=LatencyPolicy(
+                deadline_seconds=args.deadline,
+                hedge_quantile=quantile,
+                hedge_min_samples=20
+            ),
+            fallback_model=fallback.model if use_fallback else None
+        )
+        
+        await agent.extract_sections(sections)
+        
+        stats = agent.latency_stats()
+        requests = primary.requests + fallback.requests
+        histograms[name] = agent.call_latency.histogram(BUCKETS)
+        print(
+            f"{name:>18} {stats['p50'] * 1000:>5.0f}ms {stats['p95'] * 1000:>5.0f}ms "
+            f"{stats['p99'] * 1000:>5.0f}ms {stats['max'] * 1000:>5.0f}ms "
+            f"{(requests - len(sections)) / len(sections):>10.1%} {stats['hedges_won']:>11}"
+        )
+    
+    print("\nLatency histogram (calls per bucket):")
+    labels = list(next(iter(histograms.values())))
+    print(f"{'':>18} " + " ".join(f"{label:>7}" for label in labels))
+    for name, histogram in histograms.items():
+        print(f"{name:>18} " + " ".join(f"{histogram[label]:>7}" for label in labels))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--median", type=float, default=0.1, help="Median model latency in seconds")
+    parser.add_argument("--straggler-rate", type=float, default=0.05)
+    parser.add_argument("--straggler-factor", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--deadline", type=float, default=5.0)
+    args = parser.parse_args()
+    
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark cold versus cached section extraction for each LLM cache backend.
+
+Runs PolicyExtractionAgent against a local function model with fixed
+latency (no API calls), extracting the same sections twice: the first pass
+fills the cache, the second should be served from it.
+
+Usage:
+    python scripts/benchmark_llm_cache.py --sections 50 --latency 0.5
+    python scripts/benchmark_llm_cache.py --backends memory sqlite redis --redis-url redis://localhost:6379/0
+"""
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend to path so package-relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from src.services.extraction.llm_agent import PolicyExtractionAgent
+from src.services.extraction.rate_limiter import RateLimiter
+from src.services.extraction.response_cache import (
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    ResponseCache,
+    SQLiteCacheBackend,
+)
+from src.services.ingestion.document_chunker import DocumentChunker
+
+
+SECTION_RESULT = {
+    "section_type": "EXCLUSIONS",
+    "title": "Exclusions",
+    "content_summary": "Arthroscopic lavage is not covered for osteoarthritis",
+    "exclusions": [{
+        "excluded_procedure": "Arthroscopic lavage (CPT 29870)",
+        "exclusion_rationale": "Not medically necessary for osteoarthritis of the knee",
+        "confidence_score": 0.9
+    }],
+    "confidence_score": 0.9
+}
+
+
+def make_model(latency: float) -> FunctionModel:
+    """Function model that answers every section after a fixed delay."""
+    async def respond(messages, info: AgentInfo) -> ModelResponse:
+        await asyncio.sleep(latency)
+        return ModelResponse(parts=[ToolCallPart.from_dict(info.result_tools[0].name, SECTION_RESULT)])
+    
+    return FunctionModel(respond)
+
+
+def make_backend(name: str, directory: str, redis_url: str):
+    """Build a fresh cache backend by name."""
+    if name == "memory":
+        return MemoryCacheBackend()
+    elif name == "sqlite":
+        return SQLiteCacheBackend(Path(directory) / "llm_cache.sqlite3")
+    elif name == "redis":
+        return RedisCacheBackend(redis_url, prefix=f"llm-cache-benchmark:{time.time_ns()}:")
+    raise ValueError(name)
+
+
+async def run(args):
+    text = "\n".join(
+        f"\nSECTION {n}: Exclusions\nArthroscopic lavage (CPT 29870) is not covered in setting {n}.\n"
+        for n in range(1, args.sections + 1)
+    )
+    sections = DocumentChunker().chunk_by_sections(text)
+    
+    print(f"🗄️  {args.sections} sections, {args.latency * 1000:.0f}ms model latency, concurrency {args.concurrency}")
+    print(f"{'backend':>8} {'cold':>8} {'warm':>8} {'speedup':>8} {'hits':>5} {'misses':>7} {'ms/hit':>7}")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        for name in args.backends:
+            cache = ResponseCache(make_backend(name, directory, args.redis_url), ttl_seconds=3600)
+            agent = PolicyExtractionAgent(
+                model=make_model(args.latency),
+                max_concurrency=args.concurrency,
+                rate_limiter=RateLimiter(),
+                cache=cache
+            )
+            
+            start = time.perf_counter()
+            cold_results = await agent.extract_sections(sections)
+            cold = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            warm_results = await agent.extract_sections(sections)
+            warm = time.perf_counter() - start
+            
+            assert warm_results == cold_results
+            stats = cache.stats()
+            await cache.close()
+            
+            print(
+                f"{name:>8} {cold:>7.2f}s {warm:>7.3f}s {cold / warm:>7.0f}x "
+                f"{stats['hits']:>5} {stats['misses']:>7} {stats['avg_hit_ms']:>7.2f}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.5, help="Seconds per model call")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--backends", nargs="+", default=["memory", "sqlite"], choices=["memory", "sqlite", "redis"])
+    parser.add_argument("--redis-url", default="redis://localhost:6379/0")
+    args = parser.parse_args()
+    
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
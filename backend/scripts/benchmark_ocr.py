@@ -0,0 +1,82 @@
+"""Benchmark OCR throughput of rasterized pages across process pool sizes.
+
+Builds a synthetic "scanned" PDF (every page is an image with no native
+text) and reports pages per second and per-page latency for
+OCRProcessor.process_pdf_pages at each worker count.
+
+Requires the tesseract binary on PATH.
+
+Usage:
+    python scripts/benchmark_ocr.py --pages 24 --workers 1 2 4 --dpi 200
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+import pymupdf
+
+# Add backend to path so package-relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.services.ingestion.ocr_processor import OCRProcessor
+
+
+PARAGRAPH = (
+    "Exclusions: Cosmetic procedures, experimental treatments and services not "
+    "medically necessary are not covered. Arthroscopic lavage (CPT 29870) is "
+    "excluded for osteoarthritis of the knee. "
+)
+
+
+def make_scanned_pdf(path: Path, pages: int) -> None:
+    """Write a PDF whose pages are rendered images of text."""
+    source = pymupdf.open()
+    page = source.new_page()
+    page.insert_textbox(pymupdf.Rect(36, 36, 576, 756), PARAGRAPH * 12, fontsize=11)
+    pixmap = page.get_pixmap(dpi=150)
+    image_bytes = pixmap.tobytes("png")
+    source.close()
+    
+    doc = pymupdf.open()
+    for _ in range(pages):
+        scanned = doc.new_page()
+        scanned.insert_image(scanned.rect, stream=image_bytes)
+    doc.save(path)
+    doc.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=24)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, os.cpu_count() or 1])
+    parser.add_argument("--dpi", type=int, default=300)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "scanned.pdf"
+        make_scanned_pdf(pdf_path, args.pages)
+        
+        print(f"🔎 {args.pages} scanned pages at {args.dpi} DPI")
+        print(f"{'workers':>7} {'wall':>8} {'pages/s':>8} {'p50 page':>9} {'p95 page':>9} {'conf':>5}")
+        
+        for workers in sorted(set(args.workers)):
+            processor = OCRProcessor(dpi=args.dpi, max_workers=workers)
+            try:
+                result = processor.process_pdf_pages(pdf_path)
+            finally:
+                processor.shutdown()
+            
+            durations = sorted(page["duration_seconds"] for page in result["pages"])
+            p95 = durations[min(len(durations) - 1, int(len(durations) * 0.95))]
+            
+            print(
+                f"{workers:>7} {result['elapsed_seconds']:>7.1f}s {result['pages_per_second']:>8.2f} "
+                f"{statistics.median(durations):>8.2f}s {p95:>8.2f}s {result['confidence']:>5.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""Benchmark end-to-end ingestion throughput with the offline LLM stand-in.
+
+Generates a synthetic corpus of policy PDFs, stores them in a throwaway
+local storage directory, and runs each document through the processor's
+stages: PDF text extraction, section chunking, section-level LLM
+structuring (answered by OfflineModel, so no API calls are made), and
+persistence. Reports documents per minute, per-stage latency percentiles,
+LLM call counts, and peak memory.
+
+Persistence only builds the rows to insert unless --database-url points
+at a migrated database; rows are then inserted and rolled back.
+
+Usage:
+    python scripts/benchmark_pipeline.py --documents 40 --concurrency 4 --latency 0.5
+    python scripts/benchmark_pipeline.py --rate-limit-rate 0.05 --invalid-rate 0.01
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import resource
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Tuple
+from uuid import uuid4
+
+import pymupdf
+
+# Force the local backend into a throwaway directory before settings load
+_storage_dir = tempfile.mkdtemp(prefix="policy-pipeline-bench-")
+os.environ["AZURE_STORAGE_CONNECTION_STRING"] = ""
+os.environ["LOCAL_STORAGE_PATH"] = _storage_dir
+os.environ["OCR_CACHE_ENABLED"] = "false"
+
+# Add backend to path so package-relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.models.payer import Payer
+from src.models.policy_document import DocumentType, PolicyDocument, ProcessingStatus
+from src.services.extraction.llm_agent import PolicyExtractionAgent
+from src.services.extraction.offline_model import OfflineModel
+from src.services.extraction.rate_limiter import RateLimiter
+from src.services.extraction.retry import RetryPolicy
+from src.services.ingestion.processor import IngestionProcessor
+from src.utils.azure_storage import AzureStorageService
+
+
+STAGES = ("extract", "chunk", "llm", "persist", "total")
+
+SECTION_TEMPLATES = [
+    ("Coverage Criteria", [
+        "{name} ({code}) is considered medically necessary when conservative therapy has failed for at least six weeks.",
+        "Prior authorization is required for {name} ({code}) in an outpatient setting.",
+        "Coverage of {name} ({code}) is limited to one procedure per joint per lifetime.",
+    ]),
+    ("Exclusions", [
+        "{name} ({code}) is considered experimental and investigational and is not covered.",
+        "Repeat {name} ({code}) within twelve months is not medically necessary.",
+    ]),
+    ("Definitions", [
+        "Conservative therapy means physical therapy, anti-inflammatory medication, and activity modification.",
+        "Medically necessary means services a provider would render using prudent clinical judgment.",
+    ]),
+    ("Documentation Requirements", [
+        "Requests for {name} ({code}) must include imaging reports and office notes from the last 90 days.",
+    ]),
+    ("Appeals Process", [
+        "Members may appeal a denial within 180 days of the notice of adverse determination.",
+        "An expedited appeal is decided within 72 hours when a delay would jeopardize the member's health.",
+    ]),
+]
+
+PROCEDURES = [
+    ("Total knee arthroplasty", "27447"),
+    ("Total hip arthroplasty", "27130"),
+    ("Lumbar spinal fusion", "22612"),
+    ("Knee arthroscopy", "29881"),
+    ("Bone growth stimulator", "E0748"),
+    ("Sleep study", "95810"),
+]
+
+
+def make_policy_pdf(path: Path, rng: random.Random, index: int, sections: int) -> None:
+    """Write a policy-like PDF with numbered sections, procedure codes, and dates."""
+    lines = [
+        f"Synthetic Medical Policy {index}",
+        f"Effective Date: 2024-{rng.randint(1, 12):02d}-01",
+        "",
+    ]
+    for number in range(1, sections + 1):
+        title, sentences = SECTION_TEMPLATES[(number - 1) % len(SECTION_TEMPLATES)]
+        lines.append(f"SECTION {number}: {title}")
+        for _ in range(rng.randint(4, 12)):
+            name, code = rng.choice(PROCEDURES)
+            lines.append(rng.choice(sentences).format(name=name, code=code))
+        lines.append("")
+    
+    doc = pymupdf.open()
+    for start in range(0, len(lines), 45):
+        page = doc.new_page()
+        page.insert_textbox(pymupdf.Rect(36, 36, 576, 756), "\n".join(lines[start:start + 45]), fontsize=8)
+    doc.save(path)
+    doc.close()
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Nearest-rank percentile of samples (q between 0 and 1)."""
+    ordered = sorted(samples)
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+def rss_mb() -> float:
+    """Peak resident set size of this process in MB (ru_maxrss is KB on Linux, bytes on macOS)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def process_document(
+    processor: IngestionProcessor,
+    storage_path: str,
+    index: int,
+    session_factory,
+    timings: Dict[str, List[float]]
+) -> Tuple[int, int]:
+    """Run one document through every stage, recording per-stage wall time."""
+    started = time.perf_counter()
+    
+    async with processor.extraction_semaphore:
+        pdf_info = await processor._extract_text(storage_path)
+    extracted = time.perf_counter()
+    
+    chunks = processor.chunker.chunk_by_sections(
+        pdf_info["full_text"],
+        processor.chunker.page_offsets(pdf_info["pages"])
+    )
+    chunked = time.perf_counter()
+    
+    section_results, placeholders = await processor._extract_sections(chunks)
+    extraction = processor.agent.merge_sections(
+        section_results,
+        payer_name="Synthetic Payer",
+        policy_name=f"Synthetic Medical Policy {index}",
+        effective_date=date(2024, 1, 1)
+    )
+    structured = time.perf_counter()
+    
+    async with processor.persistence_semaphore:
+        policy_doc = PolicyDocument(
+            policy_name=extraction.policy_name,
+            effective_date=extraction.effective_date,
+            document_type=DocumentType.MEDICAL,
+            pdf_storage_path=storage_path,
+            pdf_file_size_bytes=0,
+            pdf_page_count=pdf_info["page_count"],
+            processing_status=ProcessingStatus.STRUCTURING_DATA
+        )
+        if session_factory is None:
+            processor.writer.build_rows(uuid4(), chunks, extraction.sections)
+        else:
+            async with session_factory() as db:
+                payer = Payer(name=f"Pipeline Benchmark {os.getpid()}-{index}")
+                db.add(payer)
+                await db.flush()
+                
+                policy_doc.payer_id = payer.id
+                db.add(policy_doc)
+                await db.flush()
+                
+                await processor.writer.write(db, policy_doc.id, chunks, extraction.sections)
+                await db.rollback()
+    persisted = time.perf_counter()
+    
+    for stage, seconds in zip(STAGES, (
+        extracted - started,
+        chunked - extracted,
+        structured - chunked,
+        persisted - structured,
+        persisted - started,
+    )):
+        timings[stage].append(seconds)
+    
+    return len(chunks), placeholders
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    storage = AzureStorageService()
+    
+    corpus_dir = Path(_storage_dir) / "corpus"
+    corpus_dir.mkdir()
+    storage_paths = []
+    for index in range(args.documents):
+        pdf_path = corpus_dir / f"policy_{index}.pdf"
+        make_policy_pdf(pdf_path, rng, index, rng.randint(*args.sections))
+        storage_path = f"benchmark/policy_{index}.pdf"
+        await storage.upload_async(pdf_path.read_bytes(), storage_path)
+        storage_paths.append(storage_path)
+    
+    model = OfflineModel(
+        latency_seconds=args.latency,
+        latency_sigma=args.sigma,
+        rate_limit_rate=args.rate_limit_rate,
+        invalid_rate=args.invalid_rate,
+        seed=args.seed
+    )
+    agent = PolicyExtractionAgent(
+        model=model,
+        max_concurrency=args.llm_concurrency,
+        rate_limiter=RateLimiter(requests_per_minute=args.rpm or None),
+        retry_policy=RetryPolicy(base_delay=0.1, max_delay=2.0, rng=random.Random(args.seed))
+    )
+    processor = IngestionProcessor(
+        storage,
+        agent=agent,
+        extraction_concurrency=args.concurrency,
+        persistence_concurrency=args.concurrency
+    )
+    
+    engine = None
+    session_factory = None
+    if args.database_url:
+        engine = create_async_engine(args.database_url)
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    
+    timings: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+    documents = asyncio.Semaphore(args.concurrency)
+    
+    async def bounded(storage_path, index):
+        async with documents:
+            return await process_document(processor, storage_path, index, session_factory, timings)
+    
+    print(
+        f"🏭 {args.documents} documents, {args.concurrency} at a time, "
+        f"offline LLM median {args.latency:g}s (sigma {args.sigma:g}), "
+        f"persistence: {'database' if engine else 'rows built, not inserted'}"
+    )
+    
+    baseline_rss = rss_mb()
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(bounded(path, index) for index, path in enumerate(storage_paths)),
+        return_exceptions=True
+    )
+    elapsed = time.perf_counter() - start
+    
+    if engine is not None:
+        await engine.dispose()
+    
+    failed = [result for result in results if isinstance(result, BaseException)]
+    sections = sum(result[0] for result in results if not isinstance(result, BaseException))
+    placeholders = sum(result[1] for result in results if not isinstance(result, BaseException))
+    completed = len(results) - len(failed)
+    
+    print(f"{'stage':>8} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+    for stage in STAGES:
+        samples = timings[stage]
+        if not samples:
+            continue
+        print(
+            f"{stage:>8} "
+            + " ".join(f"{percentile(samples, q) * 1000:>7.0f}ms" for q in (0.50, 0.95, 0.99))
+            + f" {max(samples) * 1000:>7.0f}ms"
+        )
+    
+    print()
+    print(f"documents:   {completed} completed, {len(failed)} failed in {elapsed:.1f}s")
+    print(f"throughput:  {completed / elapsed * 60:.1f} docs/min, {sections / elapsed:.1f} sections/s")
+    print(f"llm calls:   {model.requests} for {sections} sections (rule-skipped sections make none)")
+    print(f"invalid:     {placeholders} sections kept as empty placeholders")
+    print(f"peak rss:    {rss_mb():.0f} MB ({rss_mb() - baseline_rss:+.0f} MB during the run)")
+    for error in failed[:3]:
+        print(f"   failure: {type(error).__name__}: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=40)
+    parser.add_argument("--sections", type=int, nargs=2, default=[8, 40], metavar=("MIN", "MAX"))
+    parser.add_argument("--concurrency", type=int, default=4, help="Documents in flight")
+    parser.add_argument("--llm-concurrency", type=int, default=16, help="LLM calls in flight")
+    parser.add_argument("--latency", type=float, default=0.5, help="Median offline LLM latency in seconds")
+    parser.add_argument("--sigma", type=float, default=0.4, help="Lognormal latency spread")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of calls failing with 429")
+    parser.add_argument("--invalid-rate", type=float, default=0.0, help="Share of calls returning invalid output")
+    parser.add_argument("--rpm", type=int, default=0, help="Requests per minute limit (0: unlimited)")
+    parser.add_argument("--database-url", default=None, help="Insert rows into this database and roll back")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    logging.disable(logging.WARNING)
+    try:
+        asyncio.run(run(args))
+    finally:
+        shutil.rmtree(_storage_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Benchmark policy listing: OFFSET versus keyset pages, and total count strategies.
+
+Seeds synthetic policy documents under a throwaway payer, then times:
+  - the previous total (load every row, len()) versus count(*) versus the
+    planner estimate
+  - pages at increasing depth with OFFSET versus the keyset cursor
+
+Seeded rows are deleted afterwards. Requires a PostgreSQL database migrated
+to revision 003 (default: DATABASE_URL).
+
+Usage:
+    python scripts/benchmark_policy_listing.py --policies 200000 --depths 0 1000 10000 100000
+"""
+import argparse
+import asyncio
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+# Add backend to path so package-relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import delete, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.api.routes.policies import list_policies
+from src.config import settings
+from src.models.payer import Payer
+from src.models.policy_document import DocumentType, PolicyDocument, ProcessingStatus
+from src.utils.pagination import encode_cursor
+
+
+async def seed(session_factory, policies: int, batch_size: int = 5000):
+    """Insert a payer and its policy documents; returns the payer ID."""
+    payer_id = uuid4()
+    start = datetime.utcnow() - timedelta(days=3650)
+    
+    async with session_factory() as db:
+        db.add(Payer(id=payer_id, name=f"Listing Benchmark {payer_id}"))
+        await db.flush()
+        
+        for offset in range(0, policies, batch_size):
+            rows = [
+                {
+                    "id": uuid4(),
+                    "payer_id": payer_id,
+                    "policy_name": f"Synthetic Policy {n}",
+                    "effective_date": date(2024, 1, 1),
+                    "version": 1,
+                    "document_type": DocumentType.MEDICAL,
+                    "pdf_storage_path": f"benchmark/{n}.pdf",
+                    "pdf_file_size_bytes": 0,
+                    "pdf_page_count": 1,
+                    "processing_status": ProcessingStatus.COMPLETE,
+                    "requires_manual_review": False,
+                    "is_deleted": n % 50 == 0,
+                    "created_at": start + timedelta(seconds=n * 60),
+                    "updated_at": start + timedelta(seconds=n * 60),
+                }
+                for n in range(offset, min(offset + batch_size, policies))
+            ]
+            await db.execute(insert(PolicyDocument.__table__).returning(PolicyDocument.id), rows)
+        await db.commit()
+        await db.execute(text("ANALYZE policy_documents"))
+        await db.commit()
+    
+    return payer_id
+
+
+async def timed(fn, repeats: int) -> float:
+    """Fastest of several awaited runs, in milliseconds."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+async def run(args):
+    engine = create_async_engine(args.database_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    
+    print(f"📚 seeding {args.policies} policies...")
+    payer_id = await seed(session_factory, args.policies)
+    
+    def listing(db, **kwargs):
+        params = {"payer_id": str(payer_id), "limit": 20, "offset": 0, "cursor": None, "count": "none"}
+        params.update(kwargs)
+        return list_policies(db=db, **params)
+    
+    try:
+        async with session_factory() as db:
+            async def load_all():
+                result = await db.execute(
+                    select(PolicyDocument).where(
+                        PolicyDocument.is_deleted == False,
+                        PolicyDocument.payer_id == payer_id
+                    )
+                )
+                return len(result.scalars().all())
+            
+            exact = (await listing(db, count="exact"))["total"]
+            estimated = (await listing(db, count="estimated"))["total"]
+            
+            print(f"{'total count':>22} {'time':>9}")
+            print(f"{'load rows + len()':>22} {await timed(load_all, args.repeats):>7.1f}ms")
+            print(f"{'count(*)':>22} {await timed(lambda: listing(db, count='exact'), args.repeats):>7.1f}ms  ({exact})")
+            print(f"{'planner estimate':>22} {await timed(lambda: listing(db, count='estimated'), args.repeats):>7.1f}ms  ({estimated})")
+            
+            print(f"\n{'page depth':>22} {'offset':>9} {'cursor':>9}")
+            for depth in (d for d in args.depths if d < exact):
+                # Find the cursor for this depth once (as a client paging through would have it)
+                cursor = None
+                if depth:
+                    row = (await db.execute(
+                        select(PolicyDocument.created_at, PolicyDocument.id)
+                        .where(PolicyDocument.is_deleted == False, PolicyDocument.payer_id == payer_id)
+                        .order_by(PolicyDocument.created_at.desc(), PolicyDocument.id.desc())
+                        .offset(depth - 1)
+                        .limit(1)
+                    )).one()
+                    cursor = encode_cursor(row.created_at, row.id)
+                
+                offset_ms = await timed(lambda: listing(db, offset=depth), args.repeats)
+                cursor_ms = await timed(lambda: listing(db, cursor=cursor), args.repeats)
+                print(f"{depth:>22} {offset_ms:>7.1f}ms {cursor_ms:>7.1f}ms")
+    finally:
+        async with session_factory() as db:
+            await db.execute(delete(PolicyDocument).where(PolicyDocument.payer_id == payer_id))
+            await db.execute(delete(Payer).where(Payer.id == payer_id))
+            await db.commit()
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--policies", type=int, default=200000)
+    parser.add_argument("--depths", type=int, nargs="+", default=[0, 1000, 10000, 100000])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--database-url", default=settings.database_url)
+    args = parser.parse_args()
+    
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Benchmark regex pre-extraction of codes, dates, and policy numbers.
+
+Generates synthetic policies with planted codes, dates, and policy numbers,
+then reports:
+  - PreExtractor time per document (whole text and per-section attribution)
+  - precision and recall of planted CPT/HCPCS/ICD-10 codes, with phone
+    extensions, form numbers, and ZIP codes planted as five-digit decoys
+  - LLM calls and prompt tokens with the rule skip alone versus with
+    sections that have no codes or coverage keywords skipped as well
+
+Usage:
+    python scripts/benchmark_pre_extractor.py --docs 50
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+# Add backend to path so package-relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.policy_section import SectionType
+from src.services.extraction.llm_agent import PolicyExtractionAgent
+from src.services.ingestion.document_chunker import DocumentChunker
+from src.services.ingestion.pre_extractor import PreExtractor
+from src.services.ingestion.processor import EXTRACTABLE_SECTION_TYPES
+from src.services.ingestion.section_classifier import SectionClassifier
+from src.utils.token_counter import get_token_counter
+
+
+CPT = ["27447", "27130", "22612", "29881", "95810", "0232T", "3725F"]
+HCPCS = ["E0748", "J1745", "L3960", "G0283"]
+ICD10 = ["M17.11", "M17.12", "M16.0", "G47.33", "E11.9"]
+
+SECTIONS = {
+    "Coverage Criteria": [
+        "{procedure} ({code}) is considered medically necessary for {diagnosis} when conservative therapy has failed.",
+        "The procedure {code} is covered when imaging confirms {diagnosis}.",
+    ],
+    "Exclusions": [
+        "{procedure} ({code}) is considered experimental and investigational and is not covered.",
+    ],
+    "Coding Information": [
+        "CPT {code}: {procedure}. ICD-10 {diagnosis}.",
+    ],
+    "Definitions": [
+        "Conservative therapy means physical therapy, weight loss, and anti-inflammatory medication.",
+        "Member refers to a person enrolled in the health plan.",
+    ],
+    "Background": [
+        "Osteoarthritis is a degenerative joint disease affecting millions of adults each year.",
+        "Clinical studies published since 2015 describe outcomes at two and five years.",
+    ],
+    "References": [
+        "Smith J, et al. Outcomes of joint replacement. J Bone Joint Surg. 2019;101(4):300-310.",
+        "National Institute for Health and Care Excellence guidance, reviewed in 2021.",
+    ],
+    "Policy History": [
+        "Annual review with no changes to intent.",
+        "Reformatted and updated references.",
+    ],
+    "Contact Information": [
+        "Call 1-800-555-0100 ext. {decoy} with questions about this policy.",
+        "Submit form {decoy} with the request, or mail it to PO Box {decoy}, Hartford, CT {decoy}.",
+    ],
+}
+
+PROCEDURES = ["Total knee arthroplasty", "Bone growth stimulator", "Polysomnography", "Knee arthroscopy"]
+
+
+def make_policy(rng: random.Random, index: int):
+    """Build a policy text and the codes and facts planted in it."""
+    planted = set()
+    effective = date(2024, rng.randint(1, 12), 1)
+    number = f"MP-{2024 + index % 3}-{index:03d}"
+    parts = [
+        f"Medical Policy: Synthetic Policy {index}",
+        f"Policy Number: {number}",
+        f"Effective Date: {effective.strftime('%B %-d, %Y')}",
+        f"Expiration Date: {date(effective.year + 1, effective.month, 1).strftime('%m/%d/%Y')}",
+    ]
+    
+    titles = list(SECTIONS)
+    rng.shuffle(titles)
+    for section_num, title in enumerate(titles, start=1):
+        parts.append(f"\nSECTION {section_num}: {title}\n")
+        for _ in range(rng.choice([2, 5, 12])):
+            code = rng.choice(CPT + HCPCS)
+            diagnosis = rng.choice(ICD10)
+            sentence = rng.choice(SECTIONS[title])
+            if "{code}" in sentence:
+                planted.add(code)
+            if "{diagnosis}" in sentence:
+                planted.add(diagnosis)
+            parts.append(sentence.format(
+                procedure=rng.choice(PROCEDURES),
+                code=code,
+                diagnosis=diagnosis,
+                decoy=rng.randint(10000, 99999)
+            ))
+    
+    return "\n".join(parts), planted, number, effective
+
+
+def best_of(fn, repeats: int) -> float:
+    """Return the fastest wall-clock time of several runs."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--min-confidence", type=float, default=0.85)
+    parser.add_argument("--skip-types", default="DEFINITIONS,APPEALS_PROCESS")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    chunker = DocumentChunker()
+    classifier = SectionClassifier()
+    pre_extractor = PreExtractor()
+    counter = get_token_counter("gpt-4")
+    
+    corpus = [make_policy(rng, index) for index in range(args.docs)]
+    documents = [chunker.chunk_by_sections(text) for text, _, _, _ in corpus]
+    section_count = sum(len(sections) for sections in documents)
+    
+    methods = {
+        "extract (document)": lambda: [pre_extractor.extract(text) for text, _, _, _ in corpus],
+        "extract_sections": lambda: [pre_extractor.extract_sections(sections) for sections in documents],
+        "classify_sections": lambda: [classifier.classify_sections(sections) for sections in documents],
+    }
+    
+    print(f"🔎 {args.docs} documents, {section_count} sections, best of {args.repeats} runs")
+    print(f"{'method':>19} {'total':>9} {'per doc':>9}")
+    for name, fn in methods.items():
+        elapsed = best_of(fn, args.repeats)
+        print(f"{name:>19} {elapsed * 1000:>7.1f}ms {elapsed * 1000 / args.docs:>7.2f}ms")
+    
+    # Code precision/recall and document facts against what was planted
+    found_total = planted_total = correct = facts_correct = 0
+    for text, planted, number, effective in corpus:
+        facts = pre_extractor.extract(text)
+        found = set(facts.cpt_codes + facts.hcpcs_codes + facts.icd10_codes)
+        found_total += len(found)
+        planted_total += len(planted)
+        correct += len(found & planted)
+        facts_correct += facts.policy_number == number and facts.effective_date == effective
+    
+    print(f"\nCodes: precision {correct / found_total:.1%}, recall {correct / planted_total:.1%}")
+    print(f"Policy number and effective date correct: {facts_correct}/{args.docs}")
+    
+    # LLM calls and prompt tokens under each skip rule
+    skip_types = {SectionType(t.strip()) for t in args.skip_types.split(",") if t.strip()}
+    modes = {"rule skip only": [0, 0], "rule + pre-extract skip": [0, 0]}
+    for sections in documents:
+        classifications = classifier.classify_sections(sections)
+        section_facts = pre_extractor.extract_sections(sections)
+        for section, classification, facts in zip(sections, classifications, section_facts):
+            if classification.section_type in skip_types and classification.confidence >= args.min_confidence:
+                continue
+            
+            tokens = counter.count(PolicyExtractionAgent.section_context(section.title, section.text, facts))
+            modes["rule skip only"][0] += 1
+            modes["rule skip only"][1] += tokens
+            
+            if facts.has_codes or any(classification.scores.get(t) for t in EXTRACTABLE_SECTION_TYPES):
+                modes["rule + pre-extract skip"][0] += 1
+                modes["rule + pre-extract skip"][1] += tokens
+    
+    print(f"\n{'mode':>24} {'llm calls':>10} {'prompt tokens':>14}")
+    baseline_calls, baseline_tokens = modes["rule skip only"]
+    for name, (calls, tokens) in modes.items():
+        print(
+            f"{name:>24} {calls:>10} {tokens:>14} "
+            f"({calls / baseline_calls:.0%} calls, {tokens / baseline_tokens:.0%} tokens)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Compare whole-document retries with per-section retries under injected LLM failures.
+
+Runs PolicyExtractionAgent against a local function model that fails a
+share of calls with HTTP 429 (retryable) and a few with invalid output
+(not retryable). The legacy strategy re-runs every section whenever any
+section fails, with fixed exponential sleeps; the retry engine retries
+only the failed sections with decorrelated jitter. Also shows how retries
+from many workers that failed together spread out over time.
+
+Usage:
+    python scripts/benchmark_retry.py --sections 50 --rate-limited 0.1 --invalid 0.02
+"""
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add backend to path so package-relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pydantic_ai.exceptions import UnexpectedModelBehavior
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from src.services.extraction.llm_agent import PolicyExtractionAgent, SectionExtractionError
+from src.services.extraction.rate_limiter import RateLimiter
+from src.services.extraction.retry import RetryPolicy
+from src.services.ingestion.document_chunker import DocumentChunker
+
+
+SECTION_RESULT = {
+    "section_type": "COVERAGE_CRITERIA",
+    "title": "Coverage Criteria",
+    "content_summary": "Criteria for knee replacement coverage",
+    "confidence_score": 0.9
+}
+
+
+class RateLimited(Exception):
+    """Stand-in for a provider 429 response."""
+    status_code = 429
+
+
+class FlakyModel:
+    """Function model that fails a configurable share of calls."""
+    
+    def __init__(self, latency: float, rate_limited: float, invalid: float, seed: int):
+        self.latency = latency
+        self.rate_limited = rate_limited
+        self.invalid = invalid
+        self.rng = random.Random(seed)
+        self.calls = 0
+        self.model = FunctionModel(self.respond)
+    
+    async def respond(self, messages, info: AgentInfo) -> ModelResponse:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        
+        roll = self.rng.random()
+        if roll < self.invalid:
+            raise UnexpectedModelBehavior("Exceeded maximum retries for result validation")
+        if roll < self.invalid + self.rate_limited:
+            raise RateLimited("rate limit exceeded")
+        
+        return ModelResponse(parts=[ToolCallPart.from_dict(info.result_tools[0].name, SECTION_RESULT)])
+
+
+async def legacy_strategy(agent, sections, max_retries, base_delay):
+    """Re-run every section when any fails, sleeping 2**attempt * base between runs."""
+    for attempt in range(max_retries + 1):
+        try:
+            return await agent.extract_sections(sections), 0
+        except SectionExtractionError:
+            if attempt == max_retries:
+                return None, len(sections)
+            await asyncio.sleep((2 ** attempt) * base_delay)
+
+
+async def engine_strategy(agent, sections):
+    """Retry failed sections only; keep sections whose output is invalid out of the result."""
+    try:
+        return await agent.extract_sections(sections), 0
+    except SectionExtractionError as e:
+        return e.results, len(e.errors)
+
+
+async def run(args):
+    text = "\n".join(
+        f"\nSECTION {n}: Coverage Criteria\nKnee arthroplasty is covered when criteria {n} are met.\n"
+        for n in range(1, args.sections + 1)
+    )
+    sections = DocumentChunker().chunk_by_sections(text)
+    
+    print(
+        f"🔁 {len(sections)} sections, {args.rate_limited:.0%} rate limited, "
+        f"{args.invalid:.0%} invalid output, {args.trials} trials"
+    )
+    print(f"{'strategy':>16} {'model calls':>12} {'wall':>8} {'complete':>9} {'sections lost':>14}")
+    
+    for name in ("legacy", "retry engine"):
+        calls = []
+        walls = []
+        complete = 0
+        lost = 0
+        
+        for trial in range(args.trials):
+            flaky = FlakyModel(args.latency, args.rate_limited, args.invalid, seed=trial)
+            no_retries = RetryPolicy(max_retries=0)
+            agent = PolicyExtractionAgent(
+                model=flaky.model,
+                max_concurrency=args.concurrency,
+                rate_limiter=RateLimiter(),
+                retry_policy=no_retries if name == "legacy" else RetryPolicy(
+                    max_retries=args.max_retries,
+                    base_delay=args.base_delay,
+                    max_delay=args.base_delay * 20,
+                    rng=random.Random(trial)
+                )
+            )
+            
+            start = time.perf_counter()
+            if name == "legacy":
+                results, failed = await legacy_strategy(agent, sections, args.max_retries, args.base_delay)
+            else:
+                results, failed = await engine_strategy(agent, sections)
+            walls.append(time.perf_counter() - start)
+            
+            calls.append(flaky.calls)
+            complete += failed == 0
+            lost += failed
+        
+        print(
+            f"{name:>16} {sum(calls) / len(calls):>12.1f} {sum(walls) / len(walls):>7.2f}s "
+            f"{complete:>4}/{args.trials:<4} {lost / args.trials:>14.1f}"
+        )
+    
+    # When many workers hit a rate limit at the same moment, when do their retries land?
+    print(f"\nRetry times for {args.workers} workers failing together (busiest 10ms window):")
+    fixed = Counter(round(args.base_delay, 2) for _ in range(args.workers))
+    policy = RetryPolicy(base_delay=args.base_delay, max_delay=args.base_delay * 20, rng=random.Random(0))
+    jittered = Counter(round(policy.next_delay(0.0), 2) for _ in range(args.workers))
+    print(f"  fixed backoff:       {max(fixed.values())} of {args.workers}")
+    print(f"  decorrelated jitter: {max(jittered.values())} of {args.workers}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=50)
+    parser.add_argument("--rate-limited", type=float, default=0.1, help="Share of calls failing with 429")
+    parser.add_argument("--invalid", type=float, default=0.02, help="Share of calls with invalid output")
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per model call")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--max-retries", type=int, default=3)
+    parser.add_argument("--base-delay", type=float, default=0.1, help="Retry base delay in seconds")
+    parser.add_argument("--trials", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=100)
+    args = parser.parse_args()
+    
+    logging.disable(logging.WARNING)  # One retry log line per failure would drown the table
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""Benchmark full-text search latency over a large synthetic corpus.
+
+Seeds payers, policy documents, and sections (1M by default, 25 per
+document) with coverage criteria on a quarter and exclusions on a tenth of
+them, all generated server-side. Section text is random filler words with
+planted phrases at known rates, so queries range from rare to common
+terms. Then times SearchEngine.search for:
+  - rare, common, phrase, and multi-term queries
+  - a term that appears only in coverage criteria or exclusions
+  - a common term with payer, effective date, and document type filters
+  - a page reached by following next_cursor
+
+and reports p50/p95, flagging any p95 above the target. Seeded rows are deleted afterwards
+unless --keep is given. Requires a PostgreSQL database migrated to
+revision 004 (default: DATABASE_URL).
+
+Usage:
+    python scripts/benchmark_search.py --sections 1000000 --repeats 20 --target-ms 100
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from uuid import uuid4
+
+# Add backend to path so package-relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import Integer, Text, bindparam, delete, select, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.config import settings
+from src.models.coverage_criteria import CoverageCriteria
+from src.models.exclusion import Exclusion
+from src.models.payer import Payer
+from src.models.policy_document import DocumentType, PolicyDocument
+from src.models.policy_section import PolicySection
+from src.services.search.search_engine import SearchEngine, SearchFilters
+
+
+# Phrases appended to section text with these probabilities
+PLANTED = {
+    "Prior authorization is required before scheduling.": 0.10,
+    "Knee replacement is covered after failed conservative therapy.": 0.02,
+    "Total hip arthroplasty requires radiographic evidence.": 0.001,
+}
+
+PROCEDURES = ["Bone growth stimulator", "Continuous glucose monitor", "Sleep study", "Spinal fusion"]
+EXCLUDED = ["Arthroscopic lavage", "Prolotherapy injections", "Hair analysis"]
+
+SEED_SQL = """
+WITH docs AS (
+    INSERT INTO policy_documents (
+        id, payer_id, policy_name, effective_date, document_type,
+        pdf_storage_path, pdf_file_size_bytes, pdf_page_count, processing_status
+    )
+    SELECT
+        gen_random_uuid(),
+        (:payer_ids)[1 + g % cardinality(:payer_ids)],
+        'Search Benchmark Policy ' || g,
+        date '2019-01-01' + (g % 2500),
+        (ARRAY['MEDICAL', 'PHARMACY', 'DENTAL', 'VISION']::document_type[])[1 + g % 4],
+        'benchmark/search/' || g || '.pdf',
+        0,
+        1,
+        'COMPLETE'
+    FROM generate_series(:first_doc, :last_doc) AS g
+    RETURNING id
+),
+sections AS (
+    INSERT INTO policy_sections (id, policy_document_id, section_type, title, content_text, order_index)
+    SELECT
+        gen_random_uuid(),
+        docs.id,
+        (enum_range(NULL::section_type))[1 + s % 8],
+        'Section ' || (s + 1),
+        array_to_string(ARRAY(
+            SELECT (:words)[1 + floor(random() * cardinality(:words))::int]
+            FROM generate_series(1, 80 + (s * 37 + get_byte(uuid_send(docs.id), 0)) % 120)
+        ), ' '){planted},
+        s
+    FROM docs CROSS JOIN generate_series(0, :sections_per_doc - 1) AS s
+    RETURNING id
+),
+criteria AS (
+    INSERT INTO coverage_criteria (id, policy_section_id, procedure_name, covered_scenarios)
+    SELECT
+        gen_random_uuid(),
+        id,
+        (:procedures)[1 + floor(random() * cardinality(:procedures))::int],
+        'Covered when clinical documentation supports medical necessity.'
+    FROM sections
+    WHERE random() < 0.25
+    RETURNING 1
+)
+INSERT INTO exclusions (id, policy_section_id, excluded_procedure, exclusion_rationale)
+SELECT
+    gen_random_uuid(),
+    id,
+    (:excluded)[1 + floor(random() * cardinality(:excluded))::int],
+    'Considered experimental and investigational.'
+FROM sections
+WHERE random() < 0.10
+"""
+
+
+def make_vocabulary(size: int, seed: int):
+    """Pronounceable filler words that stem to distinct lexemes."""
+    rng = random.Random(seed)
+    syllables = [c + v for c in "bdfgklmnprstvz" for v in "aeiou"]
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+async def seed(session_factory, args):
+    """Insert payers, documents, sections, and entities; returns the payer IDs."""
+    payer_ids = [uuid4() for _ in range(args.payers)]
+    documents = -(-args.sections // args.sections_per_doc)
+    planted = "".join(
+        f" || CASE WHEN random() < {rate} THEN ' {phrase}' ELSE '' END" for phrase, rate in PLANTED.items()
+    )
+    statement = text(SEED_SQL.format(planted=planted)).bindparams(
+        bindparam("payer_ids", type_=ARRAY(UUID(as_uuid=True))),
+        bindparam("first_doc", type_=Integer),
+        bindparam("last_doc", type_=Integer),
+        bindparam("sections_per_doc", type_=Integer),
+        bindparam("words", type_=ARRAY(Text)),
+        bindparam("procedures", type_=ARRAY(Text)),
+        bindparam("excluded", type_=ARRAY(Text)),
+    )
+    words = make_vocabulary(args.vocabulary, args.seed)
+    
+    async with session_factory() as db:
+        for n, payer_id in enumerate(payer_ids):
+            db.add(Payer(id=payer_id, name=f"Search Benchmark {payer_id} {n}"))
+        await db.commit()
+        
+        start = time.perf_counter()
+        for first_doc in range(0, documents, args.batch_documents):
+            last_doc = min(first_doc + args.batch_documents, documents) - 1
+            await db.execute(statement, {
+                "payer_ids": payer_ids,
+                "first_doc": first_doc,
+                "last_doc": last_doc,
+                "sections_per_doc": args.sections_per_doc,
+                "words": words,
+                "procedures": PROCEDURES,
+                "excluded": EXCLUDED,
+            })
+            await db.commit()
+            print(
+                f"   {(last_doc + 1) * args.sections_per_doc:>9} sections "
+                f"({time.perf_counter() - start:.0f}s)"
+            )
+        
+        for table in ("payers", "policy_documents", "policy_sections", "coverage_criteria", "exclusions"):
+            await db.execute(text(f"ANALYZE {table}"))
+        await db.commit()
+    
+    return payer_ids
+
+
+async def cleanup(session_factory, payer_ids):
+    """Delete everything seeded under the benchmark payers."""
+    documents = select(PolicyDocument.id).where(PolicyDocument.payer_id.in_(payer_ids))
+    sections = select(PolicySection.id).where(PolicySection.policy_document_id.in_(documents))
+    
+    async with session_factory() as db:
+        await db.execute(delete(Exclusion).where(Exclusion.policy_section_id.in_(sections)))
+        await db.execute(delete(CoverageCriteria).where(CoverageCriteria.policy_section_id.in_(sections)))
+        await db.execute(delete(PolicySection).where(PolicySection.policy_document_id.in_(documents)))
+        await db.execute(delete(PolicyDocument).where(PolicyDocument.payer_id.in_(payer_ids)))
+        await db.execute(delete(Payer).where(Payer.id.in_(payer_ids)))
+        await db.commit()
+
+
+async def timed(fn, repeats: int):
+    """Latencies of several awaited runs in milliseconds, and the last result."""
+    timings = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings, result
+
+
+async def run(args):
+    engine = create_async_engine(args.database_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    search_engine = SearchEngine()
+    
+    print(f"🔍 seeding {args.sections} sections ({args.sections_per_doc} per policy, {args.payers} payers)...")
+    payer_ids = await seed(session_factory, args)
+    
+    filtered = SearchFilters(
+        payer_ids=payer_ids[:2],
+        effective_date_from=date(2021, 1, 1),
+        effective_date_to=date(2023, 12, 31),
+        document_types=[DocumentType.MEDICAL]
+    )
+    cases = {
+        "rare term": ("arthroplasty", None),
+        "common term": ("authorization", None),
+        "phrase": ('"prior authorization"', None),
+        "two terms": ("knee replacement", None),
+        "entity-only term": ("lavage", None),
+        "common + filters": ("authorization", filtered),
+    }
+    
+    try:
+        async with session_factory() as db:
+            # Follow cursors as a client would, to time the page after
+            page = await search_engine.search(db, "authorization", limit=args.limit)
+            for _ in range(args.pages - 1):
+                if page.next_cursor:
+                    page = await search_engine.search(db, "authorization", limit=args.limit, cursor=page.next_cursor)
+            deep_cursor = page.next_cursor
+            
+            print(f"\n{'query':>18} {'p50':>9} {'p95':>9} {'hits':>5}")
+            over = []
+            for name, query, filters, cursor in [
+                *((name, query, filters, None) for name, (query, filters) in cases.items()),
+                (f"page {args.pages + 1} (cursor)", "authorization", None, deep_cursor),
+            ]:
+                timings, page = await timed(
+                    lambda: search_engine.search(db, query, filters, limit=args.limit, cursor=cursor),
+                    args.repeats
+                )
+                timings.sort()
+                p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+                print(f"{name:>18} {statistics.median(timings):>7.1f}ms {p95:>7.1f}ms {len(page.hits):>5}")
+                if p95 > args.target_ms:
+                    over.append(name)
+            
+            if over:
+                print(f"\n❌ p95 above {args.target_ms:.0f}ms: {', '.join(over)}")
+            else:
+                print(f"\n✅ every query's p95 is under {args.target_ms:.0f}ms")
+    finally:
+        if not args.keep:
+            await cleanup(session_factory, payer_ids)
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=1000000)
+    parser.add_argument("--sections-per-doc", type=int, default=25)
+    parser.add_argument("--payers", type=int, default=10)
+    parser.add_argument("--vocabulary", type=int, default=5000, help="Distinct filler words")
+    parser.add_argument("--batch-documents", type=int, default=2000, help="Policies seeded per statement")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=5, help="Pages followed before timing the cursor page")
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--target-ms", type=float, default=100.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help="Leave the seeded rows in place")
+    parser.add_argument("--database-url", default=settings.database_url)
+    args = parser.parse_args()
+    
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""Benchmark the keyword-automaton section classifier.
+
+Generates synthetic policies, then times:
+  - the original first-match keyword chain (type only, no confidence)
+  - scoring every type with one substring count per keyword
+  - SectionClassifier.classify per section
+  - SectionClassifier.classify_sections over the whole document
+
+and reports how many sections would skip the LLM at the given threshold.
+
+Usage:
+    python scripts/benchmark_section_classifier.py --docs 20 --min-confidence 0.85
+"""
+import argparse
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+# Add backend to path so package-relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.models.policy_section import SectionType
+from src.services.ingestion.document_chunker import DocumentChunker
+from src.services.ingestion.section_classifier import SECTION_KEYWORDS, SectionClassifier
+
+
+SECTIONS = {
+    "Coverage Criteria": [
+        "Total knee arthroplasty (CPT 27447) is considered medically necessary when all criteria are met.",
+        "The procedure is covered when the member has failed three months of conservative therapy.",
+        "Coverage requires radiographic evidence of advanced joint disease.",
+    ],
+    "Exclusions": [
+        "Arthroscopic lavage (CPT 29870) is not covered for osteoarthritis of the knee.",
+        "Procedures considered experimental or investigational are excluded.",
+        "Cosmetic procedures are not medically necessary and are not covered.",
+    ],
+    "Definitions": [
+        "Conservative therapy means physical therapy, weight loss, and anti-inflammatory medication.",
+        "Advanced joint disease is defined as joint space narrowing on weight-bearing radiographs.",
+        "Member refers to a person enrolled in the health plan.",
+    ],
+    "Appeals Process": [
+        "A member may file an appeal within 180 days of an adverse determination.",
+        "Requests for reconsideration must be submitted in writing.",
+        "If the appeal is denied, the member may request an external review.",
+    ],
+    "Prior Authorization": [
+        "Prior authorization is required before any elective inpatient admission.",
+        "Requests for prior approval must include clinical notes and imaging.",
+    ],
+    "Limitations": [
+        "Frequency is limited to one procedure per joint per lifetime.",
+        "Physical therapy is limited to a maximum of 30 visits per year.",
+    ],
+}
+
+
+def legacy_identify_section_type(section_title: str, section_text: str) -> str:
+    """The original first-match keyword chain from DocumentChunker."""
+    title_lower = section_title.lower()
+    text_lower = section_text.lower()
+    
+    if any(keyword in title_lower for keyword in ['coverage', 'covered', 'benefits']):
+        return 'COVERAGE_CRITERIA'
+    elif any(keyword in title_lower for keyword in ['exclusion', 'not covered', 'excluded']):
+        return 'EXCLUSIONS'
+    elif any(keyword in title_lower for keyword in ['requirement', 'documentation', 'medical necessity']):
+        return 'REQUIREMENTS'
+    elif any(keyword in title_lower for keyword in ['definition', 'terms', 'glossary']):
+        return 'DEFINITIONS'
+    elif any(keyword in title_lower for keyword in ['prior authorization', 'pre-authorization', 'preauth']):
+        return 'PRIOR_AUTHORIZATION'
+    elif any(keyword in title_lower for keyword in ['limitation', 'limit', 'frequency']):
+        return 'LIMITATIONS'
+    elif any(keyword in title_lower for keyword in ['appeal', 'grievance', 'dispute']):
+        return 'APPEALS_PROCESS'
+    
+    if 'not covered' in text_lower or 'excluded' in text_lower:
+        return 'EXCLUSIONS'
+    elif 'covered when' in text_lower or 'coverage criteria' in text_lower:
+        return 'COVERAGE_CRITERIA'
+    
+    return 'OTHER'
+
+
+def substring_scores(section_title: str, section_text: str) -> SectionType:
+    """Score every type with one str.count pass per keyword."""
+    title_lower = section_title.lower()
+    text_lower = section_text.lower()
+    
+    scores = {}
+    for section_type, stems in SECTION_KEYWORDS.items():
+        scores[section_type] = sum(
+            weight * (3 * title_lower.count(stem) + text_lower.count(stem))
+            for stem, weight in stems.items()
+        )
+    
+    return max(scores, key=scores.get)
+
+
+def make_policy(rng: random.Random) -> str:
+    """Build a policy with every section type, some sections long."""
+    parts = ["Medical Policy: Knee Arthroplasty"]
+    
+    titles = list(SECTIONS)
+    rng.shuffle(titles)
+    for section_num, title in enumerate(titles, start=1):
+        parts.append(f"\nSECTION {section_num}: {title}\n")
+        for _ in range(rng.choice([2, 6, 20])):
+            parts.append(" ".join(rng.choice(SECTIONS[title]) for _ in range(rng.randint(2, 5))))
+            parts.append("")
+    
+    return "\n".join(parts)
+
+
+def best_of(fn, repeats: int) -> float:
+    """Return the fastest wall-clock time of several runs."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--min-confidence", type=float, default=0.85)
+    parser.add_argument("--skip-types", default="DEFINITIONS,APPEALS_PROCESS")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    chunker = DocumentChunker()
+    classifier = SectionClassifier()
+    documents = [chunker.chunk_by_sections(make_policy(rng)) for _ in range(args.docs)]
+    section_count = sum(len(sections) for sections in documents)
+    
+    methods = {
+        "legacy chain": lambda: [
+            legacy_identify_section_type(s.title, s.text) for sections in documents for s in sections
+        ],
+        "substring scores": lambda: [
+            substring_scores(s.title, s.text) for sections in documents for s in sections
+        ],
+        "classify": lambda: [
+            classifier.classify(s.title, s.text) for sections in documents for s in sections
+        ],
+        "classify_sections": lambda: [
+            classifier.classify_sections(sections) for sections in documents
+        ],
+    }
+    
+    print(f"🏷️  {args.docs} documents, {section_count} sections, best of {args.repeats} runs")
+    print(f"{'method':>18} {'total':>9} {'per doc':>9} {'sections/s':>11}")
+    
+    for name, fn in methods.items():
+        elapsed = best_of(fn, args.repeats)
+        print(
+            f"{name:>18} {elapsed * 1000:>7.1f}ms {elapsed * 1000 / args.docs:>7.2f}ms "
+            f"{section_count / elapsed:>11.0f}"
+        )
+    
+    skip_types = {SectionType(t.strip()) for t in args.skip_types.split(",") if t.strip()}
+    results = [
+        (section, result)
+        for sections in documents
+        for section, result in zip(sections, classifier.classify_sections(sections))
+    ]
+    skipped = Counter(
+        result.section_type.value for _, result in results
+        if result.section_type in skip_types and result.confidence >= args.min_confidence
+    )
+    agreement = sum(
+        1 for section, result in results
+        if legacy_identify_section_type(section.title, section.text) == result.section_type.value
+    )
+    
+    print(f"\nAgreement with legacy chain: {agreement / len(results):.0%}")
+    print(
+        f"LLM calls skipped at confidence >= {args.min_confidence}: "
+        f"{sum(skipped.values())}/{len(results)} ({sum(skipped.values()) / len(results):.0%}) {dict(skipped)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Benchmark whole-document versus concurrent section-level LLM extraction.
+
+Runs PolicyExtractionAgent against a local function model that sleeps in
+proportion to prompt and response size (a stand-in for provider latency), so
+no API calls are made. Compares one whole-document prompt, sections one at a
+time, and sections fanned out at several concurrency limits, optionally
+under a requests-per-minute limit.
+
+Usage:
+    python scripts/benchmark_section_extraction.py --sections 50 --concurrency 4 8 16
+"""
+import argparse
+import asyncio
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+# Add backend to path so package-relative imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pydantic_ai.messages import ModelResponse, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from src.services.extraction.llm_agent import PolicyExtractionAgent
+from src.services.extraction.rate_limiter import RateLimiter
+from src.services.ingestion.document_chunker import DocumentChunker
+from src.utils.token_counter import get_token_counter
+
+
+SECTION_TEXT = (
+    "Total knee arthroplasty (CPT 27447) is considered medically necessary when the member has "
+    "radiographic evidence of advanced joint disease and has failed three months of conservative therapy. "
+) * 12
+
+SECTION_RESULT = {
+    "section_type": "COVERAGE_CRITERIA",
+    "title": "Coverage Criteria",
+    "content_summary": "Criteria for knee replacement coverage",
+    "coverage_criteria": [{
+        "procedure_name": "Total Knee Arthroplasty",
+        "procedure_code": "27447",
+        "covered_scenarios": "Advanced joint disease after failed conservative therapy",
+        "confidence_score": 0.9
+    }],
+    "exclusions": [],
+    "confidence_score": 0.9
+}
+
+
+def make_model(counter, seconds_per_1k_prompt: float, seconds_per_1k_response: float, sections: int):
+    """Function model whose latency grows with prompt and response tokens."""
+    async def respond(messages, info: AgentInfo) -> ModelResponse:
+        prompt = "".join(
+            getattr(part, "content", "") for message in messages for part in message.parts
+        )
+        is_policy = "sections" in info.result_tools[0].parameters_json_schema["properties"]
+        result = {
+            "policy_name": "Knee Arthroplasty",
+            "payer_name": "Synthetic",
+            "effective_date": "2024-01-01",
+            "document_type": "MEDICAL",
+            "sections": [SECTION_RESULT] * sections,
+            "overall_confidence_score": 0.9
+        } if is_policy else SECTION_RESULT
+        
+        response_tokens = counter.count(str(result))
+        await asyncio.sleep(
+            counter.count(prompt) / 1000 * seconds_per_1k_prompt
+            + response_tokens / 1000 * seconds_per_1k_response
+        )
+        return ModelResponse(parts=[ToolCallPart.from_dict(info.result_tools[0].name, result)])
+    
+    return FunctionModel(respond)
+
+
+async def run(args):
+    counter = get_token_counter("gpt-4")
+    model = make_model(counter, args.prompt_latency, args.response_latency, args.sections)
+    text = "\n".join(
+        f"\nSECTION {n}: Coverage Criteria\n{SECTION_TEXT}" for n in range(1, args.sections + 1)
+    )
+    sections = DocumentChunker().chunk_by_sections(text)
+    
+    def agent(concurrency, rpm=None):
+        return PolicyExtractionAgent(
+            model=model,
+            max_concurrency=concurrency,
+            rate_limiter=RateLimiter(requests_per_minute=rpm),
+            token_counter=counter
+        )
+    
+    runs = {"whole document": lambda: agent(1).extract_policy(text, "Synthetic")}
+    for concurrency in [1] + args.concurrency:
+        runs[f"sections x{concurrency}"] = (
+            lambda c=concurrency: agent(c).extract_policy_by_sections(
+                sections, "Synthetic", "Knee Arthroplasty", date(2024, 1, 1)
+            )
+        )
+    if args.rpm:
+        concurrency = max(args.concurrency)
+        runs[f"x{concurrency} @ {args.rpm} rpm"] = (
+            lambda: agent(concurrency, args.rpm).extract_policy_by_sections(
+                sections, "Synthetic", "Knee Arthroplasty", date(2024, 1, 1)
+            )
+        )
+    
+    print(f"🚀 {len(sections)} sections, {counter.count(text)} document tokens")
+    print(f"{'mode':>22} {'wall':>8} {'speedup':>8}")
+    
+    baseline = None
+    for name, make_call in runs.items():
+        start = time.perf_counter()
+        extraction = await make_call()
+        elapsed = time.perf_counter() - start
+        
+        assert len(extraction.sections) == args.sections
+        baseline = baseline or elapsed
+        print(f"{name:>22} {elapsed:>7.2f}s {baseline / elapsed:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[4, 8, 16])
+    parser.add_argument("--prompt-latency", type=float, default=0.02, help="Seconds per 1k prompt tokens")
+    parser.add_argument("--response-latency", type=float, default=0.8, help="Seconds per 1k response tokens")
+    parser.add_argument("--rpm", type=int, default=240, help="Requests per minute for the limited run (0: skip)")
+    args = parser.parse_args()
+    
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,16 +2,18 @@
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException, Form
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from uuid import UUID, uuid4
+from sqlalchemy.exc import IntegrityError
+from uuid import UUID
 from datetime import datetime
 
 from ...database import get_db
 from ...models.policy_document import PolicyDocument, ProcessingStatus, DocumentType
 from ...models.processing_job import ProcessingJob, JobType, JobStatus
 from ...models.payer import Payer
-from ...services.ingestion.uploader import PDFUploader
+from ...services.ingestion.uploader import PDFUploader, PDFValidationError
 # from ...services.ingestion.pdf_extractor import PDFExtractor  # Temporarily disabled - pymupdf not installed
 from ...utils.azure_storage import storage_service
+from ...config import settings
 
 router = APIRouter()
 
@@ -45,24 +47,41 @@ async def upload_policy(
     if not payer:
         raise HTTPException(status_code=404, detail="Payer not found")
     
-    # Validate PDF
-    validation = pdf_uploader.validate_pdf(file.file)
-    if not validation["is_valid"]:
+    # Validate and hash PDF in bounded-memory chunks
+    file.file.seek(0)
+    try:
+        digest = await pdf_uploader.hash_pdf_stream_async(
+            file.file,
+            chunk_size=settings.upload_chunk_size_bytes,
+            max_size_mb=settings.max_upload_size_mb
+        )
+    except PDFValidationError as e:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid PDF: {', '.join(validation['errors'])}"
+            detail=f"Invalid PDF: {', '.join(e.errors)}"
         )
     
-    # Reset file pointer
-    file.file.seek(0)
+    # Identical content already ingested for this payer: skip storage and reprocessing
+    duplicate = await _find_duplicate(db, payer_uuid, digest["file_hash"])
+    if duplicate:
+        return await _handle_duplicate(db, *duplicate)
     
     # Upload PDF
+    file.file.seek(0)
     try:
-        upload_result = pdf_uploader.upload_pdf(
+        upload_result = await pdf_uploader.upload_pdf_stream_async(
             file.file,
             file.filename,
             str(payer_id),
-            user_id=None  # TODO: Get from auth
+            user_id=None,  # TODO: Get from auth
+            chunk_size=settings.upload_chunk_size_bytes,
+            max_size_mb=settings.max_upload_size_mb,
+            file_hash=digest["file_hash"]
+        )
+    except PDFValidationError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid PDF: {', '.join(e.errors)}"
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
@@ -93,13 +112,23 @@ async def upload_policy(
         pdf_storage_path=upload_result["storage_path"],
         pdf_file_size_bytes=upload_result["file_size_bytes"],
         pdf_page_count=pdf_info["page_count"],
+        pdf_content_hash=upload_result["file_hash"],
         processing_status=ProcessingStatus.QUEUED,
         requires_manual_review=False,
         created_by_user_id=None  # TODO: Get from auth
     )
     
     db.add(policy_doc)
-    await db.flush()  # Get the ID
+    try:
+        await db.flush()  # Get the ID
+    except IntegrityError:
+        # A concurrent upload of the same content won the unique index
+        await db.rollback()
+        await storage_service.delete_async(upload_result["storage_path"])
+        duplicate = await _find_duplicate(db, payer_uuid, upload_result["file_hash"])
+        if not duplicate:
+            raise
+        return await _handle_duplicate(db, *duplicate)
     
     # Create processing job
     job = ProcessingJob(
@@ -116,7 +145,88 @@ async def upload_policy(
         "policy_document_id": str(policy_doc.id),
         "processing_job_id": str(job.id),
         "status": "QUEUED",
-        "message": "Document uploaded successfully and queued for processing"
+        "message": "Document uploaded successfully and queued for processing",
+        "is_duplicate": False
+    }
+
+
+async def _find_duplicate(
+    db: AsyncSession,
+    payer_id: UUID,
+    file_hash: str
+) -> tuple[PolicyDocument, ProcessingJob | None] | None:
+    """Look up an existing document and its latest job by content hash."""
+    result = await db.execute(
+        select(PolicyDocument).where(
+            PolicyDocument.payer_id == payer_id,
+            PolicyDocument.pdf_content_hash == file_hash,
+            PolicyDocument.is_deleted == False
+        )
+    )
+    policy_doc = result.scalar_one_or_none()
+    
+    if not policy_doc:
+        return None
+    
+    job_result = await db.execute(
+        select(ProcessingJob)
+        .where(ProcessingJob.policy_document_id == policy_doc.id)
+        .order_by(ProcessingJob.created_at.desc())
+        .limit(1)
+    )
+    return policy_doc, job_result.scalar_one_or_none()
+
+
+async def _handle_duplicate(
+    db: AsyncSession,
+    policy_doc: PolicyDocument,
+    job: ProcessingJob | None
+) -> dict:
+    """Return the existing document, re-queuing it first if its processing failed."""
+    if policy_doc.processing_status != ProcessingStatus.FAILED:
+        return _duplicate_response(policy_doc, job)
+    
+    # Lock and re-check so concurrent re-uploads queue only one job
+    result = await db.execute(
+        select(PolicyDocument)
+        .where(PolicyDocument.id == policy_doc.id)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    policy_doc = result.scalar_one()
+    if policy_doc.processing_status != ProcessingStatus.FAILED:
+        return _duplicate_response(*await _find_duplicate(db, policy_doc.payer_id, policy_doc.pdf_content_hash))
+    
+    # The stored PDF is reused; a fresh job gets a full retry budget
+    policy_doc.processing_status = ProcessingStatus.QUEUED
+    policy_doc.processing_started_at = None
+    policy_doc.processing_completed_at = None
+    job = ProcessingJob(
+        job_type=JobType.INGESTION,
+        status=JobStatus.PENDING,
+        policy_document_id=policy_doc.id,
+        created_by_user_id=None  # TODO: Get from auth
+    )
+    db.add(job)
+    await db.commit()
+    
+    return {
+        "policy_document_id": str(policy_doc.id),
+        "processing_job_id": str(job.id),
+        "status": "QUEUED",
+        "message": "Identical document previously failed processing; queued for reprocessing",
+        "is_duplicate": True
+    }
+
+
+def _duplicate_response(policy_doc: PolicyDocument, job: ProcessingJob | None) -> dict:
+    """Build the upload response for content that was already ingested."""
+    return {
+        "policy_document_id": str(policy_doc.id),
+        "processing_job_id": str(job.id) if job else None,
+        "status": policy_doc.processing_status,
+        "message": "Identical document already uploaded; returning existing document",
+        "is_duplicate": True
     }
 
 
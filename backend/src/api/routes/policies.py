@@ -1,57 +1,116 @@
 """Policies API routes for retrieving policy documents."""
-from fastapi import APIRouter, Depends, HTTPException, Query
+import json
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import Text, case, cast, func, literal_column, select, text, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from uuid import UUID
-from typing import Optional
+from typing import List, Literal, Optional
 
 from ...database import get_db
+from ...models.coverage_criteria import CoverageCriteria
+from ...models.exclusion import Exclusion
 from ...models.policy_document import PolicyDocument
 from ...models.policy_section import PolicySection
 from ...models.payer import Payer
+from ...utils.pagination import InvalidCursorError, decode_cursor, encode_cursor
 
 router = APIRouter()
 
+# Section text is previewed in policy details; the full text is in section details
+SECTION_PREVIEW_CHARS = 500
+
+# Columns returned by list_policies (no ORM hydration)
+LIST_COLUMNS = (
+    PolicyDocument.id,
+    PolicyDocument.payer_id,
+    PolicyDocument.policy_name,
+    PolicyDocument.policy_number,
+    PolicyDocument.effective_date,
+    PolicyDocument.expiration_date,
+    PolicyDocument.version,
+    PolicyDocument.document_type,
+    PolicyDocument.processing_status,
+    PolicyDocument.extraction_confidence_score,
+    PolicyDocument.requires_manual_review,
+    PolicyDocument.created_at,
+)
+
 
 @router.get("")
 async def list_policies(
     payer_id: Optional[str] = Query(None),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
+    count: Literal["exact", "estimated", "none"] = Query("exact"),
     db: AsyncSession = Depends(get_db)
 ):
     """
-    List policy documents.
+    List policy documents, newest first.
+    
+    Pages are keyset-paginated on (created_at, id): pass the previous
+    response's next_cursor to continue, which costs the same at any depth.
+    Offset is still accepted for existing clients but scans every skipped
+    row.
     
     Args:
         payer_id: Filter by payer UUID (optional)
         limit: Maximum number of results
-        offset: Offset for pagination
+        offset: Offset for pagination (ignored when a cursor is given)
+        cursor: next_cursor from the previous page
+        count: 'exact' (count(*)), 'estimated' (planner row estimate, no
+            scan), or 'none' (total is null)
         db: Database session
-        
+    
     Returns:
-        List of policy documents
+        List of policy documents, total, and the cursor for the next page
     """
-    query = select(PolicyDocument).where(PolicyDocument.is_deleted == False)
+    filters = [PolicyDocument.is_deleted == False]
+    payer_uuid = UUID(payer_id) if payer_id else None
+    if payer_uuid:
+        filters.append(PolicyDocument.payer_id == payer_uuid)
     
-    if payer_id:
-        query = query.where(PolicyDocument.payer_id == UUID(payer_id))
+    query = (
+        select(*LIST_COLUMNS)
+        .where(*filters)
+        .order_by(PolicyDocument.created_at.desc(), PolicyDocument.id.desc())
+        .limit(limit)
+    )
     
-    query = query.limit(limit).offset(offset)
+    if cursor:
+        try:
+            cursor_created_at, cursor_id = decode_cursor(cursor, datetime, UUID)
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        query = query.where(
+            tuple_(PolicyDocument.created_at, PolicyDocument.id) < tuple_(cursor_created_at, cursor_id)
+        )
+    elif offset:
+        query = query.offset(offset)
     
     result = await db.execute(query)
-    policies = result.scalars().all()
+    policies = result.all()
     
-    # Get total count
-    count_query = select(PolicyDocument).where(PolicyDocument.is_deleted == False)
-    if payer_id:
-        count_query = count_query.where(PolicyDocument.payer_id == UUID(payer_id))
+    if count == "exact":
+        count_result = await db.execute(
+            select(func.count()).select_from(PolicyDocument).where(*filters)
+        )
+        total = count_result.scalar_one()
+    elif count == "estimated":
+        total = await _estimate_policy_count(db, payer_uuid)
+    else:
+        total = None
     
-    count_result = await db.execute(count_query)
-    total = len(count_result.scalars().all())
+    next_cursor = None
+    if len(policies) == limit:
+        next_cursor = encode_cursor(policies[-1].created_at, policies[-1].id)
     
     return {
         "total": total,
+        "total_is_estimate": count == "estimated",
+        "next_cursor": next_cursor,
         "policies": [
             {
                 "id": str(p.id),
@@ -72,6 +131,20 @@ async def list_policies(
     }
 
 
+async def _estimate_policy_count(db: AsyncSession, payer_uuid: UUID | None) -> int:
+    """Row count the planner expects for the listing filters, from table statistics."""
+    sql = "EXPLAIN (FORMAT JSON) SELECT 1 FROM policy_documents WHERE is_deleted = false"
+    if payer_uuid:
+        # Inlined: EXPLAIN takes no bind parameters; a parsed UUID is safe to quote
+        sql += f" AND payer_id = '{payer_uuid}'::uuid"
+    
+    result = await db.execute(text(sql))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
 @router.get("/{policy_id}")
 async def get_policy(
     policy_id: str,
@@ -80,69 +153,143 @@ async def get_policy(
     """
     Get policy document details with sections.
     
+    The response document is built by PostgreSQL in one query: the policy
+    row joined to its payer, with sections aggregated in order and their
+    text previews cut server-side, so full section text never crosses the
+    wire and no ORM objects are created. The JSON is passed through as is.
+    
     Args:
         policy_id: Policy document UUID
         db: Database session
-        
+    
     Returns:
         Policy document with sections
     """
     policy_uuid = UUID(policy_id)
     
-    # Get policy
     result = await db.execute(
-        select(PolicyDocument).where(
+        select(cast(_policy_document_json(), Text))
+        .select_from(PolicyDocument)
+        .outerjoin(Payer, Payer.id == PolicyDocument.payer_id)
+        .where(
             PolicyDocument.id == policy_uuid,
             PolicyDocument.is_deleted == False
         )
     )
-    policy = result.scalar_one_or_none()
+    document = result.scalar_one_or_none()
     
-    if not policy:
+    if document is None:
         raise HTTPException(status_code=404, detail="Policy not found")
     
-    # Get sections
-    sections_result = await db.execute(
-        select(PolicySection)
-        .where(PolicySection.policy_document_id == policy_uuid)
-        .order_by(PolicySection.order_index)
+    return Response(content=document, media_type="application/json")
+
+
+def _policy_document_json():
+    """SQL expression building get_policy's response as one JSON object."""
+    content_preview = case(
+        (
+            func.length(PolicySection.content_text) > SECTION_PREVIEW_CHARS,
+            func.concat(func.left(PolicySection.content_text, SECTION_PREVIEW_CHARS), "...")
+        ),
+        else_=PolicySection.content_text
     )
-    sections = sections_result.scalars().all()
     
-    # Get payer info
-    payer_result = await db.execute(select(Payer).where(Payer.id == policy.payer_id))
-    payer = payer_result.scalar_one_or_none()
+    sections = (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_object(
+                            "id", PolicySection.id,
+                            "section_type", PolicySection.section_type,
+                            "section_number", PolicySection.section_number,
+                            "title", PolicySection.title,
+                            "content_text", content_preview,
+                            "extraction_confidence_score", PolicySection.extraction_confidence_score,
+                            "order_index", PolicySection.order_index
+                        ),
+                        PolicySection.order_index
+                    )
+                ),
+                literal_column("'[]'::json")
+            )
+        )
+        .where(PolicySection.policy_document_id == PolicyDocument.id)
+        .scalar_subquery()
+    )
     
-    return {
-        "policy": {
-            "id": str(policy.id),
-            "payer_id": str(policy.payer_id),
-            "payer_name": payer.name if payer else None,
-            "policy_name": policy.policy_name,
-            "policy_number": policy.policy_number,
-            "effective_date": policy.effective_date.isoformat(),
-            "expiration_date": policy.expiration_date.isoformat() if policy.expiration_date else None,
-            "version": policy.version,
-            "document_type": policy.document_type,
-            "processing_status": policy.processing_status,
-            "extraction_confidence_score": policy.extraction_confidence_score,
-            "requires_manual_review": policy.requires_manual_review,
-            "pdf_page_count": policy.pdf_page_count,
-            "created_at": policy.created_at.isoformat()
-        },
-        "sections": [
-            {
-                "id": str(s.id),
-                "section_type": s.section_type,
-                "section_number": s.section_number,
-                "title": s.title,
-                "content_text": s.content_text[:500] + "..." if len(s.content_text) > 500 else s.content_text,
-                "extraction_confidence_score": s.extraction_confidence_score,
-                "order_index": s.order_index
-            }
-            for s in sections
-        ]
-    }
+    return func.json_build_object(
+        "policy", func.json_build_object(
+            "id", PolicyDocument.id,
+            "payer_id", PolicyDocument.payer_id,
+            "payer_name", Payer.name,
+            "policy_name", PolicyDocument.policy_name,
+            "policy_number", PolicyDocument.policy_number,
+            "effective_date", PolicyDocument.effective_date,
+            "expiration_date", PolicyDocument.expiration_date,
+            "version", PolicyDocument.version,
+            "document_type", PolicyDocument.document_type,
+            "processing_status", PolicyDocument.processing_status,
+            "extraction_confidence_score", PolicyDocument.extraction_confidence_score,
+            "requires_manual_review", PolicyDocument.requires_manual_review,
+            "pdf_page_count", PolicyDocument.pdf_page_count,
+            "created_at", PolicyDocument.created_at
+        ),
+        "sections", sections
+    )
+
+
+@router.get("/{policy_id}/sections")
+async def get_policy_sections(
+    policy_id: str,
+    section_ids: Optional[List[str]] = Query(None, description="Section UUIDs (default: all sections)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get many policy sections with their extracted entities in one call.
+    
+    Sections and their coverage criteria and exclusions are aggregated into
+    one JSON document by PostgreSQL, so a policy view needs one request and
+    one query instead of one per section.
+    
+    Args:
+        policy_id: Policy document UUID
+        section_ids: Sections to return; all sections of the policy if omitted
+        db: Database session
+    
+    Returns:
+        Section details with coverage criteria and exclusions, in document order
+    """
+    policy_uuid = UUID(policy_id)
+    
+    section_filters = [PolicySection.policy_document_id == PolicyDocument.id]
+    if section_ids:
+        section_filters.append(PolicySection.id.in_([UUID(section_id) for section_id in section_ids]))
+    
+    sections = (
+        select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(_section_detail_json(), PolicySection.order_index)),
+                literal_column("'[]'::json")
+            )
+        )
+        .where(*section_filters)
+        .scalar_subquery()
+    )
+    
+    result = await db.execute(
+        select(cast(func.json_build_object("policy_id", PolicyDocument.id, "sections", sections), Text))
+        .where(
+            PolicyDocument.id == policy_uuid,
+            PolicyDocument.is_deleted == False
+        )
+    )
+    document = result.scalar_one_or_none()
+    
+    if document is None:
+        raise HTTPException(status_code=404, detail="Policy not found")
+    
+    return Response(content=document, media_type="application/json")
 
 
 @router.get("/{policy_id}/sections/{section_id}")
@@ -154,39 +301,102 @@ async def get_policy_section(
     """
     Get detailed policy section with extracted entities.
     
+    Both IDs and the policy's soft delete are checked in SQL, and the
+    entities are aggregated into the response JSON in the same query.
+    
     Args:
         policy_id: Policy document UUID
         section_id: Policy section UUID
         db: Database session
-        
+    
     Returns:
         Section details with coverage criteria and exclusions
     """
+    policy_uuid = UUID(policy_id)
     section_uuid = UUID(section_id)
     
     result = await db.execute(
-        select(PolicySection).where(PolicySection.id == section_uuid)
+        select(cast(_section_detail_json(), Text))
+        .select_from(PolicySection)
+        .join(PolicyDocument, PolicyDocument.id == PolicySection.policy_document_id)
+        .where(
+            PolicySection.id == section_uuid,
+            PolicySection.policy_document_id == policy_uuid,
+            PolicyDocument.is_deleted == False
+        )
     )
-    section = result.scalar_one_or_none()
+    document = result.scalar_one_or_none()
     
-    if not section:
-        raise HTTPException(status_code=404, detail="Section not found")
-    
-    if str(section.policy_document_id) != policy_id:
+    if document is None:
         raise HTTPException(status_code=404, detail="Section not found in this policy")
     
-    return {
-        "section": {
-            "id": str(section.id),
-            "section_type": section.section_type,
-            "section_number": section.section_number,
-            "title": section.title,
-            "content_text": section.content_text,
-            "content_structured": section.content_structured,
-            "extraction_confidence_score": section.extraction_confidence_score,
-            "page_numbers": section.page_numbers,
-            "order_index": section.order_index
-        },
-        "coverage_criteria": [],  # TODO: Query from coverage_criteria table
-        "exclusions": []  # TODO: Query from exclusions table
-    }
+    return Response(content=document, media_type="application/json")
+
+
+def _section_detail_json():
+    """SQL expression building one section's details with its criteria and exclusions."""
+    coverage_criteria = (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_object(
+                            "id", CoverageCriteria.id,
+                            "procedure_name", CoverageCriteria.procedure_name,
+                            "procedure_code", CoverageCriteria.procedure_code,
+                            "covered_scenarios", CoverageCriteria.covered_scenarios,
+                            "required_documentation", CoverageCriteria.required_documentation,
+                            "prior_authorization_required", CoverageCriteria.prior_authorization_required,
+                            "age_restrictions", CoverageCriteria.age_restrictions,
+                            "frequency_limitations", CoverageCriteria.frequency_limitations,
+                            "extraction_confidence_score", CoverageCriteria.extraction_confidence_score
+                        ),
+                        CoverageCriteria.procedure_name,
+                        CoverageCriteria.id
+                    )
+                ),
+                literal_column("'[]'::json")
+            )
+        )
+        .where(CoverageCriteria.policy_section_id == PolicySection.id)
+        .scalar_subquery()
+    )
+    
+    exclusions = (
+        select(
+            func.coalesce(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_object(
+                            "id", Exclusion.id,
+                            "excluded_procedure", Exclusion.excluded_procedure,
+                            "exclusion_rationale", Exclusion.exclusion_rationale,
+                            "exceptions_to_exclusion", Exclusion.exceptions_to_exclusion,
+                            "extraction_confidence_score", Exclusion.extraction_confidence_score
+                        ),
+                        Exclusion.excluded_procedure,
+                        Exclusion.id
+                    )
+                ),
+                literal_column("'[]'::json")
+            )
+        )
+        .where(Exclusion.policy_section_id == PolicySection.id)
+        .scalar_subquery()
+    )
+    
+    return func.json_build_object(
+        "section", func.json_build_object(
+            "id", PolicySection.id,
+            "section_type", PolicySection.section_type,
+            "section_number", PolicySection.section_number,
+            "title", PolicySection.title,
+            "content_text", PolicySection.content_text,
+            "content_structured", PolicySection.content_structured,
+            "extraction_confidence_score", PolicySection.extraction_confidence_score,
+            "page_numbers", PolicySection.page_numbers,
+            "order_index", PolicySection.order_index
+        ),
+        "coverage_criteria", coverage_criteria,
+        "exclusions", exclusions
+    )
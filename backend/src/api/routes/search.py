@@ -0,0 +1,94 @@
+"""Search API routes for keyword search across policy documents."""
+from datetime import date
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import UUID
+from typing import List, Optional
+
+from ...database import get_db
+from ...models.policy_document import DocumentType
+from ...models.policy_section import SectionType
+from ...services.search.search_engine import SearchEngine, SearchFilters
+from ...utils.pagination import InvalidCursorError
+
+router = APIRouter()
+
+# Initialize services
+search_engine = SearchEngine()
+
+
+@router.get("")
+async def search_policies(
+    q: str = Query(..., min_length=1, max_length=500, description='Keywords, "quoted phrases", or, -excluded'),
+    payer_id: Optional[List[str]] = Query(None),
+    effective_date_from: Optional[date] = Query(None),
+    effective_date_to: Optional[date] = Query(None),
+    document_type: Optional[List[DocumentType]] = Query(None),
+    section_type: Optional[List[SectionType]] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Search policy sections, coverage criteria, and exclusions by keyword.
+    
+    Results are sections, most relevant first, with highlighted fragments
+    of the section text. Pass the previous response's next_cursor to get
+    the next page.
+    
+    Args:
+        q: Search query
+        payer_id: Filter by payer UUIDs (repeatable)
+        effective_date_from: Earliest policy effective date
+        effective_date_to: Latest policy effective date
+        document_type: Filter by policy document types (repeatable)
+        section_type: Filter by section types (repeatable)
+        limit: Maximum number of results
+        cursor: next_cursor from the previous page
+        db: Database session
+    
+    Returns:
+        Matching sections with their policies and highlights, and the
+        cursor for the next page
+    """
+    filters = SearchFilters(
+        payer_ids=[UUID(p) for p in payer_id or []],
+        effective_date_from=effective_date_from,
+        effective_date_to=effective_date_to,
+        document_types=document_type or [],
+        section_types=section_type or []
+    )
+    
+    try:
+        page = await search_engine.search(db, q, filters, limit=limit, cursor=cursor)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "query": q,
+        "filters_applied": filters.to_dict(),
+        "next_cursor": page.next_cursor,
+        "results": [
+            {
+                "section": {
+                    "id": str(hit.section_id),
+                    "section_type": hit.section_type,
+                    "section_number": hit.section_number,
+                    "title": hit.title,
+                    "order_index": hit.order_index
+                },
+                "policy_document": {
+                    "id": str(hit.policy_document_id),
+                    "payer_id": str(hit.payer_id),
+                    "payer_name": hit.payer_name,
+                    "policy_name": hit.policy_name,
+                    "policy_number": hit.policy_number,
+                    "effective_date": hit.effective_date.isoformat(),
+                    "document_type": hit.document_type
+                },
+                "highlights": hit.highlights,
+                "relevance_score": hit.relevance_score
+            }
+            for hit in page.hits
+        ]
+    }
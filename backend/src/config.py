@@ -34,21 +34,67 @@ class Settings(BaseSettings):
     azure_storage_container_name: str = "policy-pdfs"
     local_storage_path: str | None = "./storage/pdfs"
     
+    # Upload
+    upload_chunk_size_bytes: int = 1024 * 1024
+    max_upload_size_mb: int = 100
+    storage_io_workers: int = 8
+    
     # LLM Provider
-    llm_provider: Literal["openai", "anthropic"] = "openai"
+    llm_provider: Literal["openai", "anthropic", "offline"] = "openai"
     openai_api_key: str | None = None
     anthropic_api_key: str | None = None
+    offline_llm_latency_seconds: float = 1.0
+    offline_llm_latency_sigma: float = 0.4
+    offline_llm_seconds_per_1k_tokens: float = 0.0
+    offline_llm_rate_limit_rate: float = 0.0
+    offline_llm_invalid_rate: float = 0.0
+    offline_llm_seed: int = 0
     
     # Pydantic AI Configuration
     pydantic_ai_model: str = "gpt-4"
     pydantic_ai_temperature: float = 0.1
     pydantic_ai_max_tokens: int = 4000
+    llm_requests_per_minute: int = 500  # 0: unlimited
+    llm_tokens_per_minute: int = 150000  # 0: unlimited
+    llm_expected_response_tokens: int = 1000
+    llm_deadline_seconds: float = 120.0  # 0: no deadline
+    llm_hedge_quantile: float = 0.95  # 0: no hedged requests
+    llm_hedge_min_samples: int = 20
+    llm_fallback_model: str | None = None
+    llm_cache_backend: Literal["none", "memory", "sqlite", "redis"] = "sqlite"
+    llm_cache_path: str = "./storage/llm_cache.sqlite3"
+    llm_cache_ttl_seconds: int = 30 * 24 * 3600  # 0: never expire
+    llm_cache_memory_entries: int = 1024
     
     # Processing Configuration
     max_retries: int = 3
     retry_backoff_base: int = 2
+    retry_max_delay_seconds: float = 60.0
     extraction_confidence_threshold: float = 0.85
     human_review_first_n_policies: int = 5
+    ocr_min_chars_per_page: int = 50
+    ocr_rasterize_pages: bool = True
+    ocr_dpi: int = 300
+    ocr_max_workers: int | None = None
+    ocr_cache_enabled: bool = True
+    ocr_cache_dir: str = "./storage/ocr_cache"
+    ocr_cache_memory_entries: int = 1024
+    ocr_cache_max_disk_mb: int = 512
+    chunk_max_tokens: int = 3000  # 0: size chunks by characters instead
+    chunk_overlap_tokens: int = 150
+    rule_skip_section_types: str = "DEFINITIONS,APPEALS_PROCESS"
+    rule_skip_min_confidence: float = 0.85
+    pre_extract_skip_llm: bool = True
+    
+    # Ingestion Worker
+    worker_processes: int = 1  # Worker processes sharing the LLM rate limits
+    worker_max_concurrent_jobs: int = 4
+    worker_poll_interval_seconds: float = 2.0
+    worker_extraction_concurrency: int = 2
+    worker_llm_concurrency: int = 8
+    worker_persistence_concurrency: int = 4
+    worker_job_lease_seconds: int = 300  # RUNNING jobs not renewed for this long are reclaimed
+    worker_heartbeat_interval_seconds: float = 30.0
     
     # CORS
     cors_origins: str = "http://localhost:3000,http://localhost:5173"
@@ -62,6 +108,11 @@ class Settings(BaseSettings):
         """Parse CORS origins from comma-separated string."""
         return [origin.strip() for origin in self.cors_origins.split(",")]
     
+    @property
+    def rule_skip_section_types_list(self) -> list[str]:
+        """Parse section types that may skip LLM extraction from comma-separated string."""
+        return [section_type.strip() for section_type in self.rule_skip_section_types.split(",") if section_type.strip()]
+    
     @property
     def use_azure_storage(self) -> bool:
         """Check if Azure Storage is configured."""
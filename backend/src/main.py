@@ -42,9 +42,10 @@ async def health_check():
 
 
 # Import and include routers
-from .api.routes import ingestion, policies
+from .api.routes import ingestion, policies, search
 app.include_router(ingestion.router, prefix="/v1/ingestion", tags=["ingestion"])
 app.include_router(policies.router, prefix="/v1/policies", tags=["policies"])
+app.include_router(search.router, prefix="/v1/search", tags=["search"])
 
 
 if __name__ == "__main__":
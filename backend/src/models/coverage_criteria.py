@@ -1,6 +1,6 @@
 """Coverage criteria model representing conditions for medical service coverage."""
-from sqlalchemy import String, Boolean, Float, Text, ForeignKey, CheckConstraint
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Boolean, Float, Text, ForeignKey, CheckConstraint, Computed, Index
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, UUIDMixin, TimestampMixin
@@ -68,12 +68,29 @@ class CoverageCriteria(Base, UUIDMixin, TimestampMixin):
         nullable=True
     )
     
+    # Full-Text Search (generated by PostgreSQL, not loaded unless accessed)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', procedure_name || ' ' || coalesce(procedure_code, '')), 'A') || "
+            "setweight(to_tsvector('english', covered_scenarios), 'B') || "
+            "setweight(to_tsvector('english', coalesce(required_documentation, '')), 'C')",
+            persisted=True
+        ),
+        deferred=True
+    )
+    
     # Constraints
     __table_args__ = (
         CheckConstraint(
             "extraction_confidence_score IS NULL OR (extraction_confidence_score >= 0.0 AND extraction_confidence_score <= 1.0)",
             name="check_coverage_confidence_score_range"
         ),
+        Index(
+            "ix_coverage_criteria_search_vector",
+            "search_vector",
+            postgresql_using="gin"
+        ),
     )
     
     def __repr__(self) -> str:
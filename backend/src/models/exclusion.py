@@ -1,6 +1,6 @@
 """Exclusion model representing conditions or scenarios explicitly not covered."""
-from sqlalchemy import String, Float, Text, ForeignKey, CheckConstraint
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, Float, Text, ForeignKey, CheckConstraint, Computed, Index
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, UUIDMixin, TimestampMixin
@@ -42,12 +42,29 @@ class Exclusion(Base, UUIDMixin, TimestampMixin):
         nullable=True
     )
     
+    # Full-Text Search (generated by PostgreSQL, not loaded unless accessed)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', excluded_procedure), 'A') || "
+            "setweight(to_tsvector('english', coalesce(exclusion_rationale, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(exceptions_to_exclusion, '')), 'C')",
+            persisted=True
+        ),
+        deferred=True
+    )
+    
     # Constraints
     __table_args__ = (
         CheckConstraint(
             "extraction_confidence_score IS NULL OR (extraction_confidence_score >= 0.0 AND extraction_confidence_score <= 1.0)",
             name="check_exclusion_confidence_score_range"
         ),
+        Index(
+            "ix_exclusions_search_vector",
+            "search_vector",
+            postgresql_using="gin"
+        ),
     )
     
     def __repr__(self) -> str:
@@ -2,7 +2,7 @@
 from datetime import datetime, date
 from enum import Enum
 
-from sqlalchemy import String, Integer, Float, Boolean, DateTime, Date, ForeignKey, Enum as SQLEnum, CheckConstraint
+from sqlalchemy import String, Integer, Float, Boolean, DateTime, Date, ForeignKey, Enum as SQLEnum, CheckConstraint, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -103,6 +103,12 @@ class PolicyDocument(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
         nullable=False
     )
     
+    pdf_content_hash: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="SHA-256 of the PDF bytes, used for upload deduplication"
+    )
+    
     # Processing Status
     processing_status: Mapped[ProcessingStatus] = mapped_column(
         SQLEnum(ProcessingStatus, name="processing_status"),
@@ -165,6 +171,26 @@ class PolicyDocument(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
             "expiration_date IS NULL OR expiration_date >= effective_date",
             name="check_expiration_after_effective"
         ),
+        Index(
+            "ix_policy_documents_payer_content_hash",
+            "payer_id",
+            "pdf_content_hash",
+            unique=True,
+            postgresql_where=text("is_deleted = false")
+        ),
+        Index(
+            "ix_policy_documents_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_deleted = false")
+        ),
+        Index(
+            "ix_policy_documents_payer_created_at_id",
+            "payer_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_deleted = false")
+        ),
     )
     
     def __repr__(self) -> str:
@@ -1,8 +1,8 @@
 """Policy section model representing logical sections within policy documents."""
 from enum import Enum
 
-from sqlalchemy import String, Integer, Float, Text, ForeignKey, Enum as SQLEnum, ARRAY, CheckConstraint
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import String, Integer, Float, Text, ForeignKey, Enum as SQLEnum, ARRAY, CheckConstraint, Computed, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base, UUIDMixin, TimestampMixin
@@ -79,6 +79,17 @@ class PolicySection(Base, UUIDMixin, TimestampMixin):
         nullable=False
     )
     
+    # Full-Text Search (generated by PostgreSQL, not loaded unless accessed)
+    search_vector: Mapped[str | None] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', title), 'A') || "
+            "setweight(to_tsvector('english', content_text), 'B')",
+            persisted=True
+        ),
+        deferred=True
+    )
+    
     # Constraints
     __table_args__ = (
         CheckConstraint(
@@ -89,6 +100,11 @@ class PolicySection(Base, UUIDMixin, TimestampMixin):
             "order_index >= 0",
             name="check_order_index_non_negative"
         ),
+        Index(
+            "ix_policy_sections_search_vector",
+            "search_vector",
+            postgresql_using="gin"
+        ),
     )
     
     def __repr__(self) -> str:
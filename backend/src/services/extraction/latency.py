@@ -0,0 +1,92 @@
+"""Latency tracking and tail-latency settings for LLM calls."""
+import bisect
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+from ...config import settings
+
+
+# Histogram bucket upper bounds in seconds (the last bucket is open-ended)
+DEFAULT_BUCKETS = (0.5, 1, 2, 5, 10, 20, 30, 60, 120)
+
+
+@dataclass(slots=True)
+class LatencyPolicy:
+    """Deadline and hedging settings for LLM calls."""
+    deadline_seconds: float | None = None
+    hedge_quantile: float | None = None
+    hedge_min_samples: int = 20
+    
+    @classmethod
+    def from_settings(cls) -> "LatencyPolicy":
+        """Build the policy configured in settings (0 disables a feature)."""
+        return cls(
+            deadline_seconds=settings.llm_deadline_seconds or None,
+            hedge_quantile=settings.llm_hedge_quantile or None,
+            hedge_min_samples=settings.llm_hedge_min_samples
+        )
+
+
+class LatencyTracker:
+    """Rolling window of call latencies with quantiles and a histogram."""
+    
+    def __init__(self, window: int = 500):
+        """
+        Initialize latency tracker.
+        
+        Args:
+            window: Most recent samples kept for quantiles
+        """
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+    
+    def record(self, seconds: float) -> None:
+        """Add one latency sample."""
+        self._samples.append(seconds)
+        self.count += 1
+    
+    def quantile(self, q: float) -> float | None:
+        """
+        Latency at quantile q over the window (None without samples).
+        
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.95)
+        """
+        if not self._samples:
+            return None
+        
+        ordered = sorted(self._samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+    
+    def histogram(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Dict[str, int]:
+        """
+        Count windowed samples per latency bucket.
+        
+        Args:
+            buckets: Ascending bucket upper bounds in seconds
+        
+        Returns:
+            Ordered mapping of bucket label ('<=2s', '>120s') to count
+        """
+        counts: List[int] = [0] * (len(buckets) + 1)
+        for sample in self._samples:
+            counts[bisect.bisect_left(buckets, sample)] += 1
+        
+        labels = [f"<={bound:g}s" for bound in buckets] + [f">{buckets[-1]:g}s"]
+        return dict(zip(labels, counts))
+    
+    def snapshot(self) -> Dict[str, any]:
+        """
+        Summarize the window.
+        
+        Returns:
+            Dictionary with sample count and p50/p95/p99/max in seconds
+        """
+        return {
+            "count": self.count,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": max(self._samples) if self._samples else None,
+        }
@@ -1,29 +1,26 @@
 """Pydantic AI agent for policy document extraction."""
+import asyncio
+import logging
+import time
+from datetime import date
 from pydantic_ai import Agent
-from typing import Dict, Any
+from pydantic_ai.models import Model
+from typing import Dict, Any, List, Sequence
 
+from .latency import LatencyPolicy, LatencyTracker
+from .offline_model import OfflineModel
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
+from .retry import ErrorClassification, RetryPolicy
 from .schemas import PolicyExtraction, PolicySectionExtraction
+from ..ingestion.pre_extractor import PreExtraction
 from ...config import settings
+from ...utils.token_counter import TokenCounter, get_token_counter
 
+logger = logging.getLogger(__name__)
 
-class PolicyExtractionAgent:
-    """Pydantic AI agent for extracting structured data from policy documents."""
-    
-    def __init__(self):
-        """Initialize the Pydantic AI agent."""
-        # Determine model based on configuration
-        if settings.llm_provider == "openai":
-            model = f"openai:{settings.pydantic_ai_model}"
-        elif settings.llm_provider == "anthropic":
-            model = f"anthropic:{settings.pydantic_ai_model}"
-        else:
-            raise ValueError(f"Unsupported LLM provider: {settings.llm_provider}")
-        
-        # Create agent for full policy extraction
-        self.policy_agent = Agent(
-            model=model,
-            result_type=PolicyExtraction,
-            system_prompt="""You are an expert at extracting structured information from healthcare policy documents.
+
+POLICY_SYSTEM_PROMPT = """You are an expert at extracting structured information from healthcare policy documents.
 
 Your task is to:
 1. Identify the policy name, number, payer, and dates
@@ -36,24 +33,142 @@ Be precise and conservative with confidence scores. If information is unclear or
 
 For dates, use ISO format (YYYY-MM-DD). For procedure codes, use standard CPT/HCPCS codes if mentioned.
 """
-        )
-        
-        # Create agent for section-level extraction
-        self.section_agent = Agent(
-            model=model,
-            result_type=PolicySectionExtraction,
-            system_prompt="""You are an expert at extracting structured information from policy document sections.
+
+SECTION_SYSTEM_PROMPT = """You are an expert at extracting structured information from policy document sections.
 
 Analyze the section and extract:
 1. Section type (COVERAGE_CRITERIA, EXCLUSIONS, REQUIREMENTS, etc.)
 2. Title and section number
-3. Coverage criteria with specific details
+3. Coverage criteria with specific details; codes listed under "Codes found" were matched in the content, use them as given
 4. Exclusions with rationale
 5. Confidence score for the extraction
 
 Be thorough but precise. Extract all relevant coverage criteria and exclusions mentioned in the section.
 """
+
+
+class SectionExtractionError(Exception):
+    """Some sections failed; carries the results of those that succeeded."""
+    
+    def __init__(self, results: List[PolicySectionExtraction | None], errors: Dict[int, Exception]):
+        """
+        Initialize section extraction error.
+        
+        Args:
+            results: Per-section results in input order (None where it failed)
+            errors: Error per failed section index
+        """
+        super().__init__(f"{len(errors)} of {len(results)} sections failed to extract")
+        self.results = results
+        self.errors = errors
+
+
+class PolicyExtractionAgent:
+    """Pydantic AI agent for extracting structured data from policy documents."""
+    
+    def __init__(
+        self,
+        model: Model | str | None = None,
+        max_concurrency: int | None = None,
+        rate_limiter: RateLimiter | None = None,
+        token_counter: TokenCounter | None = None,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        latency_policy: LatencyPolicy | None = None,
+        fallback_model: Model | str | None = None
+    ):
+        """
+        Initialize the Pydantic AI agent.
+        
+        The concurrency limit and rate limiter apply to every call this agent
+        makes, so one agent shared by all jobs in a worker keeps the whole
+        process within the provider's limits.
+        
+        Args:
+            model: Model or model name (default: from LLM provider settings)
+            max_concurrency: Max in-flight LLM calls (default: from settings)
+            rate_limiter: Requests/tokens per minute limiter (default: from settings)
+            token_counter: Token counter for rate limit reservations
+            cache: Response cache consulted before each call (None: disabled)
+            retry_policy: Retries for transient failures (default: from settings)
+            latency_policy: Deadline and hedging settings (default: from settings)
+            fallback_model: Model that serves hedged requests (default: from
+                settings; none hedges with the primary model)
+        """
+        # Determine model based on configuration
+        if model is None:
+            if settings.llm_provider == "openai":
+                model = f"openai:{settings.pydantic_ai_model}"
+            elif settings.llm_provider == "anthropic":
+                model = f"anthropic:{settings.pydantic_ai_model}"
+            elif settings.llm_provider == "offline":
+                model = OfflineModel.from_settings()
+            else:
+                raise ValueError(f"Unsupported LLM provider: {settings.llm_provider}")
+        
+        # Create agent for full policy extraction
+        self.policy_agent = Agent(
+            model=model,
+            result_type=PolicyExtraction,
+            system_prompt=POLICY_SYSTEM_PROMPT
         )
+        
+        # Create agent for section-level extraction
+        self.section_agent = Agent(
+            model=model,
+            result_type=PolicySectionExtraction,
+            system_prompt=SECTION_SYSTEM_PROMPT
+        )
+        
+        self.semaphore = asyncio.Semaphore(max_concurrency or settings.worker_llm_concurrency)
+        self.rate_limiter = rate_limiter or RateLimiter(
+            settings.llm_requests_per_minute,
+            settings.llm_tokens_per_minute,
+            processes=settings.worker_processes
+        )
+        self.token_counter = token_counter or get_token_counter(settings.pydantic_ai_model)
+        self.expected_response_tokens = settings.llm_expected_response_tokens
+        self.retry_policy = retry_policy or RetryPolicy()
+        
+        self._system_prompt_tokens = {
+            id(self.policy_agent): self.token_counter.count(POLICY_SYSTEM_PROMPT),
+            id(self.section_agent): self.token_counter.count(SECTION_SYSTEM_PROMPT),
+        }
+        
+        # Hedged requests go to the fallback model when one is configured
+        fallback_model = fallback_model or settings.llm_fallback_model
+        if fallback_model:
+            self._hedge_agents = {
+                id(self.policy_agent): Agent(
+                    model=fallback_model,
+                    result_type=PolicyExtraction,
+                    system_prompt=POLICY_SYSTEM_PROMPT
+                ),
+                id(self.section_agent): Agent(
+                    model=fallback_model,
+                    result_type=PolicySectionExtraction,
+                    system_prompt=SECTION_SYSTEM_PROMPT
+                ),
+            }
+        else:
+            self._hedge_agents = {
+                id(self.policy_agent): self.policy_agent,
+                id(self.section_agent): self.section_agent,
+            }
+        
+        # Request latency per agent (for hedge delays) and latency seen by callers
+        self.latency_policy = latency_policy or LatencyPolicy.from_settings()
+        self._request_latency: Dict[int, LatencyTracker] = {}
+        self.call_latency = LatencyTracker()
+        self.hedges_started = 0
+        self.hedges_won = 0
+        
+        self.cache = cache
+        model_name = model if isinstance(model, str) else model.name()
+        self._cache_scopes = {
+            id(self.policy_agent): ResponseCache.scope(model_name, POLICY_SYSTEM_PROMPT, PolicyExtraction),
+            id(self.section_agent): ResponseCache.scope(model_name, SECTION_SYSTEM_PROMPT, PolicySectionExtraction),
+        }
     
     async def extract_policy(self, document_text: str, payer_name: str) -> PolicyExtraction:
         """
@@ -62,7 +177,7 @@ Be thorough but precise. Extract all relevant coverage criteria and exclusions m
         Args:
             document_text: Full policy document text
             payer_name: Name of the payer (helps with context)
-            
+        
         Returns:
             PolicyExtraction with structured data
         """
@@ -70,34 +185,200 @@ Be thorough but precise. Extract all relevant coverage criteria and exclusions m
         context = f"Payer: {payer_name}\n\nDocument:\n{document_text}"
         
         # Run extraction
-        result = await self.policy_agent.run(
-            context,
-            message_history=[]
-        )
-        
-        return result.data
+        return await self._run(self.policy_agent, PolicyExtraction, context)
     
-    async def extract_section(self, section_text: str, section_title: str) -> PolicySectionExtraction:
+    async def extract_section(
+        self,
+        section_text: str,
+        section_title: str,
+        facts: PreExtraction | None = None
+    ) -> PolicySectionExtraction:
         """
         Extract structured data from a single policy section.
         
         Args:
             section_text: Section text content
             section_title: Section title/heading
-            
+            facts: Codes pre-extracted from the section (see section_context)
+        
         Returns:
             PolicySectionExtraction with structured data
         """
-        # Prepare context
-        context = f"Section Title: {section_title}\n\nContent:\n{section_text}"
+        context = self.section_context(section_title, section_text, facts)
         
         # Run extraction
-        result = await self.section_agent.run(
-            context,
-            message_history=[]
+        return await self._run(self.section_agent, PolicySectionExtraction, context)
+    
+    @staticmethod
+    def section_context(section_title: str, section_text: str, facts: PreExtraction | None = None) -> str:
+        """
+        Build the prompt for one section.
+        
+        Codes the pre-extractor matched are listed ahead of the content, so
+        the model copies them instead of finding and normalizing them itself.
+        """
+        header = f"Section Title: {section_title}"
+        if facts is not None and facts.has_codes:
+            codes = [
+                f"{system} {', '.join(found)}"
+                for system, found in (
+                    ("CPT", facts.cpt_codes),
+                    ("HCPCS", facts.hcpcs_codes),
+                    ("ICD-10", facts.icd10_codes),
+                )
+                if found
+            ]
+            header += f"\nCodes found: {'; '.join(codes)}"
+        
+        return f"{header}\n\nContent:\n{section_text}"
+    
+    async def extract_sections(
+        self,
+        sections: Sequence,
+        section_facts: Sequence[PreExtraction] | None = None
+    ) -> List[PolicySectionExtraction]:
+        """
+        Extract many sections concurrently (the map step).
+        
+        Calls run as soon as the concurrency limit and rate limiter allow.
+        Each section retries on its own, so a failing section never discards
+        or repeats the sections that succeeded.
+        
+        Args:
+            sections: Section records with title and text (from DocumentChunker)
+            section_facts: One PreExtraction per section (from
+                PreExtractor.extract_sections), listed in each prompt
+        
+        Returns:
+            One PolicySectionExtraction per section, in input order
+        
+        Raises:
+            SectionExtractionError: Some sections still failed after retries
+        """
+        section_facts = section_facts or [None] * len(sections)
+        outcomes = await asyncio.gather(
+            *(
+                self.extract_section(section.text, section.title, facts)
+                for section, facts in zip(sections, section_facts)
+            ),
+            return_exceptions=True
         )
         
-        return result.data
+        errors = {}
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                errors[index] = outcome
+            elif isinstance(outcome, BaseException):
+                raise outcome  # Cancellation
+        
+        if errors:
+            raise SectionExtractionError(
+                [None if index in errors else outcome for index, outcome in enumerate(outcomes)],
+                errors
+            )
+        
+        return list(outcomes)
+    
+    async def extract_policy_by_sections(
+        self,
+        sections: Sequence,
+        payer_name: str,
+        policy_name: str,
+        effective_date: date,
+        **metadata: Any
+    ) -> PolicyExtraction:
+        """
+        Extract a policy section by section and merge the results.
+        
+        Each prompt holds one section instead of the whole document, so
+        long policies stay within the context window and sections are
+        extracted in parallel.
+        
+        Args:
+            sections: Section records with title and text (from DocumentChunker)
+            payer_name: Name of the payer
+            policy_name: Policy name
+            effective_date: Policy effective date
+            **metadata: Other PolicyExtraction fields (policy_number,
+                expiration_date, document_type)
+        
+        Returns:
+            PolicyExtraction combining all sections
+        """
+        section_results = await self.extract_sections(sections)
+        return self.merge_sections(
+            section_results,
+            payer_name=payer_name,
+            policy_name=policy_name,
+            effective_date=effective_date,
+            **metadata
+        )
+    
+    def merge_sections(
+        self,
+        section_results: Sequence[PolicySectionExtraction],
+        payer_name: str,
+        policy_name: str,
+        effective_date: date,
+        policy_number: str | None = None,
+        expiration_date: date | None = None,
+        document_type: str = "OTHER"
+    ) -> PolicyExtraction:
+        """
+        Combine per-section results into one document extraction (the reduce step).
+        
+        Consecutive chunks share overlap text, so a coverage criterion or
+        exclusion repeated from the previous section is dropped. Sections
+        stay one-to-one with the input.
+        
+        Args:
+            section_results: Per-section extractions in document order
+            payer_name: Name of the payer
+            policy_name: Policy name
+            effective_date: Policy effective date
+            policy_number: Policy number if known
+            expiration_date: Policy expiration date if known
+            document_type: MEDICAL, PHARMACY, DENTAL, VISION, or OTHER
+        
+        Returns:
+            PolicyExtraction with merged sections and overall confidence
+        """
+        sections = []
+        previous_keys = set()
+        
+        for result in section_results:
+            criteria = [
+                c for c in result.coverage_criteria
+                if _criteria_key(c) not in previous_keys
+            ]
+            exclusions = [
+                e for e in result.exclusions
+                if _exclusion_key(e) not in previous_keys
+            ]
+            
+            previous_keys = {_criteria_key(c) for c in result.coverage_criteria}
+            previous_keys.update(_exclusion_key(e) for e in result.exclusions)
+            
+            if len(criteria) == len(result.coverage_criteria) and len(exclusions) == len(result.exclusions):
+                sections.append(result)
+            else:
+                sections.append(result.model_copy(update={
+                    "coverage_criteria": criteria,
+                    "exclusions": exclusions
+                }))
+        
+        confidences = [s.confidence_score for s in sections if s.confidence_score]
+        
+        return PolicyExtraction(
+            policy_name=policy_name,
+            policy_number=policy_number,
+            payer_name=payer_name,
+            effective_date=effective_date,
+            expiration_date=expiration_date,
+            document_type=document_type,
+            sections=sections,
+            overall_confidence_score=sum(confidences) / len(confidences) if confidences else 0.0
+        )
     
     async def extract_with_retry(
         self,
@@ -106,31 +387,201 @@ Be thorough but precise. Extract all relevant coverage criteria and exclusions m
         max_retries: int = 2
     ) -> PolicyExtraction:
         """
-        Extract policy with automatic retry on failure.
+        Extract policy with automatic retry on transient failures.
+        
+        Rate limits, timeouts, and server errors are retried with jittered
+        backoff (honoring Retry-After); invalid output fails immediately,
+        since repeating the same prompt would fail the same way.
         
         Args:
             document_text: Full policy document text
             payer_name: Name of the payer
             max_retries: Maximum number of retry attempts
-            
+        
         Returns:
             PolicyExtraction with structured data
-            
+        
         Raises:
-            Exception if all retries fail
-        """
-        last_error = None
-        
-        for attempt in range(max_retries + 1):
-            try:
-                return await self.extract_policy(document_text, payer_name)
-            except Exception as e:
-                last_error = e
-                if attempt < max_retries:
-                    # Wait before retry (exponential backoff)
-                    import asyncio
-                    wait_time = (2 ** attempt) * settings.retry_backoff_base
-                    await asyncio.sleep(wait_time)
-                    continue
+            The last error when it is not retryable or all retries fail
+        """
+        context = f"Payer: {payer_name}\n\nDocument:\n{document_text}"
+        retry_policy = RetryPolicy(
+            max_retries=max_retries,
+            base_delay=self.retry_policy.base_delay,
+            max_delay=self.retry_policy.max_delay
+        )
+        
+        return await self._run(self.policy_agent, PolicyExtraction, context, retry_policy)
+    
+    async def _run(
+        self,
+        agent: Agent,
+        result_type: type,
+        context: str,
+        retry_policy: RetryPolicy | None = None
+    ):
+        """
+        Run one agent call, from the cache when possible.
+        
+        Calls that miss the cache run under the concurrency limit and rate
+        limiter. Each request reserves the prompt plus the expected response
+        against the tokens per minute budget, then corrects it with the
+        usage the provider reported (see _timed_request). Transient failures
+        are retried per the retry policy; the concurrency slot is released
+        while waiting.
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(self._cache_scopes[id(agent)], context)
+            cached = await self.cache.get(cache_key, result_type)
+            if cached is not None:
+                return cached
+        
+        reserved = (
+            self._system_prompt_tokens[id(agent)]
+            + self.token_counter.count(context)
+            + self.expected_response_tokens
+        )
+        
+        async def attempt():
+            async with self.semaphore:
+                await self.rate_limiter.acquire(reserved)
+                return await self._hedged_request(agent, context, reserved)
+        
+        result, served_by = await (retry_policy or self.retry_policy).run(attempt, on_retry=_log_retry)
+        
+        # Fallback answers are not cached, so the primary model gets the next try
+        if cache_key is not None and served_by is agent:
+            await self.cache.put(cache_key, result.data)
+        
+        return result.data
+    
+    async def _hedged_request(self, agent: Agent, context: str, reserved: int):
+        """
+        Send one request, hedging it if it runs past the agent's usual latency.
+        
+        Once enough requests have been seen, a request still running at the
+        hedge quantile (e.g. p95) of recent latencies gets a second request,
+        to the fallback model when configured, and whichever succeeds first
+        wins; the other is cancelled. The hedge takes its own concurrency
+        slot and rate limiter reservation, so hedging never runs more than
+        the configured number of requests at once. The attempt is bounded by
+        the deadline, after which it fails with a (retryable) timeout.
+        
+        Returns:
+            The run result and the agent that produced it
+        """
+        policy = self.latency_policy
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + policy.deadline_seconds if policy.deadline_seconds else None
+        
+        hedge_delay = None
+        tracker = self._request_latency.get(id(agent))
+        if policy.hedge_quantile and tracker and tracker.count >= policy.hedge_min_samples:
+            hedge_delay = tracker.quantile(policy.hedge_quantile)
+        
+        hedge_agent = self._hedge_agents[id(agent)]
+        
+        async def hedge():
+            async with self.semaphore:
+                await self.rate_limiter.acquire(reserved)
+                return await self._timed_request(hedge_agent, context, reserved)
+        
+        # Task -> (agent, whether it is the hedge)
+        tasks = {asyncio.create_task(self._timed_request(agent, context, reserved)): (agent, False)}
+        error = None
+        
+        try:
+            if hedge_delay is not None and (deadline is None or started + hedge_delay < deadline):
+                done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+                if not done:
+                    tasks[asyncio.create_task(hedge())] = (hedge_agent, True)
+                    self.hedges_started += 1
+            
+            while tasks:
+                timeout = None if deadline is None else max(deadline - loop.time(), 0.0)
+                done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    raise asyncio.TimeoutError(
+                        f"LLM call exceeded its {policy.deadline_seconds:g}s deadline"
+                    )
+                
+                for task in done:
+                    served_by, is_hedge = tasks.pop(task)
+                    if task.exception() is None:
+                        self.hedges_won += is_hedge
+                        self.call_latency.record(loop.time() - started)
+                        return task.result(), served_by
+                    error = task.exception()
+            
+            raise error
+        finally:
+            for task in tasks:
+                if task.done():
+                    task.exception()  # Loser already failed; mark its error retrieved
                 else:
-                    raise last_error
+                    task.cancel()
+    
+    async def _timed_request(self, agent: Agent, context: str, reserved: int):
+        """
+        Run the agent once, recording its latency and settling its token reservation.
+        
+        A request cancelled because the other side of a hedge won records the
+        time it had run so far, so slow requests still pull the hedge delay
+        up. Its response was cut short, so only the prompt is charged.
+        Failed requests keep their reservation, as their usage is unknown.
+        """
+        tracker = self._request_latency.setdefault(id(agent), LatencyTracker())
+        started = time.perf_counter()
+        try:
+            result = await agent.run(
+                context,
+                message_history=[]
+            )
+        except asyncio.CancelledError:
+            tracker.record(time.perf_counter() - started)
+            self.rate_limiter.record_usage(reserved, reserved - self.expected_response_tokens)
+            raise
+        
+        tracker.record(time.perf_counter() - started)
+        self.rate_limiter.record_usage(reserved, result.cost().total_tokens)
+        return result
+    
+    def latency_stats(self) -> Dict[str, any]:
+        """
+        Get call latency metrics.
+        
+        Returns:
+            Dictionary with caller-visible latency quantiles, histogram, and
+            hedge counts
+        """
+        return {
+            **self.call_latency.snapshot(),
+            "histogram": self.call_latency.histogram(),
+            "hedges_started": self.hedges_started,
+            "hedges_won": self.hedges_won,
+        }
+
+
+def _log_retry(attempt: int, error: Exception, classification: ErrorClassification, delay: float) -> None:
+    """Log a transient LLM failure before it is retried."""
+    logger.warning(
+        "LLM call failed (%s: %s); retry %d in %.1fs",
+        classification.reason, error, attempt, delay
+    )
+
+
+def _criteria_key(criteria) -> tuple:
+    """Identity of a coverage criterion for de-duplicating overlap."""
+    return (
+        "criteria",
+        (criteria.procedure_code or "").strip().upper(),
+        criteria.procedure_name.strip().casefold(),
+        criteria.covered_scenarios.strip().casefold()
+    )
+
+
+def _exclusion_key(exclusion) -> tuple:
+    """Identity of an exclusion for de-duplicating overlap."""
+    return ("exclusion", exclusion.excluded_procedure.strip().casefold())
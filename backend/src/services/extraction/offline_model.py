@@ -0,0 +1,202 @@
+"""Deterministic offline stand-in for the LLM, for load tests and benchmarks."""
+import asyncio
+import hashlib
+import math
+import random
+import re
+from datetime import date
+from typing import Dict, List
+
+from pydantic_ai.exceptions import UnexpectedModelBehavior
+from pydantic_ai.messages import ModelResponse, ToolCallPart, UserPromptPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from ...config import settings
+from ..ingestion.document_chunker import DocumentChunker
+from ..ingestion.pre_extractor import PreExtractor
+from ..ingestion.section_classifier import SectionClassifier
+
+
+# Sentences end at . ! ? or a line break, but not at a decimal point (M17.11)
+_SENTENCE_PATTERN = re.compile(r"(?:[^.!?\n]|\.(?=\d))+[.!?]?")
+_EXCLUSION_PATTERN = re.compile(r"not covered|not medically necessary|exclu|experimental|investigational", re.IGNORECASE)
+_PRIOR_AUTH_PATTERN = re.compile(r"prior authori[sz]ation|pre-?authori[sz]ation|precertification", re.IGNORECASE)
+
+
+class OfflineModelError(Exception):
+    """Injected provider failure (carries an HTTP status like SDK errors do)."""
+    
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response = None
+
+
+class OfflineModel(FunctionModel):
+    """
+    Local model that returns schema-valid extractions without calling a provider.
+    
+    Results are built from the prompt with the same rules every time:
+    procedure codes become coverage criteria or exclusions depending on
+    their sentence, and section types come from the keyword classifier.
+    Latency is lognormal around a median and grows with prompt size;
+    rate-limit and invalid-output failures are injected at configured
+    rates. Randomness is seeded from the prompt and how often it has been
+    sent, so a run replays identically, retries included.
+    """
+    
+    def __init__(
+        self,
+        latency_seconds: float = 1.0,
+        latency_sigma: float = 0.4,
+        seconds_per_1k_tokens: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        invalid_rate: float = 0.0,
+        seed: int = 0
+    ):
+        """
+        Initialize offline model.
+        
+        Args:
+            latency_seconds: Median response latency
+            latency_sigma: Lognormal spread of latency (0: constant)
+            seconds_per_1k_tokens: Extra latency per 1k prompt tokens (~4 chars each)
+            rate_limit_rate: Share of requests failing with HTTP 429
+            invalid_rate: Share of requests failing with invalid output
+            seed: Seed for latency and failure draws
+        """
+        super().__init__(self._respond)
+        self.latency_seconds = latency_seconds
+        self.latency_sigma = latency_sigma
+        self.seconds_per_1k_tokens = seconds_per_1k_tokens
+        self.rate_limit_rate = rate_limit_rate
+        self.invalid_rate = invalid_rate
+        self.seed = seed
+        
+        self.requests = 0
+        self._sends: Dict[str, int] = {}
+        self._chunker = DocumentChunker()
+        self._classifier = SectionClassifier()
+        self._pre_extractor = PreExtractor()
+    
+    @classmethod
+    def from_settings(cls) -> "OfflineModel":
+        """Build the offline model configured in settings."""
+        return cls(
+            latency_seconds=settings.offline_llm_latency_seconds,
+            latency_sigma=settings.offline_llm_latency_sigma,
+            seconds_per_1k_tokens=settings.offline_llm_seconds_per_1k_tokens,
+            rate_limit_rate=settings.offline_llm_rate_limit_rate,
+            invalid_rate=settings.offline_llm_invalid_rate,
+            seed=settings.offline_llm_seed
+        )
+    
+    def name(self) -> str:
+        return "offline"
+    
+    async def _respond(self, messages, info: AgentInfo) -> ModelResponse:
+        """Answer one request after a simulated delay, or fail as configured."""
+        self.requests += 1
+        prompt = "\n".join(
+            part.content
+            for message in messages
+            for part in message.parts
+            if isinstance(part, UserPromptPart)
+        )
+        
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        send = self._sends.get(digest, 0)
+        self._sends[digest] = send + 1
+        rng = random.Random(f"{self.seed}:{digest}:{send}")
+        
+        latency = self.latency_seconds * math.exp(rng.gauss(0, self.latency_sigma))
+        latency += len(prompt) / 4000 * self.seconds_per_1k_tokens
+        await asyncio.sleep(latency)
+        
+        roll = rng.random()
+        if roll < self.rate_limit_rate:
+            raise OfflineModelError("Rate limit reached (offline model)", status_code=429)
+        if roll < self.rate_limit_rate + self.invalid_rate:
+            raise UnexpectedModelBehavior("Exceeded maximum retries for result validation (offline model)")
+        
+        result_tool = info.result_tools[0]
+        if "sections" in result_tool.parameters_json_schema.get("properties", {}):
+            result = self._policy_result(prompt, rng)
+        else:
+            result = self._section_result(prompt, rng)
+        
+        return ModelResponse(parts=[ToolCallPart.from_dict(result_tool.name, result)])
+    
+    def _policy_result(self, prompt: str, rng: random.Random) -> Dict[str, any]:
+        """Build a PolicyExtraction payload from a 'Payer: ... Document: ...' prompt."""
+        header, _, document = prompt.partition("\n\nDocument:\n")
+        payer_name = header.removeprefix("Payer:").strip() or "Unknown"
+        lines = [line.strip() for line in document.splitlines() if line.strip()]
+        
+        sections = [
+            self._section_payload(section.title, section.text, rng)
+            for section in self._chunker.chunk_by_sections(document)
+        ]
+        facts = self._pre_extractor.extract(document)
+        effective_date = facts.effective_date or (facts.dates[0] if facts.dates else date(2024, 1, 1))
+        expiration_date = facts.expiration_date if facts.expiration_date and facts.expiration_date >= effective_date else None
+        
+        return {
+            "policy_name": lines[0][:200] if lines else "Untitled Policy",
+            "policy_number": facts.policy_number,
+            "payer_name": payer_name,
+            "effective_date": effective_date.isoformat(),
+            "expiration_date": expiration_date.isoformat() if expiration_date else None,
+            "document_type": "MEDICAL",
+            "sections": sections,
+            "overall_confidence_score": round(rng.uniform(0.75, 0.98), 3),
+        }
+    
+    def _section_result(self, prompt: str, rng: random.Random) -> Dict[str, any]:
+        """Build a PolicySectionExtraction payload from a 'Section Title: ... Content: ...' prompt."""
+        header, _, content = prompt.partition("\n\nContent:\n")
+        title = header.partition("\n")[0].removeprefix("Section Title:").strip()
+        return self._section_payload(title, content, rng)
+    
+    def _section_payload(self, title: str, text: str, rng: random.Random) -> Dict[str, any]:
+        """Turn each sentence that names a procedure code into a criterion or exclusion."""
+        criteria: List[Dict[str, any]] = []
+        exclusions: List[Dict[str, any]] = []
+        
+        for sentence in _SENTENCE_PATTERN.findall(text):
+            codes = self._pre_extractor.extract(sentence).procedure_codes
+            if not codes:
+                continue
+            
+            sentence = " ".join(sentence.split())
+            procedure = sentence.split("(")[0].strip()[:200] or sentence[:200]
+            confidence = round(rng.uniform(0.7, 0.99), 3)
+            
+            if _EXCLUSION_PATTERN.search(sentence):
+                exclusions.append({
+                    "excluded_procedure": procedure,
+                    "exclusion_rationale": sentence,
+                    "confidence_score": confidence,
+                })
+            else:
+                criteria.append({
+                    "procedure_name": procedure,
+                    "procedure_code": codes[0],
+                    "covered_scenarios": sentence,
+                    "prior_authorization_required": bool(_PRIOR_AUTH_PATTERN.search(text)),
+                    "confidence_score": confidence,
+                })
+        
+        classification = self._classifier.classify(title, text)
+        number = re.search(r"\d+(?:\.\d+)*", title)
+        
+        return {
+            "section_type": classification.section_type.value,
+            "title": title[:500] or "Untitled Section",
+            "section_number": number.group() if number else None,
+            "content_summary": " ".join(text.split())[:200],
+            "coverage_criteria": criteria,
+            "exclusions": exclusions,
+            "confidence_score": round(rng.uniform(0.75, 0.98), 3),
+        }
+
@@ -0,0 +1,139 @@
+"""Token-bucket rate limiting for LLM requests and tokens per minute."""
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Continuously refilling budget of requests or tokens."""
+    
+    def __init__(self, rate_per_minute: float, capacity: float | None = None):
+        """
+        Initialize token bucket.
+        
+        Args:
+            rate_per_minute: Units added to the bucket per minute
+            capacity: Maximum burst size (default: one minute's worth)
+        """
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self._level = self.capacity
+        self._updated = time.monotonic()
+    
+    @property
+    def level(self) -> float:
+        """Units available right now (negative after an under-reservation)."""
+        self._refill()
+        return self._level
+    
+    def delay_for(self, amount: float) -> float:
+        """
+        Seconds until amount can be taken (0.0 when it can be taken now).
+        
+        Amounts above capacity wait for a full bucket instead of forever.
+        """
+        self._refill()
+        missing = min(amount, self.capacity) - self._level
+        return max(missing, 0.0) / self.rate_per_second
+    
+    def take(self, amount: float) -> None:
+        """Remove amount from the bucket (negative refunds); the level may go negative."""
+        self._refill()
+        self._level = min(self.capacity, self._level - amount)
+    
+    def _refill(self) -> None:
+        """Add the units accrued since the last update."""
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+
+class RateLimiter:
+    """
+    Shared requests-per-minute and tokens-per-minute limit for LLM calls.
+    
+    Callers reserve one request and an estimate of its tokens before calling
+    the provider, then report actual usage so the token budget is corrected.
+    Waiters are served in arrival order, so a large request is not starved
+    by a stream of small ones.
+    
+    The buckets live in process memory. When several worker processes share
+    one provider account, each gets an equal share of the configured budget
+    (processes), so together they stay within the provider limit.
+    """
+    
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        burst_seconds: float = 10.0,
+        processes: int = 1
+    ):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            requests_per_minute: Request budget (None or 0: unlimited)
+            tokens_per_minute: Token budget (None or 0: unlimited)
+            burst_seconds: Seconds of budget that may be spent at once;
+                providers enforce per-minute limits over shorter windows
+            processes: Processes sharing the budgets; each gets an equal share
+        """
+        processes = max(processes, 1)
+        if requests_per_minute:
+            requests_per_minute /= processes
+        if tokens_per_minute:
+            tokens_per_minute /= processes
+        
+        self.requests = (
+            TokenBucket(requests_per_minute, requests_per_minute * burst_seconds / 60.0)
+            if requests_per_minute else None
+        )
+        self.tokens = (
+            TokenBucket(tokens_per_minute, tokens_per_minute * burst_seconds / 60.0)
+            if tokens_per_minute else None
+        )
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self, tokens: int = 0) -> float:
+        """
+        Wait until one request and the given tokens fit in the budget.
+        
+        Args:
+            tokens: Estimated tokens (prompt plus expected response)
+        
+        Returns:
+            Seconds spent waiting
+        """
+        if self.requests is None and self.tokens is None:
+            return 0.0
+        
+        started = time.monotonic()
+        async with self._lock:
+            while True:
+                delay = max(
+                    self.requests.delay_for(1) if self.requests else 0.0,
+                    self.tokens.delay_for(tokens) if self.tokens else 0.0
+                )
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+            
+            if self.requests:
+                self.requests.take(1)
+            if self.tokens:
+                self.tokens.take(tokens)
+        
+        return time.monotonic() - started
+    
+    def record_usage(self, reserved_tokens: int, actual_tokens: int | None) -> None:
+        """
+        Correct the token budget once a call reports its real usage.
+        
+        Args:
+            reserved_tokens: Tokens passed to acquire()
+            actual_tokens: Tokens the provider reported (None: keep the reservation)
+        """
+        if self.tokens is None or actual_tokens is None:
+            return
+        
+        self.tokens.take(actual_tokens - reserved_tokens)
@@ -0,0 +1,325 @@
+"""Cache for validated LLM extraction results with pluggable storage backends."""
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+try:
+    from redis import asyncio as redis_asyncio
+except ImportError:  # Optional: only needed for the redis backend
+    redis_asyncio = None
+
+from ...config import settings
+
+logger = logging.getLogger(__name__)
+
+ResultT = TypeVar("ResultT", bound=BaseModel)
+
+
+class MemoryCacheBackend:
+    """In-process LRU of serialized results (lost on restart)."""
+    
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize memory backend.
+        
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[float | None, str]] = OrderedDict()
+    
+    async def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    async def set(self, key: str, value: str, ttl_seconds: int | None) -> None:
+        expires_at = time.time() + ttl_seconds if ttl_seconds else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    async def close(self) -> None:
+        self._entries.clear()
+
+
+class SQLiteCacheBackend:
+    """
+    Results in a local SQLite file, shared by worker processes on one host.
+    
+    Queries run in a thread so the event loop never blocks on disk. WAL mode
+    lets readers in other processes proceed while one writes.
+    """
+    
+    def __init__(self, path: str | Path):
+        """
+        Initialize SQLite backend.
+        
+        Args:
+            path: Database file (created if missing)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+        )
+    
+    async def get(self, key: str) -> str | None:
+        return await asyncio.to_thread(self._get, key)
+    
+    async def set(self, key: str, value: str, ttl_seconds: int | None) -> None:
+        expires_at = time.time() + ttl_seconds if ttl_seconds else None
+        await asyncio.to_thread(self._set, key, value, expires_at)
+    
+    async def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+    
+    def purge_expired(self) -> int:
+        """
+        Delete expired entries.
+        
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM llm_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),)
+            )
+            return cursor.rowcount
+    
+    def _get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+        
+        if row is None:
+            return None
+        
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            return None
+        
+        return value
+    
+    def _set(self, key: str, value: str, expires_at: float | None) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at)
+            )
+
+
+class RedisCacheBackend:
+    """Results in Redis, shared by workers on every host; Redis enforces TTLs."""
+    
+    def __init__(self, url: str, prefix: str = "llm-cache:"):
+        """
+        Initialize Redis backend.
+        
+        Args:
+            url: Redis connection URL
+            prefix: Key prefix separating cache entries from other data
+        """
+        if redis_asyncio is None:
+            raise RuntimeError("The redis package is required for the redis LLM cache backend")
+        
+        self.prefix = prefix
+        self._client = redis_asyncio.from_url(url, decode_responses=True)
+    
+    async def get(self, key: str) -> str | None:
+        return await self._client.get(self.prefix + key)
+    
+    async def set(self, key: str, value: str, ttl_seconds: int | None) -> None:
+        await self._client.set(self.prefix + key, value, ex=ttl_seconds or None)
+    
+    async def close(self) -> None:
+        await self._client.close()
+
+
+class ResponseCache:
+    """
+    Cache validated extraction results in front of LLM calls.
+    
+    Keys hash everything that determines a result: the model, the system
+    prompt, the result schema, and the input text. Changing any of them
+    misses the cache instead of returning stale data. Backend failures are
+    logged and treated as misses, so the cache never fails an extraction.
+    """
+    
+    def __init__(self, backend, ttl_seconds: int | None = None):
+        """
+        Initialize response cache.
+        
+        Args:
+            backend: Storage backend (memory, SQLite, or Redis)
+            ttl_seconds: Entry lifetime (None or 0: no expiry)
+        """
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds or None
+        
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.hit_seconds = 0.0
+    
+    @staticmethod
+    def scope(model_name: str, system_prompt: str, result_type: Type[BaseModel]) -> str:
+        """
+        Hash the per-agent part of the key once, so lookups only hash input text.
+        
+        Args:
+            model_name: Model identifier (e.g. 'openai:gpt-4')
+            system_prompt: Agent system prompt
+            result_type: Pydantic result model
+        
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = json.dumps(
+            {
+                "model": model_name,
+                "system_prompt": system_prompt,
+                "schema": result_type.model_json_schema(),
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def make_key(scope: str, context: str) -> str:
+        """
+        Build a cache key for one prompt.
+        
+        Args:
+            scope: Digest from scope()
+            context: User prompt text
+        
+        Returns:
+            Hex SHA-256 digest
+        """
+        hasher = hashlib.sha256(scope.encode("ascii"))
+        hasher.update(context.encode("utf-8"))
+        return hasher.hexdigest()
+    
+    async def get(self, key: str, result_type: Type[ResultT]) -> ResultT | None:
+        """
+        Look up and validate a cached result.
+        
+        Args:
+            key: Key from make_key()
+            result_type: Pydantic model to validate against
+        
+        Returns:
+            The cached result, or None on a miss
+        """
+        started = time.perf_counter()
+        
+        try:
+            value = await self.backend.get(key)
+        except Exception:
+            logger.warning("LLM cache lookup failed", exc_info=True)
+            self.errors += 1
+            value = None
+        
+        if value is not None:
+            try:
+                result = result_type.model_validate_json(value)
+            except ValidationError:
+                result = None  # Stored under an older schema; treat as a miss
+            
+            if result is not None:
+                self.hits += 1
+                self.hit_seconds += time.perf_counter() - started
+                return result
+        
+        self.misses += 1
+        return None
+    
+    async def put(self, key: str, result: BaseModel) -> None:
+        """
+        Store a validated result.
+        
+        Args:
+            key: Key from make_key()
+            result: Extraction result
+        """
+        try:
+            await self.backend.set(key, result.model_dump_json(), self.ttl_seconds)
+        except Exception:
+            logger.warning("LLM cache write failed", exc_info=True)
+            self.errors += 1
+    
+    def stats(self) -> Dict[str, any]:
+        """
+        Get hit/miss metrics.
+        
+        Returns:
+            Dictionary with counts, hit rate, and mean hit latency
+        """
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "avg_hit_ms": self.hit_seconds * 1000 / self.hits if self.hits else 0.0,
+        }
+    
+    async def close(self) -> None:
+        """Release backend connections."""
+        await self.backend.close()
+
+
+def create_response_cache(backend: str | None = None) -> ResponseCache | None:
+    """
+    Build the response cache configured in settings.
+    
+    Args:
+        backend: 'memory', 'sqlite', 'redis', or 'none' (default: from settings)
+    
+    Returns:
+        ResponseCache, or None when caching is disabled
+    """
+    backend = backend or settings.llm_cache_backend
+    
+    if backend == "none":
+        return None
+    elif backend == "memory":
+        store = MemoryCacheBackend(settings.llm_cache_memory_entries)
+    elif backend == "sqlite":
+        store = SQLiteCacheBackend(settings.llm_cache_path)
+    elif backend == "redis":
+        store = RedisCacheBackend(settings.redis_url)
+    else:
+        raise ValueError(f"Unsupported LLM cache backend: {backend}")
+    
+    return ResponseCache(store, settings.llm_cache_ttl_seconds)
@@ -0,0 +1,175 @@
+"""Retry policy for LLM calls: error classification, Retry-After, and jittered backoff."""
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+
+import httpx
+from pydantic import ValidationError
+from pydantic_ai.exceptions import UnexpectedModelBehavior, UserError
+
+from ...config import settings
+
+
+# Provider SDK errors (OpenAI and Anthropic share these names) worth retrying
+RETRYABLE_ERROR_NAMES = {
+    "APIConnectionError",
+    "APITimeoutError",
+    "RateLimitError",
+    "InternalServerError",
+    "OverloadedError",
+}
+
+# HTTP statuses that mean "try again later" rather than "this request is wrong"
+RETRYABLE_STATUS_CODES = {408, 409, 425, 429, 500, 502, 503, 504, 529}
+
+
+@dataclass(slots=True)
+class ErrorClassification:
+    """Whether an error is worth retrying, and how long the server asked us to wait."""
+    retryable: bool
+    retry_after: float | None = None
+    reason: str = ""
+
+
+def classify_error(error: BaseException) -> ErrorClassification:
+    """
+    Decide whether a failed LLM call should be retried.
+    
+    Rate limits, timeouts, dropped connections, and server errors are
+    transient. Invalid output (the result failed schema validation even
+    after the agent's own re-prompts), bad requests, and authentication
+    errors fail the same way every time.
+    
+    Args:
+        error: Exception raised by the call
+    
+    Returns:
+        ErrorClassification
+    """
+    if isinstance(error, (ValidationError, UnexpectedModelBehavior, UserError)):
+        return ErrorClassification(False, reason="invalid model output")
+    
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        retryable = status_code in RETRYABLE_STATUS_CODES
+        return ErrorClassification(
+            retryable,
+            _retry_after(error) if retryable else None,
+            reason=f"HTTP {status_code}"
+        )
+    
+    error_names = {cls.__name__ for cls in type(error).__mro__}
+    if error_names & RETRYABLE_ERROR_NAMES:
+        return ErrorClassification(True, _retry_after(error), reason=type(error).__name__)
+    
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError, httpx.TransportError)):
+        return ErrorClassification(True, reason=type(error).__name__)
+    
+    return ErrorClassification(False, reason=type(error).__name__)
+
+
+class RetryPolicy:
+    """
+    Retry budget with decorrelated jitter.
+    
+    Each delay is drawn uniformly between the base delay and three times
+    the previous delay (starting from the base), capped at max_delay, so
+    workers that failed together spread out instead of retrying in
+    lockstep. A server Retry-After is honored as a floor.
+    """
+    
+    def __init__(
+        self,
+        max_retries: int | None = None,
+        base_delay: float | None = None,
+        max_delay: float | None = None,
+        rng: random.Random | None = None
+    ):
+        """
+        Initialize retry policy.
+        
+        Args:
+            max_retries: Retries after the first attempt (default: from settings)
+            base_delay: Minimum delay in seconds (default: from settings)
+            max_delay: Cap on jittered delays in seconds (default: from settings)
+            rng: Random source (for reproducible delays)
+        """
+        self.max_retries = settings.max_retries if max_retries is None else max_retries
+        self.base_delay = settings.retry_backoff_base if base_delay is None else base_delay
+        self.max_delay = settings.retry_max_delay_seconds if max_delay is None else max_delay
+        self._rng = rng or random.Random()
+    
+    def next_delay(self, previous_delay: float, retry_after: float | None = None) -> float:
+        """
+        Compute the wait before the next attempt.
+        
+        Args:
+            previous_delay: Previous delay (0 before the first retry)
+            retry_after: Server-requested wait, if any
+        
+        Returns:
+            Seconds to wait
+        """
+        upper = max(self.base_delay, previous_delay) * 3
+        delay = min(self.max_delay, self._rng.uniform(self.base_delay, upper))
+        return max(delay, retry_after or 0.0)
+    
+    async def run(self, call, on_retry=None):
+        """
+        Await call() until it succeeds, a non-retryable error occurs, or retries run out.
+        
+        Args:
+            call: Zero-argument coroutine function making one attempt
+            on_retry: Optional callback(attempt, error, classification, delay)
+        
+        Returns:
+            The call's result
+        
+        Raises:
+            The last error when it is not retryable or retries are exhausted
+        """
+        delay = 0.0
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await call()
+            except Exception as e:
+                classification = classify_error(e)
+                if not classification.retryable or attempt == self.max_retries:
+                    raise
+                
+                delay = self.next_delay(delay, classification.retry_after)
+                if on_retry is not None:
+                    on_retry(attempt + 1, e, classification, delay)
+                await asyncio.sleep(delay)
+
+
+def _retry_after(error: BaseException) -> float | None:
+    """Read Retry-After (seconds or HTTP date) or retry-after-ms from an error's response."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(float(retry_after_ms) / 1000, 0.0)
+        except ValueError:
+            pass
+    
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    
+    try:
+        return max(parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
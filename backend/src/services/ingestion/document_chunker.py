@@ -1,131 +1,464 @@
 """Document chunking for semantic section splitting."""
 import re
-from typing import List, Dict
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import List, Dict, Iterable, Iterator, Tuple
+
+from ...utils.token_counter import TokenCounter, get_token_counter
+from .section_classifier import SectionClassifier
+
+
+# Common section headers in policy documents. Each pattern is matched after
+# a newline and any leading whitespace. "[^\n]+\n" is the same match as the
+# lazy "(.+?)\n" (a dot never crosses a newline) without per-character
+# backtracking.
+SECTION_PATTERNS = [
+    ('section', r'(?:SECTION|Section)\s+\d+[:\.\s]+[^\n]+\n'),
+    ('coverage_criteria', r'(?:COVERAGE|Coverage)\s+(?:CRITERIA|Criteria)[:\s]*\n'),
+    ('exclusions', r'(?:EXCLUSIONS|Exclusions)[:\s]*\n'),
+    ('requirements', r'(?:REQUIREMENTS|Requirements)[:\s]*\n'),
+    ('definitions', r'(?:DEFINITIONS|Definitions)[:\s]*\n'),
+    ('prior_authorization', r'(?:PRIOR AUTHORIZATION|Prior Authorization)[:\s]*\n'),
+    ('limitations', r'(?:LIMITATIONS|Limitations)[:\s]*\n'),
+    ('appeals_process', r'(?:APPEALS|Appeals)\s+(?:PROCESS|Process)[:\s]*\n'),
+    ('numbered', r'\d+\.\s+[^\n]+\n'),  # Numbered sections
+    ('lettered', r'[A-Z][:\.\s]+[^\n]+\n'),  # Lettered sections
+]
+
+# One alternation over all header patterns, tried once at every newline. The
+# patterns sit in a lookahead so a match only consumes its newline: a header
+# found by one pattern does not hide a header another pattern finds inside
+# it, exactly as when each pattern was scanned separately.
+_SECTION_BOUNDARY = re.compile(
+    r'\n(?=\s*(?:' + '|'.join(f'(?P<{name}>{pattern})' for name, pattern in SECTION_PATTERNS) + '))',
+    re.IGNORECASE
+)
+
+
+@dataclass(slots=True, eq=False)
+class Section:
+    """
+    A section (or part of one) stored as offsets into the document text.
+    
+    All sections of a document share the source string; text is only
+    sliced out when accessed.
+    """
+    title: str
+    source: str = field(repr=False)
+    start: int
+    end: int
+    order_index: int
+    token_count: int | None = None
+    page_start: int | None = None
+    page_end: int | None = None
+    
+    @property
+    def text(self) -> str:
+        """Section text (sliced from the source on each access)."""
+        return self.source[self.start:self.end]
+    
+    @property
+    def char_count(self) -> int:
+        """Exact length of the section text."""
+        return self.end - self.start
+    
+    @property
+    def page_numbers(self) -> List[int]:
+        """1-based pages the section spans (empty when page offsets were not given)."""
+        if self.page_start is None:
+            return []
+        
+        return list(range(self.page_start, self.page_end + 1))
 
 
 class DocumentChunker:
     """Split extracted text into semantic sections."""
     
-    def __init__(self, max_chunk_size: int = 4000):
+    def __init__(
+        self,
+        max_chunk_size: int = 4000,
+        max_chunk_tokens: int | None = None,
+        overlap_tokens: int = 0,
+        token_counter: TokenCounter | None = None,
+        classifier: SectionClassifier | None = None
+    ):
         """
         Initialize document chunker.
         
+        Setting max_chunk_tokens switches to token-budget mode: sections over
+        the budget are packed paragraph by paragraph up to the budget instead
+        of up to max_chunk_size characters, so each LLM call is filled close
+        to the model's budget without overflowing it.
+        
         Args:
-            max_chunk_size: Maximum characters per chunk
+            max_chunk_size: Maximum characters per chunk (character mode)
+            max_chunk_tokens: Maximum tokens per chunk (enables token mode)
+            overlap_tokens: Tokens of trailing text repeated at the start of
+                the next part of a split section (token mode)
+            token_counter: Tokenizer for the target model (default: gpt-4)
+            classifier: Rule-based section classifier (default: SectionClassifier)
         """
+        if max_chunk_tokens is not None and overlap_tokens >= max_chunk_tokens:
+            raise ValueError("overlap_tokens must be smaller than max_chunk_tokens")
+        
         self.max_chunk_size = max_chunk_size
+        self.max_chunk_tokens = max_chunk_tokens
+        self.overlap_tokens = overlap_tokens
+        self.token_counter = token_counter or get_token_counter("gpt-4")
+        self.classifier = classifier or SectionClassifier()
     
-    def chunk_by_sections(self, text: str) -> List[Dict[str, any]]:
+    @staticmethod
+    def page_offsets(pages: Iterable[Dict[str, any]]) -> List[int]:
         """
-        Split document into sections based on common policy document patterns.
+        Compute where each page starts in text joined like PDFExtractor full_text.
         
         Args:
-            text: Full document text
+            pages: Page dictionaries in page order
             
         Returns:
-            List of section dictionaries with text and metadata
-        """
-        # Common section headers in policy documents
-        section_patterns = [
-            r'\n\s*(?:SECTION|Section)\s+\d+[:\.\s]+(.+?)\n',
-            r'\n\s*(?:COVERAGE|Coverage)\s+(?:CRITERIA|Criteria)[:\s]*\n',
-            r'\n\s*(?:EXCLUSIONS|Exclusions)[:\s]*\n',
-            r'\n\s*(?:REQUIREMENTS|Requirements)[:\s]*\n',
-            r'\n\s*(?:DEFINITIONS|Definitions)[:\s]*\n',
-            r'\n\s*(?:PRIOR AUTHORIZATION|Prior Authorization)[:\s]*\n',
-            r'\n\s*(?:LIMITATIONS|Limitations)[:\s]*\n',
-            r'\n\s*(?:APPEALS|Appeals)\s+(?:PROCESS|Process)[:\s]*\n',
-            r'\n\s*\d+\.\s+(.+?)\n',  # Numbered sections
-            r'\n\s*[A-Z][:\.\s]+(.+?)\n',  # Lettered sections
-        ]
+            Start offset of page N at index N - 1
+        """
+        offsets = []
+        position = 0
         
-        # Find all section boundaries
-        boundaries = []
-        for pattern in section_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                boundaries.append({
-                    'position': match.start(),
-                    'title': match.group(0).strip(),
-                    'pattern': pattern
-                })
+        for page in pages:
+            offsets.append(position)
+            position += len(page["text"]) + 2  # "\n\n" page separator
         
-        # Sort boundaries by position
-        boundaries.sort(key=lambda x: x['position'])
+        return offsets
+    
+    def chunk_by_sections(self, text: str, page_offsets: List[int] | None = None) -> List[Section]:
+        """
+        Split document into sections based on common policy document patterns.
+        
+        Args:
+            text: Full document text
+            page_offsets: Start offset of each page in text (see
+                page_offsets()); fills each section's page span
+            
+        Returns:
+            List of sections referencing text by offset
+        """
+        boundaries = self._find_boundaries(text)
         
         # If no sections found, treat entire document as one section
         if not boundaries:
-            return self._chunk_large_text(text, "Full Document")
+            sections = self._chunk_whole_document(text)
+        else:
+            # Split text into sections
+            sections = []
+            for i, boundary in enumerate(boundaries):
+                start = boundary['position']
+                end = boundaries[i + 1]['position'] if i + 1 < len(boundaries) else len(text)
+                
+                sections.extend(self._build_sections(text, start, end, boundary['title'], len(sections)))
+        
+        if page_offsets:
+            self._assign_pages(sections, page_offsets)
+        
+        return sections
+    
+    def iter_sections(self, pages: Iterable[Dict[str, any]]) -> Iterator[Section]:
+        """
+        Split a stream of pages into sections, yielding each one once it is complete.
+        
+        Pages are joined the same way as PDFExtractor.extract_text() builds
+        full_text. Only the text of the currently open section is buffered, so
+        sections can be sent downstream while later pages are still being
+        extracted. Page spans are always filled.
         
-        # Split text into sections
-        sections = []
+        Args:
+            pages: Page dictionaries (e.g. from PDFExtractor.iter_pages())
+            
+        Yields:
+            Sections like chunk_by_sections(); their offsets refer to the
+            buffered text they were cut from
+        """
+        buffer = ""
+        buffer_offset = 0
+        page_offsets = []
+        next_page_offset = 0
+        emitted = 0
+        found_boundary = False
+        
+        for page in pages:
+            buffer = buffer + "\n\n" + page["text"] if page_offsets else page["text"]
+            page_offsets.append(next_page_offset)
+            next_page_offset += len(page["text"]) + 2
+            
+            boundaries = self._find_boundaries(buffer)
+            
+            if not boundaries:
+                continue
+            
+            # Everything before the first boundary is never part of a section
+            found_boundary = True
+            
+            # The section starting at the last boundary may still continue on the next page
+            last_position = boundaries[-1]['position']
+            for i, boundary in enumerate(boundaries):
+                if boundary['position'] == last_position:
+                    break
+                
+                sections = self._build_sections(
+                    buffer, boundary['position'], boundaries[i + 1]['position'], boundary['title'], emitted
+                )
+                self._assign_pages(sections, page_offsets, buffer_offset)
+                for section in sections:
+                    emitted += 1
+                    yield section
+            
+            buffer = buffer[last_position:]
+            buffer_offset += last_position
+        
+        if not found_boundary:
+            sections = self._chunk_whole_document(buffer)
+            self._assign_pages(sections, page_offsets, buffer_offset)
+            yield from sections
+            return
+        
+        boundaries = self._find_boundaries(buffer)
         for i, boundary in enumerate(boundaries):
-            start = boundary['position']
-            end = boundaries[i + 1]['position'] if i + 1 < len(boundaries) else len(text)
+            end = boundaries[i + 1]['position'] if i + 1 < len(boundaries) else len(buffer)
             
-            section_text = text[start:end].strip()
+            sections = self._build_sections(buffer, boundary['position'], end, boundary['title'], emitted)
+            self._assign_pages(sections, page_offsets, buffer_offset)
+            for section in sections:
+                emitted += 1
+                yield section
+    
+    def _build_sections(self, text: str, start: int, end: int, title: str, order_index: int) -> List[Section]:
+        """Turn one boundary-delimited span into a section, splitting it if too large."""
+        start, end = self._strip_span(text, start, end)
+        
+        if self.max_chunk_tokens is not None:
+            token_count = self.token_counter.count(text[start:end])
+            if token_count > self.max_chunk_tokens:
+                return self._chunk_by_tokens(text, start, end, title)
             
-            # If section is too large, split it further
-            if len(section_text) > self.max_chunk_size:
-                subsections = self._chunk_large_text(section_text, boundary['title'])
-                sections.extend(subsections)
-            else:
-                sections.append({
-                    'title': boundary['title'],
-                    'text': section_text,
-                    'char_count': len(section_text),
-                    'order_index': len(sections)
-                })
+            return [Section(title, text, start, end, order_index, token_count)]
         
-        return sections
+        # If section is too large, split it further
+        if end - start > self.max_chunk_size:
+            return self._chunk_large_text(text, start, end, title)
+        
+        return [Section(title, text, start, end, order_index)]
     
-    def _chunk_large_text(self, text: str, base_title: str) -> List[Dict[str, any]]:
+    def _strip_span(self, text: str, start: int, end: int) -> Tuple[int, int]:
+        """Narrow a span to exclude leading and trailing whitespace (like str.strip)."""
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        
+        return start, end
+    
+    def _assign_pages(self, sections: List[Section], page_offsets: List[int], base: int = 0) -> None:
+        """
+        Set each section's page span from cumulative page start offsets.
+        
+        Args:
+            sections: Sections to update
+            page_offsets: Start offset of each page in the full text
+            base: Offset of the sections' source within the full text
+        """
+        for section in sections:
+            last_char = max(section.end - 1, section.start)
+            section.page_start = bisect_right(page_offsets, base + section.start)
+            section.page_end = bisect_right(page_offsets, base + last_char)
+    
+    def _find_boundaries(self, text: str) -> List[Dict[str, any]]:
+        """
+        Find section header positions in text in a single scan.
+        
+        The first non-blank token of a line selects at most one pattern, so
+        each position yields at most one boundary. A pattern that matched
+        cannot match again before its match ends (re.finditer semantics, kept
+        per pattern so the output matches scanning the patterns one by one).
+        
+        Args:
+            text: Document text
+            
+        Returns:
+            Boundary dictionaries sorted by position
+        """
+        boundaries = []
+        pattern_ends = {}
+        
+        for match in _SECTION_BOUNDARY.finditer(text):
+            name = match.lastgroup
+            position = match.start()
+            
+            if position < pattern_ends.get(name, 0):
+                continue
+            
+            pattern_ends[name] = match.end(name)
+            boundaries.append({
+                'position': position,
+                'title': match.group(name).strip(),
+                'pattern': name
+            })
+        
+        return boundaries
+    
+    def _chunk_whole_document(self, text: str) -> List[Section]:
+        """Chunk a document that has no recognizable section headers."""
+        if self.max_chunk_tokens is not None:
+            return self._chunk_by_tokens(text, 0, len(text), "Full Document")
+        
+        return self._chunk_large_text(text, 0, len(text), "Full Document")
+    
+    def _chunk_by_tokens(self, text: str, start: int, end: int, base_title: str) -> List[Section]:
+        """
+        Pack paragraphs into chunks of at most max_chunk_tokens tokens.
+        
+        Paragraphs that alone exceed the budget are split at line breaks,
+        then at spaces. Each chunk is a contiguous span of the text, and
+        consecutive chunks share up to overlap_tokens tokens of trailing
+        pieces so context carries across the split.
+        
+        Args:
+            text: Source text
+            start: Start offset of the span to split
+            end: End offset of the span to split
+            base_title: Base title for chunks
+            
+        Returns:
+            List of sections
+        """
+        pieces = self._split_spans(text, start, end, ['\n\n', '\n', ' '])
+        
+        groups = []
+        current = []
+        current_tokens = 0
+        
+        for piece in pieces:
+            # One token per separator keeps the running total conservative
+            added = piece[2] + (1 if current else 0)
+            
+            if current and current_tokens + added > self.max_chunk_tokens:
+                groups.append((current, current_tokens))
+                current = self._overlap_tail(current, piece[2])
+                current_tokens = sum(tokens for _, _, tokens in current) + len(current)
+                added = piece[2] + (1 if current else 0)
+            
+            current.append(piece)
+            current_tokens += added
+        
+        if current:
+            groups.append((current, current_tokens))
+        
+        return [
+            Section(
+                f"{base_title} (Part {chunk_index + 1})" if len(groups) > 1 else base_title,
+                text,
+                group[0][0],
+                group[-1][1],
+                chunk_index,
+                token_count
+            )
+            for chunk_index, (group, token_count) in enumerate(groups)
+        ]
+    
+    def _overlap_tail(self, pieces: List[tuple], next_tokens: int) -> List[tuple]:
+        """Trailing pieces of a full chunk to repeat before the next piece."""
+        budget = min(self.overlap_tokens, self.max_chunk_tokens - next_tokens - 1)
+        
+        tail = []
+        tail_tokens = 0
+        for piece in reversed(pieces):
+            tail_tokens += piece[2] + 1
+            if tail_tokens > budget:
+                break
+            tail.insert(0, piece)
+        
+        return tail
+    
+    def _split_spans(self, text: str, start: int, end: int, separators: List[str]) -> List[tuple]:
+        """
+        Split text[start:end] into (start, end, tokens) pieces within the token budget.
+        
+        Pieces are split at the first separator, and recursively at the next
+        separator when still over budget. A piece with no separators left
+        (e.g. one very long word) is kept whole.
+        """
+        tokens = self.token_counter.count(text[start:end])
+        if tokens <= self.max_chunk_tokens or not separators:
+            return [(start, end, tokens)]
+        
+        pieces = []
+        for piece_start, piece_end in self._split_at(text, start, end, separators[0]):
+            pieces.extend(self._split_spans(text, piece_start, piece_end, separators[1:]))
+        
+        return pieces
+    
+    def _split_at(self, text: str, start: int, end: int, separator: str) -> List[Tuple[int, int]]:
+        """Offsets equivalent to text[start:end].split(separator), without copying."""
+        spans = []
+        position = start
+        
+        while True:
+            split_at = text.find(separator, position, end)
+            if split_at == -1:
+                spans.append((position, end))
+                return spans
+            
+            spans.append((position, split_at))
+            position = split_at + len(separator)
+    
+    def _chunk_large_text(self, text: str, start: int, end: int, base_title: str) -> List[Section]:
         """
         Split large text into smaller chunks.
         
         Args:
-            text: Text to split
+            text: Source text
+            start: Start offset of the span to split
+            end: End offset of the span to split
             base_title: Base title for chunks
             
         Returns:
-            List of chunk dictionaries
+            List of sections
         """
         chunks = []
         
-        # Split by paragraphs first
-        paragraphs = text.split('\n\n')
-        
-        current_chunk = []
+        current_start = None
+        current_end = None
         current_size = 0
         chunk_index = 0
         
-        for para in paragraphs:
-            para_size = len(para)
+        # Split by paragraphs first
+        for para_start, para_end in self._split_at(text, start, end, '\n\n'):
+            para_size = para_end - para_start
             
-            if current_size + para_size > self.max_chunk_size and current_chunk:
+            if current_size + para_size > self.max_chunk_size and current_start is not None:
                 # Save current chunk
-                chunks.append({
-                    'title': f"{base_title} (Part {chunk_index + 1})",
-                    'text': '\n\n'.join(current_chunk),
-                    'char_count': current_size,
-                    'order_index': chunk_index
-                })
+                chunks.append(Section(
+                    f"{base_title} (Part {chunk_index + 1})",
+                    text,
+                    current_start,
+                    current_end,
+                    chunk_index
+                ))
                 
                 # Start new chunk
-                current_chunk = [para]
+                current_start, current_end = para_start, para_end
                 current_size = para_size
                 chunk_index += 1
             else:
-                current_chunk.append(para)
+                if current_start is None:
+                    current_start = para_start
+                current_end = para_end
                 current_size += para_size
         
         # Add final chunk
-        if current_chunk:
-            chunks.append({
-                'title': f"{base_title} (Part {chunk_index + 1})" if chunk_index > 0 else base_title,
-                'text': '\n\n'.join(current_chunk),
-                'char_count': current_size,
-                'order_index': chunk_index
-            })
+        if current_start is not None:
+            chunks.append(Section(
+                f"{base_title} (Part {chunk_index + 1})" if chunk_index > 0 else base_title,
+                text,
+                current_start,
+                current_end,
+                chunk_index
+            ))
         
         return chunks
     
@@ -133,6 +466,9 @@ class DocumentChunker:
         """
         Identify the type of policy section based on title and content.
         
+        Keywords in the title weigh more than keywords in the text; see
+        SectionClassifier for scores and confidence.
+        
         Args:
             section_title: Section title
             section_text: Section text content
@@ -140,29 +476,4 @@ class DocumentChunker:
         Returns:
             Section type string
         """
-        title_lower = section_title.lower()
-        text_lower = section_text.lower()
-        
-        # Check title first
-        if any(keyword in title_lower for keyword in ['coverage', 'covered', 'benefits']):
-            return 'COVERAGE_CRITERIA'
-        elif any(keyword in title_lower for keyword in ['exclusion', 'not covered', 'excluded']):
-            return 'EXCLUSIONS'
-        elif any(keyword in title_lower for keyword in ['requirement', 'documentation', 'medical necessity']):
-            return 'REQUIREMENTS'
-        elif any(keyword in title_lower for keyword in ['definition', 'terms', 'glossary']):
-            return 'DEFINITIONS'
-        elif any(keyword in title_lower for keyword in ['prior authorization', 'pre-authorization', 'preauth']):
-            return 'PRIOR_AUTHORIZATION'
-        elif any(keyword in title_lower for keyword in ['limitation', 'limit', 'frequency']):
-            return 'LIMITATIONS'
-        elif any(keyword in title_lower for keyword in ['appeal', 'grievance', 'dispute']):
-            return 'APPEALS_PROCESS'
-        
-        # Check content if title is ambiguous
-        if 'not covered' in text_lower or 'excluded' in text_lower:
-            return 'EXCLUSIONS'
-        elif 'covered when' in text_lower or 'coverage criteria' in text_lower:
-            return 'COVERAGE_CRITERIA'
-        
-        return 'OTHER'
+        return self.classifier.classify(section_title, section_text).section_type.value
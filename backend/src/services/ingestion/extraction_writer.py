@@ -0,0 +1,159 @@
+"""Bulk persistence of extraction results into sections, coverage criteria, and exclusions."""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Sequence
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...models.coverage_criteria import CoverageCriteria
+from ...models.exclusion import Exclusion
+from ...models.policy_section import PolicySection, SectionType
+from ..extraction.schemas import PolicySectionExtraction
+from .document_chunker import Section
+
+
+@dataclass(slots=True)
+class ExtractionRows:
+    """Column dictionaries for one policy's rows, parents before children."""
+    sections: List[Dict[str, any]] = field(default_factory=list)
+    coverage_criteria: List[Dict[str, any]] = field(default_factory=list)
+    exclusions: List[Dict[str, any]] = field(default_factory=list)
+
+
+class ExtractionWriter:
+    """
+    Write a policy's extraction with one multi-row INSERT per table.
+    
+    IDs are generated client-side, so criteria and exclusions reference
+    their section without a flush to learn its key, and no ORM objects are
+    built or tracked. Each table's rows go out as INSERT ... VALUES (...),
+    (...) RETURNING id; SQLAlchemy's insertmanyvalues pages them (1000 rows
+    or 32700 bound parameters per statement), so a typical policy takes
+    three round trips instead of one per row. Statements run in the
+    caller's transaction, and rows from an earlier attempt at the same
+    policy are deleted first, so a retried or re-queued job leaves exactly
+    one set.
+    """
+    
+    def build_rows(
+        self,
+        policy_document_id: UUID,
+        chunks: Sequence[Section],
+        section_results: Sequence[PolicySectionExtraction]
+    ) -> ExtractionRows:
+        """
+        Turn section results into row dictionaries with client-side IDs.
+        
+        Args:
+            policy_document_id: Parent policy document
+            chunks: Sections from DocumentChunker, in document order
+            section_results: One extraction per chunk
+        
+        Returns:
+            ExtractionRows ready to insert
+        """
+        rows = ExtractionRows()
+        now = datetime.utcnow()
+        
+        for order_index, (chunk, result) in enumerate(zip(chunks, section_results)):
+            section_id = uuid4()
+            
+            try:
+                section_type = SectionType(result.section_type)
+            except ValueError:
+                section_type = SectionType.OTHER
+            
+            rows.sections.append({
+                "id": section_id,
+                "policy_document_id": policy_document_id,
+                "section_type": section_type,
+                "section_number": result.section_number[:50] if result.section_number else None,
+                "title": (result.title or chunk.title)[:500],
+                "content_text": chunk.text,
+                "content_structured": result.model_dump(mode="json"),
+                "extraction_confidence_score": result.confidence_score,
+                "page_numbers": chunk.page_numbers or None,
+                "order_index": order_index,
+                "created_at": now,
+                "updated_at": now,
+            })
+            
+            for criteria in result.coverage_criteria:
+                rows.coverage_criteria.append({
+                    "id": uuid4(),
+                    "policy_section_id": section_id,
+                    "procedure_name": criteria.procedure_name[:500],
+                    "procedure_code": criteria.procedure_code[:50] if criteria.procedure_code else None,
+                    "covered_scenarios": criteria.covered_scenarios,
+                    "required_documentation": criteria.required_documentation,
+                    "prior_authorization_required": criteria.prior_authorization_required,
+                    "age_restrictions": criteria.age_restrictions[:200] if criteria.age_restrictions else None,
+                    "frequency_limitations": criteria.frequency_limitations[:200] if criteria.frequency_limitations else None,
+                    "extraction_confidence_score": criteria.confidence_score,
+                    "created_at": now,
+                    "updated_at": now,
+                })
+            
+            for exclusion in result.exclusions:
+                rows.exclusions.append({
+                    "id": uuid4(),
+                    "policy_section_id": section_id,
+                    "excluded_procedure": exclusion.excluded_procedure[:500],
+                    "exclusion_rationale": exclusion.exclusion_rationale,
+                    "exceptions_to_exclusion": exclusion.exceptions_to_exclusion,
+                    "extraction_confidence_score": exclusion.confidence_score,
+                    "created_at": now,
+                    "updated_at": now,
+                })
+        
+        return rows
+    
+    async def write(
+        self,
+        db: AsyncSession,
+        policy_document_id: UUID,
+        chunks: Sequence[Section],
+        section_results: Sequence[PolicySectionExtraction]
+    ) -> ExtractionRows:
+        """
+        Replace all rows for one policy in the session's transaction (not committed).
+        
+        Existing sections of the policy and their criteria and exclusions
+        are deleted before the insert (the foreign keys are RESTRICT, so
+        children go first).
+        
+        Args:
+            db: Database session
+            policy_document_id: Parent policy document (must already exist)
+            chunks: Sections from DocumentChunker, in document order
+            section_results: One extraction per chunk
+        
+        Returns:
+            The inserted rows
+        """
+        rows = self.build_rows(policy_document_id, chunks, section_results)
+        
+        existing_sections = select(PolicySection.id).where(PolicySection.policy_document_id == policy_document_id)
+        for table in (CoverageCriteria.__table__, Exclusion.__table__):
+            await db.execute(delete(table).where(table.c.policy_section_id.in_(existing_sections)))
+        await db.execute(
+            delete(PolicySection.__table__).where(PolicySection.policy_document_id == policy_document_id)
+        )
+        
+        for table, table_rows in (
+            (PolicySection.__table__, rows.sections),
+            (CoverageCriteria.__table__, rows.coverage_criteria),
+            (Exclusion.__table__, rows.exclusions),
+        ):
+            if not table_rows:
+                continue
+            
+            # RETURNING makes asyncpg use multi-row VALUES instead of one execute per row
+            result = await db.execute(insert(table).returning(table.c.id), table_rows)
+            inserted = len(result.all())
+            if inserted != len(table_rows):
+                raise RuntimeError(f"Inserted {inserted} of {len(table_rows)} {table.name} rows")
+        
+        return rows
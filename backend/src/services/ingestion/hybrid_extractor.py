@@ -0,0 +1,102 @@
+"""Hybrid text extraction that OCRs only the pages without usable native text."""
+from pathlib import Path
+from typing import Dict, List
+
+from .ocr_processor import OCRProcessor
+from .pdf_extractor import PDFExtractor
+
+
+def _visible_chars(text: str) -> int:
+    """Count non-whitespace characters, so layout spacing and blank lines do not count as text."""
+    return len("".join(text.split()))
+
+
+class HybridTextExtractor:
+    """Extract native text per page and fall back to OCR page by page."""
+    
+    def __init__(
+        self,
+        pdf_extractor: PDFExtractor | None = None,
+        ocr_processor: OCRProcessor | None = None,
+        min_chars_per_page: int = 50,
+        rasterize: bool = True
+    ):
+        """
+        Initialize hybrid extractor.
+        
+        Args:
+            pdf_extractor: Native text extractor (default: PDFExtractor)
+            ocr_processor: OCR processor for low-text pages (default: OCRProcessor)
+            min_chars_per_page: Pages with fewer non-whitespace characters of
+                native text are routed to OCR
+            rasterize: OCR rendered pages on a process pool; when False, OCR
+                only the embedded images of those pages
+        """
+        self.pdf_extractor = pdf_extractor or PDFExtractor()
+        self.ocr_processor = ocr_processor or OCRProcessor()
+        self.min_chars_per_page = min_chars_per_page
+        self.rasterize = rasterize
+    
+    def extract_text(self, pdf_path: str | Path) -> Dict[str, any]:
+        """
+        Extract text, running OCR only on low-text pages.
+        
+        Mixed documents (native-text body with scanned appendices) get OCR on
+        the scanned pages alone instead of all-or-nothing.
+        
+        Args:
+            pdf_path: Path to the PDF file
+        
+        Returns:
+            Same dictionary as PDFExtractor.extract_text(), plus:
+                - ocr_page_numbers: Pages whose text came from OCR (those
+                  pages also carry ocr_confidence, 0.0-1.0)
+        """
+        pdf_info = self.pdf_extractor.extract_text_parallel(pdf_path)
+        
+        low_text_pages = self.find_low_text_pages(pdf_info["pages"])
+        if not low_text_pages:
+            pdf_info["ocr_page_numbers"] = []
+            return pdf_info
+        
+        if self.rasterize:
+            ocr_result = self.ocr_processor.process_pdf_pages(pdf_path, low_text_pages)
+            ocr_pages = {page["page_number"]: page for page in ocr_result["pages"]}
+        else:
+            images = self.pdf_extractor.iter_images(pdf_path, page_numbers=low_text_pages)
+            ocr_pages = {
+                page["page_number"]: page
+                for page in self.ocr_processor.iter_pages_from_images(images)
+            }
+        
+        ocr_page_numbers = []
+        for page in pdf_info["pages"]:
+            ocr_page = ocr_pages.get(page["page_number"])
+            
+            # Keep native text if OCR found nothing better (e.g. a blank page)
+            if ocr_page and _visible_chars(ocr_page["text"]) > _visible_chars(page["text"]):
+                page["text"] = ocr_page["text"]
+                page["char_count"] = ocr_page["char_count"]
+                page["ocr_confidence"] = ocr_page["confidence"]
+                ocr_page_numbers.append(page["page_number"])
+        
+        pdf_info["full_text"] = "\n\n".join(page["text"] for page in pdf_info["pages"])
+        pdf_info["ocr_page_numbers"] = ocr_page_numbers
+        
+        return pdf_info
+    
+    def find_low_text_pages(self, pages: List[Dict[str, any]]) -> List[int]:
+        """
+        Find pages whose native text is below the OCR threshold.
+        
+        Args:
+            pages: Page dictionaries from PDFExtractor.extract_text()
+        
+        Returns:
+            1-based page numbers to OCR
+        """
+        return [
+            page["page_number"]
+            for page in pages
+            if _visible_chars(page["text"]) < self.min_chars_per_page
+        ]
@@ -0,0 +1,249 @@
+"""Content-addressed cache for OCR results (in-memory LRU backed by local disk)."""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict
+
+import pytesseract
+
+
+@lru_cache(maxsize=1)
+def tesseract_engine_id() -> str:
+    """Identify the installed Tesseract build so upgrades invalidate cached results."""
+    try:
+        return f"tesseract-{pytesseract.get_tesseract_version()}"
+    except Exception:
+        return "tesseract-unknown"
+
+
+class OCRCache:
+    """
+    Cache OCR results keyed by a hash of the image bytes and OCR settings.
+    
+    Lookups check a bounded in-memory LRU first, then a directory of JSON
+    files. Disk entries are evicted least-recently-used first (by mtime,
+    which is refreshed on every hit) once the directory exceeds its budget.
+    Writes are atomic, so several worker processes can share one directory.
+    
+    Each process keeps its own memory LRU and its own estimate of the
+    directory size: measured by the first prune() (on its first write),
+    then advanced by its own writes. Only when the estimate passes the
+    budget is the directory scanned again, so writes do not glob the cache.
+    """
+    
+    def __init__(
+        self,
+        cache_dir: str | Path | None = None,
+        max_memory_entries: int = 1024,
+        max_disk_mb: int = 512
+    ):
+        """
+        Initialize OCR cache.
+        
+        Args:
+            cache_dir: Directory for persisted results (None: memory only)
+            max_memory_entries: Entries kept in the in-memory LRU (0 disables it)
+            max_disk_mb: Size budget for the cache directory
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_mb * 1024 * 1024
+        
+        self._memory: OrderedDict[str, Dict[str, any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes: int | None = None
+        
+        self.hits = 0
+        self.misses = 0
+        
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def __getstate__(self) -> Dict[str, any]:
+        """Pickle only the configuration; each worker process measures and fills its own copy."""
+        state = self.__dict__.copy()
+        state["_memory"] = OrderedDict()
+        state["_disk_bytes"] = None
+        state["hits"] = 0
+        state["misses"] = 0
+        del state["_lock"]
+        return state
+    
+    def __setstate__(self, state: Dict[str, any]) -> None:
+        """Restore a pickled cache with a fresh lock."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(image_bytes: bytes, language: str, engine: str | None = None, **options) -> str:
+        """
+        Build a cache key from image content and everything that affects OCR output.
+        
+        Args:
+            image_bytes: Encoded image or raw pixel data
+            language: Tesseract language code
+            engine: Engine identifier (default: installed Tesseract version)
+            **options: Extra settings that change the output (e.g. image size)
+        
+        Returns:
+            Hex SHA-256 digest
+        """
+        hasher = hashlib.sha256(image_bytes)
+        settings_part = json.dumps(
+            {"language": language, "engine": engine or tesseract_engine_id(), **options},
+            sort_keys=True
+        )
+        hasher.update(settings_part.encode("utf-8"))
+        return hasher.hexdigest()
+    
+    def get(self, key: str) -> Dict[str, any] | None:
+        """
+        Look up a cached OCR result.
+        
+        Args:
+            key: Key from make_key()
+        
+        Returns:
+            The cached result, or None on a miss
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+        
+        result = self._read_disk(key)
+        
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            
+            self.hits += 1
+            self._remember(key, result)
+            return result
+    
+    def record_lookup(self, hit: bool) -> None:
+        """
+        Count a lookup made by a worker process's copy of this cache.
+        
+        Args:
+            hit: Whether the worker's copy served the result
+        """
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+    
+    def put(self, key: str, result: Dict[str, any]) -> None:
+        """
+        Store an OCR result in memory and on disk.
+        
+        Args:
+            key: Key from make_key()
+            result: OCR result dictionary (must be JSON-serializable)
+        """
+        with self._lock:
+            self._remember(key, result)
+        
+        if self.cache_dir:
+            self._write_disk(key, result)
+    
+    def prune(self) -> int:
+        """
+        Evict least-recently-used disk entries until the directory fits its budget.
+        
+        Returns:
+            Number of entries removed
+        """
+        if not self.cache_dir:
+            return 0
+        
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass  # Already evicted by another process
+            total -= size
+        
+        with self._lock:
+            self._disk_bytes = total
+        
+        return removed
+    
+    def _remember(self, key: str, result: Dict[str, any]) -> None:
+        """Insert into the in-memory LRU (caller holds the lock)."""
+        if self.max_memory_entries <= 0:
+            return
+        
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+    
+    def _path_for(self, key: str) -> Path:
+        """Shard files by key prefix to keep directories small."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+    
+    def _read_disk(self, key: str) -> Dict[str, any] | None:
+        """Load a persisted result and mark it recently used."""
+        if not self.cache_dir:
+            return None
+        
+        path = self._path_for(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = json.load(f)
+            os.utime(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        
+        return result
+    
+    def _write_disk(self, key: str, result: Dict[str, any]) -> None:
+        """Persist a result atomically, pruning when the budget is exceeded."""
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".part")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(result, f)
+            size = os.path.getsize(temp_path)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        
+        if self._disk_bytes is None:
+            self.prune()
+            return
+        
+        with self._lock:
+            self._disk_bytes += size
+            over_budget = self._disk_bytes > self.max_disk_bytes
+        
+        if over_budget:
+            self.prune()
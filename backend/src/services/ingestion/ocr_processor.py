@@ -1,22 +1,267 @@
 """OCR processing using pytesseract for scanned/image-based PDFs."""
+import pymupdf  # PyMuPDF
 import pytesseract
 from PIL import Image
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Tuple
 import io
+import os
+import threading
+import time
+
+from .ocr_cache import OCRCache
+
+
+def _run_ocr(image: Image.Image, language: str) -> Dict[str, any]:
+    """
+    Run a single Tesseract pass returning text, word confidences, and boxes.
+    
+    Text is rebuilt from the word-level output: words joined by spaces,
+    lines by newlines, and paragraphs by blank lines.
+    
+    Returns:
+        Dictionary with text, words (text, confidence, bbox), and confidence
+    """
+    data = pytesseract.image_to_data(image, lang=language, output_type=pytesseract.Output.DICT)
+    
+    words = []
+    lines = []
+    current_line = None
+    current_paragraph = None
+    
+    for i, word_text in enumerate(data["text"]):
+        conf = float(data["conf"][i])
+        
+        # -1 marks layout rows (blocks, lines) rather than recognized words
+        if conf < 0 or not word_text.strip():
+            continue
+        
+        paragraph_key = (data["block_num"][i], data["par_num"][i])
+        line_key = paragraph_key + (data["line_num"][i],)
+        
+        if line_key != current_line:
+            if current_paragraph is not None and paragraph_key != current_paragraph:
+                lines.append("")
+            lines.append(word_text)
+            current_line = line_key
+            current_paragraph = paragraph_key
+        else:
+            lines[-1] += " " + word_text
+        
+        words.append({
+            "text": word_text,
+            "confidence": conf / 100.0,
+            "bbox": (
+                data["left"][i],
+                data["top"][i],
+                data["left"][i] + data["width"][i],
+                data["top"][i] + data["height"][i]
+            )
+        })
+    
+    confidence = sum(w["confidence"] for w in words) / len(words) if words else 0.0
+    
+    return {
+        "text": "\n".join(lines),
+        "words": words,
+        "confidence": confidence
+    }
+
+
+def _ocr_rendered_page(
+    pdf_path: str,
+    page_number: int,
+    dpi: int,
+    language: str,
+    cache: OCRCache | None = None
+) -> Tuple[int, Dict[str, any], float]:
+    """
+    Rasterize one page and OCR it in a worker process.
+    
+    Rendering happens in the worker so only the page number and resulting
+    text cross the process boundary, not the pixmap. With a cache, the
+    rendered pixels are hashed and Tesseract only runs on a miss.
+    
+    Returns:
+        Tuple of (page_number, OCR result from _run_ocr, seconds spent)
+    """
+    start = time.perf_counter()
+    
+    doc = pymupdf.open(pdf_path)
+    try:
+        pixmap = doc[page_number - 1].get_pixmap(dpi=dpi)
+    finally:
+        doc.close()
+    
+    key = None
+    if cache:
+        key = cache.make_key(pixmap.samples, language, width=pixmap.width, height=pixmap.height)
+        result = cache.get(key)
+        if result is not None:
+            return page_number, result, time.perf_counter() - start
+    
+    image = Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples)
+    result = _run_ocr(image, language)
+    
+    if cache:
+        cache.put(key, result)
+    
+    return page_number, result, time.perf_counter() - start
+
+
+# Set once per pool process by _init_worker, so tasks do not each carry a pickled copy
+_worker_cache: OCRCache | None = None
+
+
+def _init_worker(cache: OCRCache | None) -> None:
+    """Install the OCR cache of a pool process when the process starts."""
+    global _worker_cache
+    _worker_cache = cache
+
+
+def _ocr_page_in_worker(
+    pdf_path: str,
+    page_number: int,
+    dpi: int,
+    language: str
+) -> Tuple[int, Dict[str, any], float, bool | None]:
+    """
+    Run _ocr_rendered_page in a pool process with the process's cache.
+    
+    The cache lives as long as the process, so its memory LRU and disk
+    size accounting carry over between pages and documents.
+    
+    Returns:
+        _ocr_rendered_page's tuple plus whether the cache served the page
+        (None without a cache)
+    """
+    hits = _worker_cache.hits if _worker_cache else 0
+    page_number, result, seconds = _ocr_rendered_page(pdf_path, page_number, dpi, language, _worker_cache)
+    return page_number, result, seconds, _worker_cache.hits > hits if _worker_cache else None
 
 
 class OCRProcessor:
     """Process scanned PDFs using OCR (Optical Character Recognition)."""
     
-    def __init__(self, language: str = "eng"):
+    def __init__(
+        self,
+        language: str = "eng",
+        dpi: int = 300,
+        max_workers: int | None = None,
+        cache: OCRCache | None = None
+    ):
         """
         Initialize OCR processor.
         
         Args:
             language: Tesseract language code (default: 'eng' for English)
+            dpi: Rasterization resolution for process_pdf_pages()
+            max_workers: OCR process pool size (default: CPU count)
+            cache: Result cache for repeated images (default: no caching)
         """
         self.language = language
+        self.dpi = dpi
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache = cache
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+    
+    def shutdown(self) -> None:
+        """Stop the OCR worker processes, if process_pdf_pages started them."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Process pool shared by every process_pdf_pages call, started on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(self.cache,)
+                )
+            return self._executor
+    
+    def process_pdf_pages(
+        self,
+        pdf_path: str | Path,
+        page_numbers: Iterable[int] | None = None
+    ) -> Dict[str, any]:
+        """
+        Rasterize PDF pages and OCR them on a bounded process pool.
+        
+        Unlike process_images_from_pdf(), this sees the whole rendered page
+        (including scanned content not stored as a single embedded image) and
+        uses every available core. Results are merged in page order. Pages
+        run on one pool of max_workers processes shared by all calls, so
+        concurrent documents queue for the same workers.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            page_numbers: 1-based pages to OCR (default: all pages)
+            
+        Returns:
+            Dictionary containing:
+                - full_text: Complete OCR text
+                - pages: List of page texts with confidence and duration_seconds
+                - page_count: Number of pages processed
+                - confidence: Word-weighted mean OCR confidence (0.0-1.0)
+                - elapsed_seconds: Wall-clock time for the whole batch
+                - pages_per_second: Throughput
+        """
+        pdf_path = Path(pdf_path)
+        
+        if page_numbers is None:
+            doc = pymupdf.open(pdf_path)
+            try:
+                page_numbers = range(1, len(doc) + 1)
+            finally:
+                doc.close()
+        
+        page_numbers = sorted(set(page_numbers))
+        start = time.perf_counter()
+        
+        if not page_numbers:
+            results = []
+        elif len(page_numbers) == 1 or self.max_workers == 1:
+            results = [
+                _ocr_rendered_page(str(pdf_path), page_num, self.dpi, self.language, self.cache)
+                for page_num in page_numbers
+            ]
+        else:
+            outcomes = list(self._get_executor().map(
+                _ocr_page_in_worker,
+                [str(pdf_path)] * len(page_numbers),
+                page_numbers,
+                [self.dpi] * len(page_numbers),
+                [self.language] * len(page_numbers)
+            ))
+            results = [outcome[:3] for outcome in outcomes]
+            
+            # Lookups ran on the workers' copies; count them on this one too
+            if self.cache:
+                for *_, hit in outcomes:
+                    self.cache.record_lookup(hit)
+        
+        elapsed = time.perf_counter() - start
+        
+        pages = []
+        for page_num, result, duration in results:
+            page = self._page_record(page_num, [result])
+            page["duration_seconds"] = duration
+            pages.append(page)
+        
+        return {
+            "full_text": "\n\n".join(page["text"] for page in pages),
+            "pages": pages,
+            "page_count": len(pages),
+            "confidence": self._average_confidence(pages),
+            "elapsed_seconds": elapsed,
+            "pages_per_second": len(pages) / elapsed if elapsed > 0 else 0.0
+        }
     
     def process_image(self, image_data: bytes, image_format: str = "PNG") -> str:
         """
@@ -29,82 +274,144 @@ class OCRProcessor:
         Returns:
             Extracted text
         """
+        return self.process_image_detailed(image_data)["text"]
+    
+    def process_image_detailed(self, image_data: bytes) -> Dict[str, any]:
+        """
+        Extract text, per-word confidences, and bounding boxes in one OCR pass.
+        
+        Args:
+            image_data: Image bytes
+            
+        Returns:
+            Dictionary containing:
+                - text: Extracted text
+                - words: List of dicts with text, confidence (0.0-1.0), and
+                  bbox (left, top, right, bottom) in image pixels
+                - confidence: Mean word confidence (0.0-1.0)
+        """
+        key = None
+        if self.cache:
+            key = self.cache.make_key(image_data, self.language)
+            result = self.cache.get(key)
+            if result is not None:
+                return result
+        
         # Convert bytes to PIL Image
         image = Image.open(io.BytesIO(image_data))
+        result = _run_ocr(image, self.language)
         
-        # Perform OCR
-        text = pytesseract.image_to_string(image, lang=self.language)
+        if self.cache:
+            self.cache.put(key, result)
         
-        return text
+        return result
     
-    def process_images_from_pdf(self, images: List[Dict]) -> Dict[str, any]:
+    def process_images_from_pdf(self, images: Iterable[Dict]) -> Dict[str, any]:
         """
         Process multiple images extracted from a PDF.
         
+        Images are consumed one at a time, so passing PDFExtractor.iter_images()
+        keeps only the current image's bytes in memory.
+        
         Args:
-            images: List of image dictionaries from PDFExtractor.extract_images()
+            images: Image dictionaries from PDFExtractor.extract_images() or iter_images()
             
         Returns:
             Dictionary containing:
                 - full_text: Complete OCR text
-                - pages: List of page texts
+                - pages: List of page texts with page-level confidence
                 - page_count: Number of pages processed
+                - confidence: Word-weighted mean OCR confidence (0.0-1.0)
         """
-        pages_text = {}
+        pages_results = {}
         
         for img_data in images:
             page_num = img_data["page_number"]
             image_bytes = img_data["image_data"]
             
-            # Perform OCR on image
-            text = self.process_image(image_bytes)
+            # Perform OCR on image (text and confidences in one pass)
+            result = self.process_image_detailed(image_bytes)
             
-            # Aggregate text by page
-            if page_num not in pages_text:
-                pages_text[page_num] = []
-            pages_text[page_num].append(text)
+            # Aggregate results by page
+            if page_num not in pages_results:
+                pages_results[page_num] = []
+            pages_results[page_num].append(result)
         
         # Combine text for each page
-        pages = []
-        full_text_parts = []
-        
-        for page_num in sorted(pages_text.keys()):
-            page_text = "\n".join(pages_text[page_num])
-            pages.append({
-                "page_number": page_num,
-                "text": page_text,
-                "char_count": len(page_text)
-            })
-            full_text_parts.append(page_text)
+        pages = [
+            self._page_record(page_num, pages_results[page_num])
+            for page_num in sorted(pages_results.keys())
+        ]
         
-        full_text = "\n\n".join(full_text_parts)
+        full_text = "\n\n".join(page["text"] for page in pages)
         
         return {
             "full_text": full_text,
             "pages": pages,
-            "page_count": len(pages)
+            "page_count": len(pages),
+            "confidence": self._average_confidence(pages)
         }
     
-    def get_confidence(self, image_data: bytes) -> float:
+    def iter_pages_from_images(self, images: Iterable[Dict]) -> Iterator[Dict[str, any]]:
         """
-        Get OCR confidence score for an image.
+        OCR images and yield one page record as soon as each page is complete.
+        
+        Expects images grouped by page in ascending order, as produced by
+        PDFExtractor.iter_images().
         
         Args:
-            image_data: Image bytes
+            images: Image dictionaries in page order
             
-        Returns:
-            Confidence score (0.0 to 1.0)
+        Yields:
+            Dictionaries with page_number, text, char_count, confidence, and word_count
         """
-        image = Image.open(io.BytesIO(image_data))
+        current_page = None
+        current_results = []
         
-        # Get detailed OCR data including confidence
-        data = pytesseract.image_to_data(image, lang=self.language, output_type=pytesseract.Output.DICT)
+        for img_data in images:
+            page_num = img_data["page_number"]
+            
+            if current_page is not None and page_num != current_page:
+                yield self._page_record(current_page, current_results)
+                current_results = []
+            
+            current_page = page_num
+            current_results.append(self.process_image_detailed(img_data["image_data"]))
         
-        # Calculate average confidence (excluding -1 values which indicate no text)
-        confidences = [int(conf) for conf in data['conf'] if int(conf) != -1]
+        if current_page is not None:
+            yield self._page_record(current_page, current_results)
+    
+    def _page_record(self, page_num: int, results: List[Dict[str, any]]) -> Dict[str, any]:
+        """Combine OCR results of a page's images into a page record."""
+        page_text = "\n".join(result["text"] for result in results)
+        word_count = sum(len(result["words"]) for result in results)
+        confidence_total = sum(result["confidence"] * len(result["words"]) for result in results)
         
-        if not confidences:
+        return {
+            "page_number": page_num,
+            "text": page_text,
+            "char_count": len(page_text),
+            "confidence": confidence_total / word_count if word_count else 0.0,
+            "word_count": word_count
+        }
+    
+    def _average_confidence(self, pages: List[Dict[str, any]]) -> float:
+        """Word-weighted mean confidence across page records."""
+        word_count = sum(page["word_count"] for page in pages)
+        if not word_count:
             return 0.0
         
-        avg_confidence = sum(confidences) / len(confidences)
-        return avg_confidence / 100.0  # Convert to 0.0-1.0 range
+        return sum(page["confidence"] * page["word_count"] for page in pages) / word_count
+    
+    def get_confidence(self, image_data: bytes) -> float:
+        """
+        Get OCR confidence score for an image.
+        
+        Args:
+            image_data: Image bytes
+            
+        Returns:
+            Confidence score (0.0 to 1.0)
+        """
+        # Prefer process_image_detailed() when the text is also needed
+        return self.process_image_detailed(image_data)["confidence"]
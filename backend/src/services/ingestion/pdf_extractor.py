@@ -1,12 +1,57 @@
 """PDF text extraction using pymupdf for text-based PDFs."""
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 import pymupdf  # PyMuPDF
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List
+
+
+def _extract_page_range(pdf_path: str, start: int, end: int) -> List[str]:
+    """
+    Extract text for pages [start, end) in a worker process.
+    
+    Each worker opens the document itself; pymupdf documents cannot be
+    shared across processes.
+    """
+    doc = pymupdf.open(pdf_path)
+    try:
+        return [doc[page_num].get_text() for page_num in range(start, end)]
+    finally:
+        doc.close()
 
 
 class PDFExtractor:
     """Extract text from text-based PDF documents."""
     
+    def __init__(self, max_workers: int | None = None, min_pages_per_worker: int = 16):
+        """
+        Initialize PDF extractor.
+        
+        Args:
+            max_workers: Process count for extract_text_parallel (default: CPU count)
+            min_pages_per_worker: Smallest page range worth sending to a process;
+                documents below this run serially
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_pages_per_worker = min_pages_per_worker
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+    
+    def shutdown(self) -> None:
+        """Stop the worker processes, if extract_text_parallel started them."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Process pool shared by every extract_text_parallel call, started on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+    
     def extract_text(self, pdf_path: str | Path) -> Dict[str, any]:
         """
         Extract text from a PDF file.
@@ -31,45 +76,127 @@ class PDFExtractor:
         doc = pymupdf.open(pdf_path)
         
         try:
-            # Extract metadata
-            metadata = {
-                "title": doc.metadata.get("title", ""),
-                "author": doc.metadata.get("author", ""),
-                "subject": doc.metadata.get("subject", ""),
-                "creator": doc.metadata.get("creator", ""),
-                "producer": doc.metadata.get("producer", ""),
-                "creation_date": doc.metadata.get("creationDate", ""),
-                "mod_date": doc.metadata.get("modDate", ""),
-            }
+            metadata = self._extract_metadata(doc)
             
             # Extract text from each page
-            pages = []
-            full_text_parts = []
+            page_texts = [doc[page_num].get_text() for page_num in range(len(doc))]
             
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                page_text = page.get_text()
-                pages.append({
-                    "page_number": page_num + 1,
-                    "text": page_text,
-                    "char_count": len(page_text)
-                })
-                full_text_parts.append(page_text)
-            
-            full_text = "\n\n".join(full_text_parts)
+            return self._build_result(pdf_path, page_texts, metadata)
             
-            # Determine if PDF is text-based (has extractable text)
-            is_text_based = len(full_text.strip()) > 100  # Arbitrary threshold
+        finally:
+            doc.close()
+    
+    def extract_text_parallel(self, pdf_path: str | Path) -> Dict[str, any]:
+        """
+        Extract text from a PDF file, splitting the page range across processes.
+        
+        Pages are reassembled in order, so the result is identical to
+        extract_text(). Small documents fall back to serial extraction since
+        the inter-process round trip would dominate. Ranges run on one pool
+        of max_workers processes shared by all calls, so concurrent documents
+        queue for the same workers instead of each starting a pool.
+        
+        Args:
+            pdf_path: Path to the PDF file
             
-            return {
-                "full_text": full_text,
-                "pages": pages,
-                "page_count": len(doc),
-                "metadata": metadata,
-                "is_text_based": is_text_based,
-                "file_size_bytes": pdf_path.stat().st_size
+        Returns:
+            Same dictionary as extract_text()
+        """
+        pdf_path = Path(pdf_path)
+        
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        doc = pymupdf.open(pdf_path)
+        try:
+            page_count = len(doc)
+            metadata = self._extract_metadata(doc)
+        finally:
+            doc.close()
+        
+        workers = min(self.max_workers, page_count // self.min_pages_per_worker)
+        if workers <= 1:
+            return self.extract_text(pdf_path)
+        
+        # Contiguous, evenly sized page ranges; one task per worker
+        step = -(-page_count // workers)
+        ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+        
+        executor = self._get_executor()
+        futures = [
+            executor.submit(_extract_page_range, str(pdf_path), start, end)
+            for start, end in ranges
+        ]
+        page_texts = [text for future in futures for text in future.result()]
+        
+        return self._build_result(pdf_path, page_texts, metadata)
+    
+    def _extract_metadata(self, doc) -> Dict[str, str]:
+        """Extract document-level metadata from an open pymupdf document."""
+        return {
+            "title": doc.metadata.get("title", ""),
+            "author": doc.metadata.get("author", ""),
+            "subject": doc.metadata.get("subject", ""),
+            "creator": doc.metadata.get("creator", ""),
+            "producer": doc.metadata.get("producer", ""),
+            "creation_date": doc.metadata.get("creationDate", ""),
+            "mod_date": doc.metadata.get("modDate", ""),
+        }
+    
+    def _build_result(self, pdf_path: Path, page_texts: List[str], metadata: Dict[str, str]) -> Dict[str, any]:
+        """Assemble the extract_text() result from ordered page texts."""
+        pages = [
+            {
+                "page_number": page_num + 1,
+                "text": page_text,
+                "char_count": len(page_text)
             }
+            for page_num, page_text in enumerate(page_texts)
+        ]
+        
+        full_text = "\n\n".join(page_texts)
+        
+        # Determine if PDF is text-based (has extractable text)
+        is_text_based = len(full_text.strip()) > 100  # Arbitrary threshold
+        
+        return {
+            "full_text": full_text,
+            "pages": pages,
+            "page_count": len(page_texts),
+            "metadata": metadata,
+            "is_text_based": is_text_based,
+            "file_size_bytes": pdf_path.stat().st_size
+        }
+    
+    def iter_pages(self, pdf_path: str | Path) -> Iterator[Dict[str, any]]:
+        """
+        Yield page records one at a time as they are decoded.
+        
+        Unlike extract_text(), nothing is accumulated, so downstream stages
+        can start on the first page while later pages are still being read
+        and peak memory stays around a single page.
+        
+        Args:
+            pdf_path: Path to the PDF file
             
+        Yields:
+            Dictionaries with page_number, text, and char_count
+        """
+        pdf_path = Path(pdf_path)
+        
+        if not pdf_path.exists():
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        
+        doc = pymupdf.open(pdf_path)
+        
+        try:
+            for page_num in range(len(doc)):
+                page_text = doc[page_num].get_text()
+                yield {
+                    "page_number": page_num + 1,
+                    "text": page_text,
+                    "char_count": len(page_text)
+                }
         finally:
             doc.close()
     
@@ -83,13 +210,33 @@ class PDFExtractor:
         Returns:
             List of dictionaries containing image data
         """
+        return list(self.iter_images(pdf_path))
+    
+    def iter_images(
+        self,
+        pdf_path: str | Path,
+        page_numbers: Iterable[int] | None = None
+    ) -> Iterator[Dict]:
+        """
+        Yield embedded images one at a time, in page order.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            page_numbers: 1-based pages to read images from (default: all pages)
+            
+        Yields:
+            Dictionaries containing image data (same shape as extract_images())
+        """
         pdf_path = Path(pdf_path)
         doc = pymupdf.open(pdf_path)
         
-        images = []
-        
         try:
-            for page_num in range(len(doc)):
+            if page_numbers is None:
+                page_indexes = range(len(doc))
+            else:
+                page_indexes = sorted(n - 1 for n in set(page_numbers) if 0 < n <= len(doc))
+            
+            for page_num in page_indexes:
                 page = doc[page_num]
                 image_list = page.get_images()
                 
@@ -97,16 +244,14 @@ class PDFExtractor:
                     xref = img[0]
                     base_image = doc.extract_image(xref)
                     
-                    images.append({
+                    yield {
                         "page_number": page_num + 1,
                         "image_index": img_index,
                         "image_data": base_image["image"],
                         "image_ext": base_image["ext"],
                         "width": base_image["width"],
                         "height": base_image["height"]
-                    })
-            
-            return images
+                    }
             
         finally:
             doc.close()
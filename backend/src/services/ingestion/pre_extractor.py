@@ -0,0 +1,230 @@
+"""Deterministic pre-extraction of codes, dates, and policy numbers before the LLM."""
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, List, Sequence
+
+
+_MONTHS = {
+    name: number
+    for number, names in enumerate([
+        ("january", "jan"), ("february", "feb"), ("march", "mar"), ("april", "apr"),
+        ("may",), ("june", "jun"), ("july", "jul"), ("august", "aug"),
+        ("september", "sept", "sep"), ("october", "oct"), ("november", "nov"), ("december", "dec"),
+    ], start=1)
+    for name in names
+}
+
+_DATE = (
+    r"(?:\d{4}-\d{1,2}-\d{1,2}"
+    r"|\d{1,2}/\d{1,2}/\d{4}"
+    r"|(?i:" + "|".join(sorted(_MONTHS, key=len, reverse=True)) + r")\.?\s+\d{1,2},?\s+\d{4})"
+)
+
+# A code in a range like 27440-27447 or 27440 through 27447
+_CPT_CODE = r"\d{4}[0-9FTU]"
+
+# One alternation scanned once per document, tried only at word starts.
+# Order matters where forms overlap: dates before CPT codes (years), ICD-10
+# (always dotted here, to keep section numbers and HCPCS out) before HCPCS.
+_PATTERN = re.compile(
+    r"\b(?:"
+    r"(?P<date>"
+    r"(?:(?P<date_label>(?i:effective(?:\s+date)?|expiration\s+date|expiry\s+date|expires"
+    r"|termination\s+date|end\s+date))\s*:?\s*(?:(?i:on)\s+)?)?"
+    + _DATE +
+    r")"
+    r"|(?P<policy_number>(?i:(?:medical\s+|clinical\s+|coverage\s+|payment\s+)?policy\s*"
+    r"(?:number|no\.?|#|id))\s*[:#]?\s*[A-Z0-9][A-Z0-9._/-]{2,40})"
+    r"|(?P<icd10>\b[A-Z]\d[0-9A-Z]\.[0-9A-Z]{1,4}\b)"
+    r"|(?P<hcpcs>\b[A-V]\d{4}\b)"
+    r"|(?P<cpt>(?<![\w$.,/-])" + _CPT_CODE
+    + r"(?:\s*(?:-|\u2013|\u2014|(?i:to|through))\s*" + _CPT_CODE + r")?\b(?![.,/-]\d))"
+    r")"
+)
+_CPT_RANGE_SEPARATOR = re.compile(r"\s*(?:-|\u2013|\u2014|\b(?i:to|through)\b)\s*")
+
+# Plain five-digit numbers count as CPT codes only with one of these before
+# them on the same line, alone in parentheses after a procedure name, or at
+# the start of a line (a code table row)
+_CPT_CONTEXT = re.compile(r"\b(?i:cpt|hcpcs|codes?|procedures?)\b")
+_CPT_LINE_START = re.compile(r"[\s*\u2022|-]*$")
+# Phone extensions, form and box numbers, and ZIP codes ("Chicago, IL 60601")
+_NOT_CPT_BEFORE = re.compile(r"(?:(?i:\b(?:ext|extension|phone|tel|fax|form|box|suite|ste|zip)\.?)|#)\s*:?\s*$|,\s*[A-Z]{2}\s+$")
+
+# How far back on a line to look for context
+_CPT_CONTEXT_CHARS = 120
+_POLICY_NUMBER_VALUE = re.compile(r"[A-Z0-9][A-Z0-9._/-]{2,40}$")
+_EXPIRATION_LABELS = ("expir", "termination", "end")
+
+_KINDS = ("date", "policy_number", "icd10", "hcpcs", "cpt")
+
+
+@dataclass(slots=True)
+class PreExtraction:
+    """Values found by pattern matching, in order of first appearance."""
+    policy_number: str | None = None
+    effective_date: date | None = None
+    expiration_date: date | None = None
+    dates: List[date] = field(default_factory=list)
+    cpt_codes: List[str] = field(default_factory=list)
+    hcpcs_codes: List[str] = field(default_factory=list)
+    icd10_codes: List[str] = field(default_factory=list)
+    
+    @property
+    def procedure_codes(self) -> List[str]:
+        """CPT and HCPCS codes."""
+        return self.cpt_codes + self.hcpcs_codes
+    
+    @property
+    def has_codes(self) -> bool:
+        """Whether any procedure or diagnosis code was found."""
+        return bool(self.cpt_codes or self.hcpcs_codes or self.icd10_codes)
+
+
+class PreExtractor:
+    """
+    Pull dates, policy numbers, and CPT/HCPCS/ICD-10 codes out of policy text.
+    
+    All patterns are alternatives of one regex, so a document is scanned
+    once. Values found here are facts the LLM would otherwise be asked to
+    copy out of the text; sections without codes are candidates to skip the
+    LLM entirely.
+    
+    Code patterns favor precision: CPT codes are five characters not
+    embedded in amounts or dates. Category II/III and PLA codes (ending in
+    F, T, or U) are distinctive enough alone; plain five-digit numbers need
+    code context (CPT, HCPCS, "code", or "procedure" earlier on the line,
+    parentheses of their own, a code table row, or a code range) and are
+    never taken right after a phone, form, or ZIP context. ICD-10 codes
+    need their decimal point.
+    """
+    
+    def extract(self, text: str, metadata: Dict[str, str] | None = None) -> PreExtraction:
+        """
+        Pre-extract one text.
+        
+        Args:
+            text: Document or section text
+            metadata: PDF metadata (from PDFExtractor); title, subject, and
+                keywords are searched for a policy number the text lacks
+        
+        Returns:
+            PreExtraction
+        """
+        result = PreExtraction()
+        for match in _PATTERN.finditer(text):
+            _add_match(result, match)
+        
+        if metadata and result.policy_number is None:
+            for key in ("title", "subject", "keywords"):
+                for match in _PATTERN.finditer(metadata.get(key) or ""):
+                    if match.group("policy_number"):
+                        _add_match(result, match)
+                        break
+                if result.policy_number:
+                    break
+        
+        return result
+    
+    def extract_sections(self, sections: Sequence) -> List[PreExtraction]:
+        """
+        Pre-extract all sections of a document.
+        
+        Sections that share a source string (Section records from
+        DocumentChunker) are served from a single scan of that source, with
+        each match attributed to every section whose span contains it.
+        
+        Args:
+            sections: Section records with source, start, and end
+        
+        Returns:
+            One PreExtraction per section, in input order
+        """
+        results = [PreExtraction() for _ in sections]
+        
+        by_source: Dict[int, List[int]] = {}
+        for index, section in enumerate(sections):
+            by_source.setdefault(id(section.source), []).append(index)
+        
+        for indexes in by_source.values():
+            indexes.sort(key=lambda index: sections[index].start)
+            source = sections[indexes[0]].source
+            starts = [sections[index].start for index in indexes]
+            scan_end = max(sections[index].end for index in indexes)
+            
+            for match in _PATTERN.finditer(source, starts[0], scan_end):
+                # Walk back over sections starting at or before the match (parts may overlap)
+                slot = bisect_right(starts, match.start()) - 1
+                while slot >= 0:
+                    section = sections[indexes[slot]]
+                    if section.end < match.end():
+                        break
+                    _add_match(results[indexes[slot]], match)
+                    slot -= 1
+        
+        return results
+
+
+def _add_match(result: PreExtraction, match: re.Match) -> None:
+    """Record one pattern match on a PreExtraction (first occurrence wins)."""
+    kind = next(kind for kind in _KINDS if match.group(kind))
+    value = match.group(kind)
+    
+    if kind == "date":
+        label = (match.group("date_label") or "").lower()
+        parsed = _parse_date(value[len(match.group("date_label") or ""):])
+        if parsed is None:
+            return
+        if parsed not in result.dates:
+            result.dates.append(parsed)
+        if label.startswith("effective") and result.effective_date is None:
+            result.effective_date = parsed
+        elif label.startswith(_EXPIRATION_LABELS) and result.expiration_date is None:
+            result.expiration_date = parsed
+    elif kind == "policy_number":
+        number = _POLICY_NUMBER_VALUE.search(value)
+        if result.policy_number is None and number and any(char.isdigit() for char in number.group()):
+            result.policy_number = number.group().rstrip(".")
+    elif kind == "cpt":
+        endpoints = _CPT_RANGE_SEPARATOR.split(value)
+        if len(endpoints) == 1 and not value.endswith(("F", "T", "U")) and not _has_cpt_context(match):
+            return
+        for code in endpoints:
+            if code not in result.cpt_codes:
+                result.cpt_codes.append(code)
+    else:
+        codes = getattr(result, f"{kind}_codes")
+        if value not in codes:
+            codes.append(value)
+
+
+def _has_cpt_context(match: re.Match) -> bool:
+    """Whether a plain five-digit match reads as a CPT code rather than some other number."""
+    text = match.string
+    line_start = text.rfind("\n", 0, match.start()) + 1
+    before = text[max(line_start, match.start() - _CPT_CONTEXT_CHARS):match.start()]
+    
+    if _NOT_CPT_BEFORE.search(before):
+        return False
+    if before.endswith("(") and text.startswith(")", match.end()):
+        return True
+    return bool(_CPT_LINE_START.fullmatch(before) or _CPT_CONTEXT.search(before))
+
+
+def _parse_date(value: str) -> date | None:
+    """Parse an ISO, US numeric, or month-name date (None when not a real date)."""
+    value = re.sub(r"^[\s:]*(?:on\s+)?", "", value, flags=re.IGNORECASE)
+    try:
+        if "-" in value:
+            year, month, day = (int(part) for part in value.split("-"))
+        elif "/" in value:
+            month, day, year = (int(part) for part in value.split("/"))
+        else:
+            month_name, day, year = value.replace(",", " ").split()
+            month = _MONTHS[month_name.rstrip(".").lower()]
+            day, year = int(day), int(year)
+        return date(year, month, day)
+    except (KeyError, ValueError):
+        return None
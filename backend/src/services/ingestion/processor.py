@@ -0,0 +1,371 @@
+"""Ingestion workflow: stored PDF → text → sections → structured data → database."""
+import asyncio
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...config import settings
+from ...models.policy_document import PolicyDocument, ProcessingStatus
+from ...models.policy_section import SectionType
+from ...models.payer import Payer
+from ...utils.token_counter import get_token_counter
+from ..extraction.confidence_scorer import ConfidenceScorer
+from ..extraction.llm_agent import PolicyExtractionAgent, SectionExtractionError
+from ..extraction.response_cache import create_response_cache
+from ..extraction.retry import classify_error
+from ..extraction.schemas import PolicyExtraction, PolicySectionExtraction
+from .document_chunker import DocumentChunker, Section
+from .extraction_writer import ExtractionWriter
+from .hybrid_extractor import HybridTextExtractor
+from .ocr_cache import OCRCache
+from .ocr_processor import OCRProcessor
+from .pdf_extractor import PDFExtractor
+from .pre_extractor import PreExtraction, PreExtractor
+from .section_classifier import SectionClassification
+
+
+# Section types whose keywords suggest coverage criteria or exclusions to extract
+EXTRACTABLE_SECTION_TYPES = {
+    SectionType.COVERAGE_CRITERIA,
+    SectionType.EXCLUSIONS,
+    SectionType.REQUIREMENTS,
+    SectionType.PRIOR_AUTHORIZATION,
+    SectionType.LIMITATIONS,
+}
+
+
+@dataclass(slots=True)
+class ProcessedDocument:
+    """Extraction results of one document, ready to persist."""
+    chunks: List[Section]
+    extraction: PolicyExtraction
+    failed_sections: int
+
+
+class IngestionProcessor:
+    """Run the extraction pipeline for one policy document with per-stage concurrency limits."""
+    
+    def __init__(
+        self,
+        storage_service,
+        pdf_extractor: PDFExtractor | None = None,
+        ocr_processor: OCRProcessor | None = None,
+        chunker: DocumentChunker | None = None,
+        agent: PolicyExtractionAgent | None = None,
+        scorer: ConfidenceScorer | None = None,
+        pre_extractor: PreExtractor | None = None,
+        writer: ExtractionWriter | None = None,
+        extraction_concurrency: int | None = None,
+        llm_concurrency: int | None = None,
+        persistence_concurrency: int | None = None
+    ):
+        """
+        Initialize ingestion processor.
+        
+        The semaphores are shared by every job this processor runs, so each
+        stage is bounded across the whole worker process rather than per job.
+        
+        Args:
+            storage_service: Storage service (Azure Blob or local)
+            pdf_extractor: Text extractor (default: PDFExtractor)
+            ocr_processor: OCR processor for scanned PDFs (default: OCRProcessor)
+            chunker: Section chunker (default: DocumentChunker)
+            agent: LLM extraction agent (default: PolicyExtractionAgent)
+            scorer: Confidence scorer (default: threshold from settings)
+            pre_extractor: Code, date, and policy number matcher (default: PreExtractor)
+            writer: Bulk writer for section, criteria, and exclusion rows
+            extraction_concurrency: Max documents in text extraction at once
+            llm_concurrency: Max in-flight LLM calls for the default agent
+            persistence_concurrency: Max documents writing results at once
+        """
+        self.storage_service = storage_service
+        self.pdf_extractor = pdf_extractor or PDFExtractor()
+        self.ocr_processor = ocr_processor or OCRProcessor(
+            dpi=settings.ocr_dpi,
+            max_workers=settings.ocr_max_workers,
+            cache=OCRCache(
+                settings.ocr_cache_dir,
+                max_memory_entries=settings.ocr_cache_memory_entries,
+                max_disk_mb=settings.ocr_cache_max_disk_mb
+            ) if settings.ocr_cache_enabled else None
+        )
+        self.chunker = chunker or DocumentChunker(
+            max_chunk_tokens=settings.chunk_max_tokens or None,
+            overlap_tokens=settings.chunk_overlap_tokens,
+            token_counter=get_token_counter(settings.pydantic_ai_model)
+        )
+        self.agent = agent or PolicyExtractionAgent(
+            max_concurrency=llm_concurrency,
+            cache=create_response_cache()
+        )
+        self.text_extractor = HybridTextExtractor(
+            self.pdf_extractor,
+            self.ocr_processor,
+            min_chars_per_page=settings.ocr_min_chars_per_page,
+            rasterize=settings.ocr_rasterize_pages
+        )
+        self.scorer = scorer or ConfidenceScorer(settings.extraction_confidence_threshold)
+        self.rule_skip_section_types = {
+            SectionType(section_type) for section_type in settings.rule_skip_section_types_list
+        }
+        self.rule_skip_min_confidence = settings.rule_skip_min_confidence
+        self.pre_extractor = pre_extractor or PreExtractor()
+        self.pre_extract_skip_llm = settings.pre_extract_skip_llm
+        self.writer = writer or ExtractionWriter()
+        
+        self.extraction_semaphore = asyncio.Semaphore(
+            extraction_concurrency or settings.worker_extraction_concurrency
+        )
+        self.persistence_semaphore = asyncio.Semaphore(
+            persistence_concurrency or settings.worker_persistence_concurrency
+        )
+    
+    async def process(self, db: AsyncSession, policy_doc: PolicyDocument) -> PolicyDocument:
+        """
+        Process a queued policy document end to end.
+        
+        Status transitions are committed as they happen so job polling
+        reflects progress: EXTRACTING_TEXT → STRUCTURING_DATA → COMPLETE
+        (or PENDING_REVIEW when the extraction needs manual review).
+        
+        Args:
+            db: Database session
+            policy_doc: Policy document to process
+        
+        Returns:
+            The updated policy document
+        """
+        processed = await self.extract(db, policy_doc)
+        
+        async with self.persistence_semaphore:
+            await self.persist(db, policy_doc, processed)
+            await db.commit()
+        
+        return policy_doc
+    
+    async def extract(self, db: AsyncSession, policy_doc: PolicyDocument) -> ProcessedDocument:
+        """
+        Run text extraction and LLM structuring (stages 1 and 2).
+        
+        The EXTRACTING_TEXT and STRUCTURING_DATA transitions and the facts
+        filled from pattern matches are committed; nothing is written to
+        the section tables.
+        
+        Args:
+            db: Database session
+            policy_doc: Policy document to process
+        
+        Returns:
+            ProcessedDocument for persist()
+        """
+        payer_result = await db.execute(select(Payer).where(Payer.id == policy_doc.payer_id))
+        payer = payer_result.scalar_one()
+        
+        # Stage 1: text extraction
+        policy_doc.processing_status = ProcessingStatus.EXTRACTING_TEXT
+        policy_doc.processing_started_at = datetime.utcnow()
+        await db.commit()
+        
+        async with self.extraction_semaphore:
+            pdf_info = await self._extract_text(policy_doc.pdf_storage_path)
+        
+        policy_doc.pdf_page_count = pdf_info["page_count"]
+        
+        # Fill document facts the upload did not provide from pattern matches
+        facts = self.pre_extractor.extract(pdf_info["full_text"], pdf_info.get("metadata"))
+        if policy_doc.policy_number is None and facts.policy_number:
+            policy_doc.policy_number = facts.policy_number[:100]
+        # Uploads only carry the upload day as a placeholder effective date
+        if facts.effective_date and (
+            policy_doc.expiration_date is None
+            or facts.effective_date <= policy_doc.expiration_date
+        ):
+            policy_doc.effective_date = facts.effective_date
+        if (
+            policy_doc.expiration_date is None
+            and facts.expiration_date
+            and facts.expiration_date >= policy_doc.effective_date
+        ):
+            policy_doc.expiration_date = facts.expiration_date
+        
+        # Stage 2: chunking and LLM structuring
+        policy_doc.processing_status = ProcessingStatus.STRUCTURING_DATA
+        await db.commit()
+        
+        chunks = self.chunker.chunk_by_sections(
+            pdf_info["full_text"],
+            self.chunker.page_offsets(pdf_info["pages"])
+        )
+        section_results, failed_sections = await self._extract_sections(chunks)
+        
+        extraction = self.agent.merge_sections(
+            section_results,
+            payer_name=payer.name,
+            policy_name=policy_doc.policy_name,
+            effective_date=policy_doc.effective_date,
+            policy_number=policy_doc.policy_number,
+            expiration_date=policy_doc.expiration_date,
+            document_type=policy_doc.document_type.value
+        )
+        
+        return ProcessedDocument(chunks=chunks, extraction=extraction, failed_sections=failed_sections)
+            
+    async def persist(self, db: AsyncSession, policy_doc: PolicyDocument, processed: ProcessedDocument) -> None:
+        """
+        Write the extraction and set the final status (stage 3), without committing.
+            
+        The caller commits, so the results can land in the same transaction
+        as its own bookkeeping (the worker marks the job completed there),
+        and holds persistence_semaphore.
+        
+        Args:
+            db: Database session
+            policy_doc: Policy document being processed
+            processed: Result of extract()
+        """
+        extraction = processed.extraction
+        await self.writer.write(db, policy_doc.id, processed.chunks, extraction.sections)
+        
+        payer_policy_count = await self._count_completed_policies(db, policy_doc)
+        review = self.scorer.requires_manual_review(
+            extraction,
+            payer_policy_count,
+            settings.human_review_first_n_policies
+        )
+        if processed.failed_sections:
+            review["requires_review"] = True
+            review["reasons"].append(f"{processed.failed_sections} sections could not be extracted")
+        
+        policy_doc.extraction_confidence_score = review["overall_confidence"]
+        policy_doc.requires_manual_review = review["requires_review"]
+        policy_doc.processing_status = (
+            ProcessingStatus.PENDING_REVIEW if review["requires_review"]
+            else ProcessingStatus.COMPLETE
+        )
+        policy_doc.processing_completed_at = datetime.utcnow()
+    
+    async def _extract_text(self, storage_path: str) -> Dict[str, any]:
+        """Download the stored PDF to a temp file and extract its text off the event loop."""
+        fd, temp_path = tempfile.mkstemp(suffix=".pdf")
+        os.close(fd)
+        
+        try:
+            await self.storage_service.download_to_file_async(storage_path, temp_path)
+            
+            # Native text per page, OCR only for pages without usable text
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.text_extractor.extract_text, temp_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    async def _extract_sections(
+        self,
+        chunks: List[Section]
+    ) -> Tuple[List[PolicySectionExtraction], int]:
+        """
+        Extract all chunks, skipping the LLM for sections with nothing to extract.
+        
+        Sections such as definitions and appeals processes carry no coverage
+        criteria or exclusions, so when the keyword classifier is confident
+        about them the LLM call adds nothing. The same holds for sections
+        with no procedure or diagnosis codes and no coverage, exclusion,
+        requirement, authorization, or limitation keywords at all (background,
+        references, revision history). Everything else is fanned out
+        through the agent, with the section's pre-extracted codes in the
+        prompt; the agent bounds concurrency and rate across jobs and
+        retries transient failures per section.
+        
+        A section whose output is invalid gets an empty placeholder and the
+        rest of the document is kept. If a section still fails transiently
+        after its retries, the error propagates so the job is retried; the
+        sections that succeeded are then served from the response cache.
+        
+        Returns:
+            Section results in chunk order and the number of placeholders
+        """
+        classifications = self.chunker.classifier.classify_sections(chunks)
+        section_facts = self.pre_extractor.extract_sections(chunks)
+        results: List[PolicySectionExtraction | None] = [
+            self._rule_based_section(chunk, classification, facts)
+            for chunk, classification, facts in zip(chunks, classifications, section_facts)
+        ]
+        
+        pending = [index for index, result in enumerate(results) if result is None]
+        try:
+            extracted = await self.agent.extract_sections(
+                [chunks[index] for index in pending],
+                [section_facts[index] for index in pending]
+            )
+            failures = {}
+        except SectionExtractionError as e:
+            if any(classify_error(error).retryable for error in e.errors.values()):
+                raise
+            extracted = e.results
+            failures = e.errors
+        
+        for position, (index, result) in enumerate(zip(pending, extracted)):
+            if position in failures:
+                result = PolicySectionExtraction(
+                    section_type=classifications[index].section_type.value,
+                    title=chunks[index].title,
+                    content_summary=f"Extraction failed: {failures[position]}"[:200],
+                    confidence_score=0.0
+                )
+            results[index] = result
+        
+        return results, len(failures)
+    
+    def _rule_based_section(
+        self,
+        chunk: Section,
+        classification: SectionClassification,
+        facts: PreExtraction | None = None
+    ) -> PolicySectionExtraction | None:
+        """Build a section result without the LLM when the rule-skip settings allow it."""
+        if (
+            classification.section_type in self.rule_skip_section_types
+            and classification.confidence >= self.rule_skip_min_confidence
+        ):
+            return PolicySectionExtraction(
+                section_type=classification.section_type.value,
+                title=chunk.title,
+                content_summary=chunk.text[:200],
+                confidence_score=classification.confidence
+            )
+        
+        if (
+            self.pre_extract_skip_llm
+            and facts is not None
+            and not facts.has_codes
+            and not any(classification.scores.get(t) for t in EXTRACTABLE_SECTION_TYPES)
+        ):
+            # Nothing for the LLM to find; 0.0 means unscored, so confidence averages skip it
+            return PolicySectionExtraction(
+                section_type=classification.section_type.value,
+                title=chunk.title,
+                content_summary=chunk.text[:200],
+                confidence_score=0.0
+            )
+        
+        return None
+    
+    async def _count_completed_policies(self, db: AsyncSession, policy_doc: PolicyDocument) -> int:
+        """Count previously processed policies for the same payer (first-N review rule)."""
+        result = await db.execute(
+            select(func.count(PolicyDocument.id)).where(
+                PolicyDocument.payer_id == policy_doc.payer_id,
+                PolicyDocument.id != policy_doc.id,
+                PolicyDocument.is_deleted == False,
+                PolicyDocument.processing_status.in_([
+                    ProcessingStatus.COMPLETE,
+                    ProcessingStatus.PENDING_REVIEW
+                ])
+            )
+        )
+        return result.scalar_one()
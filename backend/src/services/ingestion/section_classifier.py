@@ -0,0 +1,243 @@
+"""Rule-based section classification with a single-pass keyword matcher."""
+import math
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from ...models.policy_section import SectionType
+
+
+# Keyword stems per section type with their weights. Stems match at the start
+# of a word ("exclu" matches exclusion, excluded, exclusions); multi-word
+# phrases outrank their single words at the same position.
+SECTION_KEYWORDS: Dict[SectionType, Dict[str, float]] = {
+    SectionType.COVERAGE_CRITERIA: {
+        "coverage criteria": 3.0,
+        "covered when": 2.0,
+        "is considered medically necessary": 2.0,
+        "coverage": 1.0,
+        "covered": 1.0,
+        "benefit": 1.0,
+        "criteria": 0.5,
+    },
+    SectionType.EXCLUSIONS: {
+        "not covered": 2.0,
+        "not medically necessary": 2.0,
+        "investigational": 1.5,
+        "experimental": 1.5,
+        "exclu": 1.5,
+        "cosmetic": 1.0,
+    },
+    SectionType.REQUIREMENTS: {
+        "medical necessity": 1.5,
+        "must submit": 1.5,
+        "must include": 1.0,
+        "requirement": 1.5,
+        "documentation": 1.0,
+        "required": 0.5,
+    },
+    SectionType.DEFINITIONS: {
+        "is defined as": 2.0,
+        "refers to": 1.5,
+        "definition": 2.0,
+        "glossary": 2.0,
+        "means": 1.0,
+        "terms": 0.5,
+    },
+    SectionType.PRIOR_AUTHORIZATION: {
+        "prior authorization": 3.0,
+        "pre-authorization": 3.0,
+        "preauthorization": 3.0,
+        "precertification": 2.5,
+        "prior approval": 2.0,
+        "preauth": 2.0,
+    },
+    SectionType.LIMITATIONS: {
+        "per lifetime": 2.0,
+        "per year": 1.5,
+        "maximum of": 1.5,
+        "limitation": 2.0,
+        "frequency": 1.0,
+        "limit": 1.0,
+    },
+    SectionType.APPEALS_PROCESS: {
+        "external review": 2.5,
+        "reconsideration": 2.0,
+        "grievance": 2.0,
+        "appeal": 2.0,
+        "dispute": 1.5,
+    },
+}
+
+
+@dataclass(slots=True)
+class SectionClassification:
+    """Rule-based section type with a confidence score."""
+    section_type: SectionType
+    confidence: float
+    scores: Dict[SectionType, float] = field(default_factory=dict)
+
+
+class SectionClassifier:
+    """
+    Score every section type from keyword hits in one pass over the text.
+    
+    The keyword stems are compiled into a prefix tree and the tree into a
+    single regex (the goto structure of an Aho-Corasick automaton, anchored
+    at word starts), so the C regex engine walks the tree once per word
+    instead of testing each keyword. Matching is longest-first, so "not
+    covered" is never also counted as "covered".
+    """
+    
+    def __init__(
+        self,
+        keywords: Dict[SectionType, Dict[str, float]] | None = None,
+        title_weight: float = 3.0,
+        evidence_scale: float = 4.0
+    ):
+        """
+        Initialize section classifier.
+        
+        Args:
+            keywords: Keyword stems and weights per section type
+            title_weight: Multiplier for hits in the section title
+            evidence_scale: Score at which confidence reaches ~63% of its
+                share-based maximum; lower values trust fewer hits
+        """
+        self.title_weight = title_weight
+        self.evidence_scale = evidence_scale
+        
+        self._keywords: Dict[str, Tuple[SectionType, float]] = {
+            stem.lower(): (section_type, weight)
+            for section_type, stems in (keywords or SECTION_KEYWORDS).items()
+            for stem, weight in stems.items()
+        }
+        self._pattern = re.compile(r"\b" + _trie_regex(self._keywords))
+    
+    def classify(self, title: str, text: str) -> SectionClassification:
+        """
+        Classify one section.
+        
+        Args:
+            title: Section title
+            text: Section text
+        
+        Returns:
+            Best section type (OTHER when nothing matched) and its confidence
+        """
+        scores = self._score(title.lower(), self.title_weight)
+        for section_type, score in self._score(text.lower()).items():
+            scores[section_type] = scores.get(section_type, 0.0) + score
+        
+        return self._decide(scores)
+    
+    def classify_sections(self, sections: Sequence) -> List[SectionClassification]:
+        """
+        Classify all sections of a document.
+        
+        Sections that share a source string (Section records from
+        DocumentChunker) are scored from a single scan of that source, with
+        each hit attributed to every section whose span contains it.
+        
+        Args:
+            sections: Section records with title, source, start, and end
+        
+        Returns:
+            One classification per section, in input order
+        """
+        text_scores: List[Dict[SectionType, float]] = [{} for _ in sections]
+        
+        by_source: Dict[int, List[int]] = {}
+        for index, section in enumerate(sections):
+            by_source.setdefault(id(section.source), []).append(index)
+        
+        for indexes in by_source.values():
+            indexes.sort(key=lambda index: sections[index].start)
+            source = sections[indexes[0]].source
+            lowered = source.lower()
+            
+            # Rare characters change length when lowercased; offsets would shift
+            if len(lowered) != len(source):
+                for index in indexes:
+                    text_scores[index] = self._score(sections[index].text.lower())
+                continue
+            
+            starts = [sections[index].start for index in indexes]
+            scan_end = max(sections[index].end for index in indexes)
+            
+            for match in self._pattern.finditer(lowered, starts[0], scan_end):
+                position = match.start()
+                section_type, weight = self._keywords[match.group()]
+                
+                # Walk back over sections starting at or before the hit (parts may overlap)
+                slot = bisect_right(starts, position) - 1
+                while slot >= 0:
+                    section = sections[indexes[slot]]
+                    if section.end < match.end():
+                        break
+                    scores = text_scores[indexes[slot]]
+                    scores[section_type] = scores.get(section_type, 0.0) + weight
+                    slot -= 1
+        
+        results = []
+        for section, scores in zip(sections, text_scores):
+            for section_type, score in self._score(section.title.lower(), self.title_weight).items():
+                scores[section_type] = scores.get(section_type, 0.0) + score
+            results.append(self._decide(scores))
+        
+        return results
+    
+    def _score(self, lowered: str, multiplier: float = 1.0) -> Dict[SectionType, float]:
+        """Sum keyword weights per section type over lowercased text."""
+        scores: Dict[SectionType, float] = {}
+        for match in self._pattern.finditer(lowered):
+            section_type, weight = self._keywords[match.group()]
+            scores[section_type] = scores.get(section_type, 0.0) + weight * multiplier
+        return scores
+    
+    def _decide(self, scores: Dict[SectionType, float]) -> SectionClassification:
+        """
+        Pick the best type and its confidence.
+        
+        Confidence is the winner's share of all keyword evidence, discounted
+        when there is little evidence overall.
+        """
+        total = sum(scores.values())
+        if not total:
+            return SectionClassification(SectionType.OTHER, 0.0, scores)
+        
+        # Ties go to the type listed first in SectionType
+        best_type = max(SectionType, key=lambda section_type: scores.get(section_type, 0.0))
+        best_score = scores[best_type]
+        
+        share = best_score / total
+        evidence = 1.0 - math.exp(-best_score / self.evidence_scale)
+        
+        return SectionClassification(best_type, share * evidence, scores)
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """
+    Compile words into a regex that follows their shared-prefix tree.
+    
+    Each node becomes one alternation keyed by distinct next characters, and
+    words that end at a node make the rest optional (greedy, so the longest
+    word wins).
+    """
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    
+    def build(node: Dict) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        
+        pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{pattern})?" if "" in node else pattern
+    
+    return build(trie)
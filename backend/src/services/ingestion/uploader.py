@@ -1,8 +1,17 @@
 """PDF upload service with validation and storage."""
 from pathlib import Path
-from typing import Dict, BinaryIO
+from typing import Dict, BinaryIO, Iterator, List
 import hashlib
 from datetime import datetime
+from uuid import uuid4
+
+
+class PDFValidationError(ValueError):
+    """Raised when an uploaded file fails PDF validation."""
+    
+    def __init__(self, errors: List[str]):
+        super().__init__(", ".join(errors))
+        self.errors = errors
 
 
 class PDFUploader:
@@ -61,6 +70,172 @@ class PDFUploader:
             "uploaded_at": datetime.utcnow()
         }
     
+    def upload_pdf_stream(
+        self,
+        file: BinaryIO,
+        filename: str,
+        payer_id: str,
+        user_id: str | None = None,
+        chunk_size: int = 1024 * 1024,
+        max_size_mb: int = 100,
+        file_hash: str | None = None
+    ) -> Dict[str, any]:
+        """
+        Validate, hash, and store a PDF file without reading it fully into memory.
+        
+        The file is read in fixed-size chunks that are hashed incrementally and
+        streamed into storage, so peak memory stays around one chunk.
+        
+        Args:
+            file: File object positioned at the start of the PDF
+            filename: Original filename
+            payer_id: Payer UUID
+            user_id: User UUID who uploaded (optional)
+            chunk_size: Bytes read per chunk
+            max_size_mb: Maximum file size in MB
+            file_hash: SHA-256 already computed by hash_pdf_stream (optional);
+                when given, hashing is skipped and the hash is used in the path
+            
+        Returns:
+            Dictionary with upload metadata (same shape as upload_pdf)
+            
+        Raises:
+            PDFValidationError: If the file is not a valid, unencrypted PDF
+                or exceeds the size limit
+        """
+        hasher = hashlib.sha256() if file_hash is None else None
+        state = {"file_size": 0}
+        
+        # Without a precomputed hash, use a random path component instead
+        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        path_key = file_hash[:8] if file_hash else uuid4().hex[:8]
+        storage_path = f"policies/{payer_id}/{timestamp}_{path_key}_{filename}"
+        
+        chunks = self._iter_validated_chunks(
+            file, hasher, state, chunk_size, max_size_mb * 1024 * 1024
+        )
+        storage_url = self.storage_service.upload_stream(chunks, storage_path)
+        
+        return {
+            "storage_path": storage_path,
+            "storage_url": storage_url,
+            "file_size_bytes": state["file_size"],
+            "original_filename": filename,
+            "file_hash": file_hash or hasher.hexdigest(),
+            "uploaded_by": user_id,
+            "uploaded_at": datetime.utcnow()
+        }
+    
+    def hash_pdf_stream(
+        self,
+        file: BinaryIO,
+        chunk_size: int = 1024 * 1024,
+        max_size_mb: int = 100
+    ) -> Dict[str, any]:
+        """
+        Validate and hash a PDF file in chunks without storing it.
+        
+        Used to look up duplicates by content hash before anything is
+        written to storage.
+        
+        Args:
+            file: File object positioned at the start of the PDF
+            chunk_size: Bytes read per chunk
+            max_size_mb: Maximum file size in MB
+            
+        Returns:
+            Dictionary with file_hash and file_size_bytes
+            
+        Raises:
+            PDFValidationError: If the file is not a valid, unencrypted PDF
+                or exceeds the size limit
+        """
+        hasher = hashlib.sha256()
+        state = {"file_size": 0}
+        
+        for _ in self._iter_validated_chunks(
+            file, hasher, state, chunk_size, max_size_mb * 1024 * 1024
+        ):
+            pass
+        
+        return {
+            "file_hash": hasher.hexdigest(),
+            "file_size_bytes": state["file_size"]
+        }
+    
+    async def hash_pdf_stream_async(self, file: BinaryIO, **kwargs) -> Dict[str, any]:
+        """
+        Async variant of hash_pdf_stream().
+        
+        Reading and hashing run on the storage service's thread pool so the
+        event loop keeps serving other requests.
+        """
+        return await self.storage_service.run_blocking(self.hash_pdf_stream, file, **kwargs)
+    
+    async def upload_pdf_stream_async(
+        self,
+        file: BinaryIO,
+        filename: str,
+        payer_id: str,
+        **kwargs
+    ) -> Dict[str, any]:
+        """
+        Async variant of upload_pdf_stream().
+        
+        Reading, hashing, and the blocking storage upload run together on the
+        storage service's thread pool.
+        """
+        return await self.storage_service.run_blocking(
+            self.upload_pdf_stream, file, filename, payer_id, **kwargs
+        )
+    
+    def _iter_validated_chunks(
+        self,
+        file: BinaryIO,
+        hasher,
+        state: Dict[str, int],
+        chunk_size: int,
+        max_size_bytes: int
+    ) -> Iterator[bytes]:
+        """Yield file chunks, validating and hashing them as they pass through."""
+        first_chunk = True
+        
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            
+            if first_chunk:
+                errors = self._validate_header(chunk)
+                if errors:
+                    raise PDFValidationError(errors)
+                first_chunk = False
+            
+            state["file_size"] += len(chunk)
+            if state["file_size"] > max_size_bytes:
+                raise PDFValidationError([
+                    f"File size exceeds maximum ({max_size_bytes // 1024 // 1024}MB)"
+                ])
+            
+            if hasher is not None:
+                hasher.update(chunk)
+            yield chunk
+        
+        if first_chunk:
+            raise PDFValidationError(["File is empty"])
+    
+    def _validate_header(self, content: bytes) -> List[str]:
+        """Check PDF magic number and encryption marker in leading bytes."""
+        errors = []
+        
+        if not content.startswith(b'%PDF-'):
+            errors.append("File is not a valid PDF (invalid header)")
+        
+        if b'/Encrypt' in content:
+            errors.append("PDF appears to be password-protected or encrypted")
+        
+        return errors
+    
     def _calculate_hash(self, content: bytes) -> str:
         """Calculate SHA-256 hash of file content."""
         return hashlib.sha256(content).hexdigest()
@@ -91,19 +266,11 @@ class PDFUploader:
         if file_size == 0:
             errors.append("File is empty")
         
-        # Check PDF magic number
-        header = file.read(5)
-        file.seek(0)
-        
-        if not header.startswith(b'%PDF-'):
-            errors.append("File is not a valid PDF (invalid header)")
-        
-        # Check for password protection (basic check)
+        # Check PDF magic number and password protection (basic check)
         content = file.read(1024)  # Read first 1KB
         file.seek(0)
         
-        if b'/Encrypt' in content:
-            errors.append("PDF appears to be password-protected or encrypted")
+        errors.extend(self._validate_header(content))
         
         return {
             "is_valid": len(errors) == 0,
@@ -0,0 +1,309 @@
+"""Full-text search over policy sections and their extracted coverage criteria and exclusions."""
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import case, func, literal, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from ...models.coverage_criteria import CoverageCriteria
+from ...models.exclusion import Exclusion
+from ...models.payer import Payer
+from ...models.policy_document import DocumentType, PolicyDocument
+from ...models.policy_section import PolicySection, SectionType
+from ...utils.pagination import decode_cursor, encode_cursor
+
+
+# Must match the configuration the search_vector columns are generated with
+TEXT_SEARCH_CONFIG = "english"
+
+# ts_rank_cd normalization 32 scales ranks to 0-1 (rank / (rank + 1))
+RANK_NORMALIZATION = 32
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+FRAGMENT_DELIMITER = "<fragment/>"
+HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+    f"MaxFragments=3, MaxWords=35, MinWords=15, FragmentDelimiter={FRAGMENT_DELIMITER}"
+)
+
+
+@dataclass(slots=True)
+class SearchFilters:
+    """Restrictions on which sections a search may return."""
+    payer_ids: List[UUID] = field(default_factory=list)
+    effective_date_from: Optional[date] = None
+    effective_date_to: Optional[date] = None
+    document_types: List[DocumentType] = field(default_factory=list)
+    section_types: List[SectionType] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready view of the filters that are set."""
+        applied = {
+            "payer_ids": [str(payer_id) for payer_id in self.payer_ids],
+            "effective_date_from": self.effective_date_from.isoformat() if self.effective_date_from else None,
+            "effective_date_to": self.effective_date_to.isoformat() if self.effective_date_to else None,
+            "document_types": [document_type.value for document_type in self.document_types],
+            "section_types": [section_type.value for section_type in self.section_types],
+        }
+        return {name: value for name, value in applied.items() if value}
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """One matching section with its policy, relevance, and highlighted fragments."""
+    section_id: UUID
+    section_type: SectionType
+    section_number: Optional[str]
+    title: str
+    order_index: int
+    policy_document_id: UUID
+    policy_name: str
+    policy_number: Optional[str]
+    effective_date: date
+    document_type: DocumentType
+    payer_id: UUID
+    payer_name: str
+    relevance_score: float
+    highlights: List[str]
+
+
+@dataclass(slots=True)
+class SearchPage:
+    """A page of hits, best first, and the cursor for the next page."""
+    hits: List[SearchHit]
+    next_cursor: Optional[str]
+
+
+class SearchEngine:
+    """
+    Keyword search backed by PostgreSQL full-text search.
+    
+    Sections match on their own title and text or on the text of their
+    coverage criteria and exclusions; each table has a generated
+    search_vector column with a GIN index, so every source is an index
+    scan. Policy filters are applied inside each source's scan, so only
+    matches that can be returned are ranked. A section's relevance is its
+    best ts_rank_cd across those sources. Pages are keyset on (relevance,
+    section id), and ts_headline runs only for the rows on the returned
+    page, on the text that gave the section its relevance.
+    """
+    
+    def __init__(
+        self,
+        text_search_config: str = TEXT_SEARCH_CONFIG,
+        headline_options: str = HEADLINE_OPTIONS
+    ):
+        """
+        Initialize search engine.
+        
+        Args:
+            text_search_config: PostgreSQL text search configuration
+            headline_options: ts_headline options for highlights
+        """
+        self.text_search_config = text_search_config
+        self.headline_options = headline_options
+    
+    async def search(
+        self,
+        db: AsyncSession,
+        query: str,
+        filters: Optional[SearchFilters] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> SearchPage:
+        """
+        Find sections matching a keyword query, most relevant first.
+        
+        Args:
+            db: Database session
+            query: Web-search style query ("quoted phrases", or, -excluded)
+            filters: Payer, effective date, and type restrictions
+            limit: Maximum number of hits
+            cursor: next_cursor from the previous page
+        
+        Returns:
+            SearchPage of hits
+        
+        Raises:
+            InvalidCursorError: If the cursor was not issued by search
+        """
+        after = decode_cursor(cursor, float, UUID) if cursor else None
+        
+        result = await db.execute(self.build_query(query, filters or SearchFilters(), limit, after))
+        hits = [
+            SearchHit(
+                section_id=row.section_id,
+                section_type=row.section_type,
+                section_number=row.section_number,
+                title=row.title,
+                order_index=row.order_index,
+                policy_document_id=row.policy_document_id,
+                policy_name=row.policy_name,
+                policy_number=row.policy_number,
+                effective_date=row.effective_date,
+                document_type=row.document_type,
+                payer_id=row.payer_id,
+                payer_name=row.payer_name,
+                relevance_score=row.rank,
+                highlights=self._split_headline(row.headline)
+            )
+            for row in result
+        ]
+        
+        next_cursor = None
+        if len(hits) == limit:
+            next_cursor = encode_cursor(hits[-1].relevance_score, hits[-1].section_id)
+        
+        return SearchPage(hits=hits, next_cursor=next_cursor)
+    
+    def build_query(
+        self,
+        query: str,
+        filters: SearchFilters,
+        limit: int,
+        after: Optional[List[Any]] = None
+    ) -> Select:
+        """
+        Build the search statement.
+        
+        Args:
+            query: Web-search style query
+            filters: Payer, effective date, and type restrictions
+            limit: Maximum number of rows
+            after: (relevance, section id) of the last hit already returned
+        
+        Returns:
+            SELECT yielding one row per hit, best first
+        """
+        ts_query = func.websearch_to_tsquery(self.text_search_config, query)
+        
+        conditions = [PolicyDocument.is_deleted == False]
+        if filters.payer_ids:
+            conditions.append(PolicyDocument.payer_id.in_(filters.payer_ids))
+        if filters.effective_date_from:
+            conditions.append(PolicyDocument.effective_date >= filters.effective_date_from)
+        if filters.effective_date_to:
+            conditions.append(PolicyDocument.effective_date <= filters.effective_date_to)
+        if filters.document_types:
+            conditions.append(PolicyDocument.document_type.in_(filters.document_types))
+        if filters.section_types:
+            conditions.append(PolicySection.section_type.in_(filters.section_types))
+        
+        # Every branch is a GIN index scan on its own search_vector, filtered before ranking
+        branches = []
+        for source, section_id, search_vector in (
+            ("section", PolicySection.id, PolicySection.search_vector),
+            ("criteria", CoverageCriteria.policy_section_id, CoverageCriteria.search_vector),
+            ("exclusion", Exclusion.policy_section_id, Exclusion.search_vector),
+        ):
+            branch = select(
+                section_id.label("section_id"),
+                func.ts_rank_cd(search_vector, ts_query, RANK_NORMALIZATION).label("rank"),
+                literal(source).label("source")
+            )
+            if section_id is not PolicySection.id:
+                branch = branch.join(PolicySection, PolicySection.id == section_id)
+            branches.append(
+                branch
+                .join(PolicyDocument, PolicyDocument.id == PolicySection.policy_document_id)
+                .where(search_vector.bool_op("@@")(ts_query), *conditions)
+            )
+        matches = union_all(*branches).subquery("matches")
+        
+        # The best rank, unlike a sum, is the same on every page, which the cursor relies on
+        ranked = (
+            select(matches.c.section_id, matches.c.rank, matches.c.source)
+            .distinct(matches.c.section_id)
+            .order_by(matches.c.section_id, matches.c.rank.desc())
+            .subquery("ranked")
+        )
+        
+        keyset = []
+        if after:
+            keyset.append(tuple_(ranked.c.rank, ranked.c.section_id) < tuple_(*after))
+        
+        page = (
+            select(
+                ranked.c.rank,
+                ranked.c.source,
+                PolicySection.id.label("section_id"),
+                PolicySection.section_type,
+                PolicySection.section_number,
+                PolicySection.title,
+                PolicySection.order_index,
+                PolicyDocument.id.label("policy_document_id"),
+                PolicyDocument.policy_name,
+                PolicyDocument.policy_number,
+                PolicyDocument.effective_date,
+                PolicyDocument.document_type,
+                PolicyDocument.payer_id,
+                Payer.name.label("payer_name")
+            )
+            .select_from(ranked)
+            .join(PolicySection, PolicySection.id == ranked.c.section_id)
+            .join(PolicyDocument, PolicyDocument.id == PolicySection.policy_document_id)
+            .join(Payer, Payer.id == PolicyDocument.payer_id)
+            .where(*keyset)
+            .order_by(ranked.c.rank.desc(), PolicySection.id.desc())
+            .limit(limit)
+            .subquery("page")
+        )
+        
+        # Highlight only the page, from the source that ranked best; section
+        # text is joined back by primary key after the sort
+        headline = case(
+            (page.c.source == "criteria", self._entity_headline(
+                ts_query,
+                page.c.section_id,
+                CoverageCriteria,
+                func.concat_ws(
+                    ". ",
+                    CoverageCriteria.procedure_name,
+                    CoverageCriteria.covered_scenarios,
+                    CoverageCriteria.required_documentation
+                )
+            )),
+            (page.c.source == "exclusion", self._entity_headline(
+                ts_query,
+                page.c.section_id,
+                Exclusion,
+                func.concat_ws(
+                    ". ",
+                    Exclusion.excluded_procedure,
+                    Exclusion.exclusion_rationale,
+                    Exclusion.exceptions_to_exclusion
+                )
+            )),
+            else_=func.ts_headline(
+                self.text_search_config,
+                PolicySection.content_text,
+                ts_query,
+                self.headline_options
+            )
+        )
+        
+        return (
+            select(page, headline.label("headline"))
+            .join(PolicySection, PolicySection.id == page.c.section_id)
+            .order_by(page.c.rank.desc(), page.c.section_id.desc())
+        )
+    
+    def _entity_headline(self, ts_query, section_id, model, text):
+        """ts_headline over the section's best-ranked matching criterion or exclusion."""
+        return (
+            select(func.ts_headline(self.text_search_config, text, ts_query, self.headline_options))
+            .where(model.policy_section_id == section_id, model.search_vector.bool_op("@@")(ts_query))
+            .order_by(func.ts_rank_cd(model.search_vector, ts_query, RANK_NORMALIZATION).desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+    
+    def _split_headline(self, headline: Optional[str]) -> List[str]:
+        """Split ts_headline output into its fragments."""
+        if not headline:
+            return []
+        return [fragment.strip() for fragment in headline.split(FRAGMENT_DELIMITER) if fragment.strip()]
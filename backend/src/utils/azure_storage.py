@@ -1,7 +1,13 @@
 """Azure Blob Storage operations."""
-from azure.storage.blob import BlobServiceClient
+from azure.storage.blob import BlobServiceClient, BlobBlock
 from pathlib import Path
-from typing import BinaryIO
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, BinaryIO, Callable, Iterable
+import asyncio
+import base64
+import os
+import shutil
 from ..config import settings
 
 
@@ -19,6 +25,47 @@ class AzureStorageService:
             self.blob_service_client = None
             self.local_storage_path = Path(settings.local_storage_path)
             self.local_storage_path.mkdir(parents=True, exist_ok=True)
+        
+        # Blocking SDK and file I/O runs here so async callers never stall the event loop
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.storage_io_workers,
+            thread_name_prefix="storage-io"
+        )
+    
+    async def run_blocking(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking callable on the storage I/O thread pool.
+        
+        Args:
+            func: Synchronous callable
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+            
+        Returns:
+            The callable's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+    
+    async def upload_async(self, file_content: bytes, blob_path: str) -> str:
+        """Async variant of upload(), executed on the storage I/O pool."""
+        return await self.run_blocking(self.upload, file_content, blob_path)
+    
+    async def upload_stream_async(self, chunks: Iterable[bytes], blob_path: str) -> str:
+        """Async variant of upload_stream(), executed on the storage I/O pool."""
+        return await self.run_blocking(self.upload_stream, chunks, blob_path)
+    
+    async def download_async(self, blob_path: str) -> bytes:
+        """Async variant of download(), executed on the storage I/O pool."""
+        return await self.run_blocking(self.download, blob_path)
+    
+    async def download_to_file_async(self, blob_path: str, file_path: str | Path) -> None:
+        """Async variant of download_to_file(), executed on the storage I/O pool."""
+        await self.run_blocking(self.download_to_file, blob_path, file_path)
+    
+    async def delete_async(self, blob_path: str) -> None:
+        """Async variant of delete(), executed on the storage I/O pool."""
+        await self.run_blocking(self.delete, blob_path)
     
     def upload(self, file_content: bytes, blob_path: str) -> str:
         """
@@ -57,6 +104,60 @@ class AzureStorageService:
         
         return str(local_path)
     
+    def upload_stream(self, chunks: Iterable[bytes], blob_path: str) -> str:
+        """
+        Upload file to storage from an iterable of chunks.
+        
+        Only one chunk is held in memory at a time. If the iterable raises,
+        nothing is committed to the destination path.
+        
+        Args:
+            chunks: Iterable yielding file content in pieces
+            blob_path: Path within container/storage
+            
+        Returns:
+            Storage URL or local path
+        """
+        if settings.use_azure_storage:
+            return self._upload_stream_to_azure(chunks, blob_path)
+        else:
+            return self._upload_stream_to_local(chunks, blob_path)
+    
+    def _upload_stream_to_azure(self, chunks: Iterable[bytes], blob_path: str) -> str:
+        """Upload to Azure Blob Storage as staged blocks."""
+        blob_client = self.blob_service_client.get_blob_client(
+            container=self.container_name,
+            blob=blob_path
+        )
+        
+        # Uncommitted blocks are discarded by Azure if we never commit
+        block_ids = []
+        for index, chunk in enumerate(chunks):
+            block_id = base64.b64encode(f"{index:08d}".encode()).decode()
+            blob_client.stage_block(block_id=block_id, data=chunk)
+            block_ids.append(BlobBlock(block_id=block_id))
+        
+        blob_client.commit_block_list(block_ids)
+        
+        return blob_client.url
+    
+    def _upload_stream_to_local(self, chunks: Iterable[bytes], blob_path: str) -> str:
+        """Upload to local file system via a temporary file."""
+        local_path = self.local_storage_path / blob_path
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = local_path.with_name(local_path.name + ".part")
+        
+        try:
+            with open(temp_path, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(temp_path, local_path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+        
+        return str(local_path)
+    
     def download(self, blob_path: str) -> bytes:
         """
         Download file from storage.
@@ -88,6 +189,24 @@ class AzureStorageService:
         with open(local_path, 'rb') as f:
             return f.read()
     
+    def download_to_file(self, blob_path: str, file_path: str | Path) -> None:
+        """
+        Download file from storage directly into a local file.
+        
+        Args:
+            blob_path: Path within container/storage
+            file_path: Local destination path
+        """
+        if settings.use_azure_storage:
+            blob_client = self.blob_service_client.get_blob_client(
+                container=self.container_name,
+                blob=blob_path
+            )
+            with open(file_path, 'wb') as f:
+                blob_client.download_blob().readinto(f)
+        else:
+            shutil.copyfile(self.local_storage_path / blob_path, file_path)
+    
     def delete(self, blob_path: str) -> None:
         """
         Delete file from storage.
@@ -0,0 +1,61 @@
+"""Opaque cursors for keyset pagination."""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List
+from uuid import UUID
+
+
+class InvalidCursorError(ValueError):
+    """Cursor is malformed or was not issued by this API."""
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode the sort key of the last row on a page as an opaque cursor.
+    
+    Args:
+        *values: Sort key values (datetimes, UUIDs, numbers, strings)
+    
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([_to_json(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> List[Any]:
+    """
+    Decode a cursor from encode_cursor() back into typed sort key values.
+    
+    Args:
+        cursor: Cursor string
+        *types: Expected type of each value (datetime, UUID, float, int, str)
+    
+    Returns:
+        Sort key values in order
+    
+    Raises:
+        InvalidCursorError: If the cursor cannot be decoded into those types
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("wrong number of values")
+        
+        return [
+            datetime.fromisoformat(value) if value_type is datetime else value_type(value)
+            for value, value_type in zip(values, types)
+        ]
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+def _to_json(value: Any) -> Any:
+    """Convert a sort key value to a JSON-serializable one."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
@@ -0,0 +1,104 @@
+"""Token counting for LLM budgets, with an offline estimate when no tokenizer is installed."""
+import math
+import re
+from functools import lru_cache
+
+try:
+    import tiktoken
+except ImportError:  # Optional: fall back to the estimator
+    tiktoken = None
+
+
+# Words, numbers, and individual punctuation marks each cost at least a token
+_PRETOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+class TokenCounter:
+    """Count tokens for a model using its tokenizer, or estimate them offline."""
+    
+    def __init__(self, model: str, chars_per_token: float = 4.0):
+        """
+        Initialize token counter.
+        
+        Args:
+            model: Model name (e.g. 'gpt-4'); selects the tokenizer
+            chars_per_token: Average characters per token for the estimator
+        """
+        self.model = model
+        self.chars_per_token = chars_per_token
+        self._encoding = self._load_encoding(model)
+    
+    @property
+    def is_exact(self) -> bool:
+        """Whether counts come from the model's tokenizer rather than an estimate."""
+        return self._encoding is not None
+    
+    def count(self, text: str) -> int:
+        """
+        Count tokens in text.
+        
+        Args:
+            text: Text to measure
+        
+        Returns:
+            Token count (an upper-leaning estimate without a tokenizer)
+        """
+        if not text:
+            return 0
+        
+        if self._encoding is not None:
+            return len(self._encoding.encode(text, disallowed_special=()))
+        
+        return self.estimate(text)
+    
+    def estimate(self, text: str) -> int:
+        """
+        Estimate tokens without a tokenizer.
+        
+        Takes the larger of a character-based estimate (prose) and the number
+        of words and punctuation marks (dense text such as procedure codes).
+        
+        Args:
+            text: Text to measure
+        
+        Returns:
+            Estimated token count
+        """
+        by_chars = math.ceil(len(text) / self.chars_per_token)
+        by_pretokens = len(_PRETOKEN_PATTERN.findall(text))
+        return max(by_chars, by_pretokens)
+    
+    def _load_encoding(self, model: str):
+        """Load the tokenizer for a model (None when unavailable)."""
+        if tiktoken is None:
+            return None
+        
+        # Strip provider prefixes such as 'openai:gpt-4'
+        model_name = model.split(":", 1)[-1]
+        
+        try:
+            try:
+                return tiktoken.encoding_for_model(model_name)
+            except KeyError:
+                # Unknown (e.g. non-OpenAI) models: cl100k_base is a close approximation
+                return tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            # Vocabulary files could not be loaded (e.g. offline without a cache)
+            return None
+
+
+@lru_cache(maxsize=8)
+def get_token_counter(model: str) -> TokenCounter:
+    """
+    Get a shared token counter for a model.
+    
+    Loading a tokenizer reads its vocabulary from disk (or downloads it), so
+    counters are built once per model and reused.
+    
+    Args:
+        model: Model name
+    
+    Returns:
+        Cached TokenCounter
+    """
+    return TokenCounter(model)
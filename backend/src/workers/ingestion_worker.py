@@ -0,0 +1,326 @@
+"""Background worker that drains queued ingestion jobs.
+
+Jobs are claimed with ``SELECT ... FOR UPDATE SKIP LOCKED`` and flipped to
+RUNNING in the same transaction, so any number of worker processes can poll
+the same table without processing a job twice.
+
+A claim is a lease: the worker renews ``updated_at`` on its running jobs
+every heartbeat interval. If a worker dies without finishing (SIGKILL, OOM,
+lost node), its jobs stop being renewed, and once the lease expires the next
+poll by any worker counts the attempt as failed and schedules a retry.
+A job's outcome is recorded in one transaction that first locks the job row
+and checks the lease is still this worker's, so a reclaimed job's results
+are never written.
+
+LLM rate limits are enforced per process: set WORKER_PROCESSES to the number
+of worker processes started so each one takes its share of the budget.
+
+Run with:
+    python -m src.workers.ingestion_worker
+"""
+import asyncio
+import logging
+import os
+import signal
+import socket
+import traceback
+from datetime import datetime
+from typing import Dict, List
+from uuid import UUID, uuid4
+
+from sqlalchemy import select, update, func, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..config import settings
+from ..database import AsyncSessionLocal
+from ..models.policy_document import PolicyDocument, ProcessingStatus
+from ..models.processing_job import ProcessingJob, JobType, JobStatus
+from ..services.ingestion.processor import IngestionProcessor
+from ..utils.azure_storage import storage_service
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionWorker:
+    """Poll for pending ingestion jobs and run them with bounded concurrency."""
+    
+    def __init__(
+        self,
+        processor: IngestionProcessor,
+        session_factory: async_sessionmaker = AsyncSessionLocal,
+        max_concurrent_jobs: int | None = None,
+        poll_interval: float | None = None
+    ):
+        """
+        Initialize ingestion worker.
+        
+        Args:
+            processor: Pipeline that processes a single policy document
+            session_factory: Factory for database sessions
+            max_concurrent_jobs: Max jobs this process runs at once
+            poll_interval: Seconds to wait between polls when idle
+        """
+        self.processor = processor
+        self.session_factory = session_factory
+        self.max_concurrent_jobs = max_concurrent_jobs or settings.worker_max_concurrent_jobs
+        self.poll_interval = poll_interval or settings.worker_poll_interval_seconds
+        self.lease_seconds = settings.worker_job_lease_seconds
+        self.heartbeat_interval = settings.worker_heartbeat_interval_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop = asyncio.Event()
+        self._claims: Dict[UUID, str] = {}
+    
+    def stop(self) -> None:
+        """Stop claiming new jobs; in-flight jobs are allowed to finish."""
+        self._stop.set()
+    
+    async def claim_jobs(self, limit: int) -> List[UUID]:
+        """
+        Atomically claim up to ``limit`` runnable jobs for this worker.
+        
+        PENDING jobs are runnable immediately; RETRYING jobs become runnable
+        once their exponential backoff has elapsed. RUNNING jobs whose lease
+        has expired are counted as a failed attempt (retried with backoff, or
+        failed once retries run out) rather than claimed right away.
+        
+        Args:
+            limit: Maximum number of jobs to claim
+        
+        Returns:
+            IDs of the claimed jobs
+        """
+        backoff = func.make_interval(
+            0, 0, 0, 0, 0, 0,
+            func.power(settings.retry_backoff_base, ProcessingJob.retry_count)
+        )
+        lease = func.make_interval(0, 0, 0, 0, 0, 0, self.lease_seconds)
+        
+        async with self.session_factory() as db:
+            result = await db.execute(
+                select(ProcessingJob)
+                .where(
+                    ProcessingJob.job_type == JobType.INGESTION,
+                    or_(
+                        ProcessingJob.status == JobStatus.PENDING,
+                        and_(
+                            ProcessingJob.status == JobStatus.RETRYING,
+                            ProcessingJob.updated_at + backoff <= func.now()
+                        ),
+                        and_(
+                            ProcessingJob.status == JobStatus.RUNNING,
+                            ProcessingJob.updated_at + lease < func.now()
+                        )
+                    )
+                )
+                .order_by(ProcessingJob.created_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            jobs = result.scalars().all()
+            
+            claimed = []
+            for job in jobs:
+                if job.status == JobStatus.RUNNING:
+                    logger.warning("Lease of job %s held by %s expired", job.id, job.celery_task_id)
+                    policy_doc = await db.get(PolicyDocument, job.policy_document_id)
+                    self._apply_failure(job, policy_doc, f"Lease expired; worker {job.celery_task_id} stopped", None)
+                    continue
+                
+                job.status = JobStatus.RUNNING
+                job.started_at = datetime.utcnow()
+                job.celery_task_id = f"{self.worker_id}:{uuid4().hex[:12]}"
+                claimed.append(job)
+            
+            await db.commit()
+            
+            for job in claimed:
+                self._claims[job.id] = job.celery_task_id
+            return [job.id for job in claimed]
+    
+    async def renew_leases(self) -> None:
+        """Extend the lease of every job this worker is running."""
+        if not self._claims:
+            return
+        
+        claims = dict(self._claims)
+        async with self.session_factory() as db:
+            result = await db.execute(
+                update(ProcessingJob)
+                .where(
+                    ProcessingJob.id.in_(list(claims)),
+                    ProcessingJob.celery_task_id.in_(list(claims.values())),
+                    ProcessingJob.status == JobStatus.RUNNING
+                )
+                .values(updated_at=func.now())
+                .returning(ProcessingJob.id)
+            )
+            renewed = set(result.scalars().all())
+            await db.commit()
+        
+        for job_id in claims.keys() - renewed:
+            if job_id in self._claims:
+                logger.warning("Lost the lease of job %s; its outcome will not be recorded", job_id)
+    
+    async def _heartbeat(self) -> None:
+        """Renew leases every heartbeat interval until cancelled."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                await self.renew_leases()
+            except Exception:
+                logger.exception("Failed to renew job leases")
+    
+    async def run_job(self, job_id: UUID) -> None:
+        """
+        Process one claimed job and record its outcome.
+        
+        The extracted sections, the document's final status, and the job's
+        completion are committed together, and only while this worker still
+        holds the lease.
+        
+        Args:
+            job_id: Processing job UUID
+        """
+        try:
+            async with self.session_factory() as db:
+                job = await db.get(ProcessingJob, job_id)
+                policy_doc = await db.get(PolicyDocument, job.policy_document_id)
+                
+                processed = await self.processor.extract(db, policy_doc)
+                
+                async with self.processor.persistence_semaphore:
+                    job = await self._lock_if_owned(db, job_id)
+                    if job is None:
+                        return
+                
+                    await self.processor.persist(db, policy_doc, processed)
+                    job.status = JobStatus.COMPLETED
+                    job.completed_at = datetime.utcnow()
+                    job.error_message = None
+                    job.error_stacktrace = None
+                    await db.commit()
+            
+            logger.info("Completed ingestion job %s", job_id)
+        except Exception as e:
+            logger.exception("Ingestion job %s failed", job_id)
+            await self._record_failure(job_id, e, traceback.format_exc())
+        finally:
+            self._claims.pop(job_id, None)
+    
+    async def _lock_if_owned(self, db: AsyncSession, job_id: UUID) -> ProcessingJob | None:
+        """
+        Lock the job row if this worker still holds its lease.
+        
+        The row lock lasts until the caller commits, so the lease cannot be
+        reclaimed (claim_jobs skips locked rows) while the outcome is written.
+        
+        Returns:
+            The refreshed job, or None (after rolling back) if it was reclaimed
+        """
+        result = await db.execute(
+            select(ProcessingJob)
+            .where(
+                ProcessingJob.id == job_id,
+                ProcessingJob.status == JobStatus.RUNNING,
+                ProcessingJob.celery_task_id == self._claims.get(job_id)
+            )
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        job = result.scalar_one_or_none()
+        if job is None:
+            logger.warning("Job %s was reclaimed after its lease expired; discarding this outcome", job_id)
+            await db.rollback()
+        return job
+    
+    async def _record_failure(self, job_id: UUID, error: Exception, stacktrace: str) -> None:
+        """Schedule a retry, or mark the job and document failed once retries run out."""
+        async with self.session_factory() as db:
+            job = await self._lock_if_owned(db, job_id)
+            if job is None:
+                return
+            policy_doc = await db.get(PolicyDocument, job.policy_document_id)
+            
+            self._apply_failure(job, policy_doc, str(error), stacktrace)
+            await db.commit()
+    
+    def _apply_failure(
+        self,
+        job: ProcessingJob,
+        policy_doc: PolicyDocument,
+        error_message: str,
+        stacktrace: str | None
+    ) -> None:
+        """Count a failed attempt: retry with backoff, or fail the job and document."""
+        job.error_message = error_message
+        job.error_stacktrace = stacktrace
+        
+        if job.retry_count < job.max_retries:
+            job.retry_count += 1
+            job.status = JobStatus.RETRYING
+            policy_doc.processing_status = ProcessingStatus.QUEUED
+        else:
+            job.status = JobStatus.FAILED
+            job.completed_at = datetime.utcnow()
+            policy_doc.processing_status = ProcessingStatus.FAILED
+    
+    async def run_forever(self) -> None:
+        """Poll and run jobs until stop() is called, then drain in-flight jobs."""
+        running: set[asyncio.Task] = set()
+        stop_waiter = asyncio.create_task(self._stop.wait())
+        heartbeat = asyncio.create_task(self._heartbeat())
+        
+        logger.info(
+            "Ingestion worker %s started (max %d concurrent jobs)",
+            self.worker_id, self.max_concurrent_jobs
+        )
+        
+        while not self._stop.is_set():
+            free_slots = self.max_concurrent_jobs - len(running)
+            if free_slots > 0:
+                for job_id in await self.claim_jobs(free_slots):
+                    task = asyncio.create_task(self.run_job(job_id))
+                    running.add(task)
+                    task.add_done_callback(running.discard)
+            
+            # Wake on shutdown, a finished job, or the poll interval
+            await asyncio.wait(
+                {stop_waiter, *running},
+                timeout=self.poll_interval,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+        
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        heartbeat.cancel()
+        
+        logger.info("LLM latency: %s", self.processor.agent.latency_stats())
+        
+        cache = self.processor.agent.cache
+        if cache is not None:
+            logger.info("LLM response cache: %s", cache.stats())
+            await cache.close()
+        
+        logger.info("Ingestion worker %s stopped", self.worker_id)
+
+
+async def main() -> None:
+    """Run a worker process until SIGINT/SIGTERM."""
+    logging.basicConfig(level=settings.log_level)
+    
+    processor = IngestionProcessor(storage_service)
+    worker = IngestionWorker(processor)
+    
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+    
+    try:
+        await worker.run_forever()
+    finally:
+        processor.pdf_extractor.shutdown()
+        processor.ocr_processor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
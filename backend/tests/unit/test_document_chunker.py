@@ -0,0 +1,69 @@
+"""Tests for section chunking of extracted document text."""
+import pytest
+
+from src.services.ingestion.document_chunker import DocumentChunker
+
+
+PAGES = [
+    {"text": "Intro text\nSECTION 1: Scope\nThis policy covers knees."},
+    {"text": "More scope.\nCOVERAGE CRITERIA:\nPatient must have pain.\nEXCLUSIONS:\nCosmetic."},
+    {"text": "Still exclusions.\nSECTION 2: Appeals\nFile within 30 days."},
+]
+
+
+def _full_text(pages):
+    """Join pages like PDFExtractor full_text."""
+    return "\n\n".join(page["text"] for page in pages)
+
+
+def _summary(sections):
+    return [
+        (section.title, section.text, section.order_index, section.page_start, section.page_end)
+        for section in sections
+    ]
+
+
+def test_page_offsets_match_joined_text():
+    text = _full_text(PAGES)
+    offsets = DocumentChunker.page_offsets(PAGES)
+    
+    assert [text[offset:offset + len(page["text"])] for offset, page in zip(offsets, PAGES)] == [
+        page["text"] for page in PAGES
+    ]
+
+
+def test_chunk_by_sections_splits_on_headers_with_page_spans():
+    chunker = DocumentChunker()
+    
+    sections = chunker.chunk_by_sections(_full_text(PAGES), chunker.page_offsets(PAGES))
+    
+    assert _summary(sections) == [
+        ("SECTION 1: Scope", "SECTION 1: Scope\nThis policy covers knees.\n\nMore scope.", 0, 1, 2),
+        ("COVERAGE CRITERIA:", "COVERAGE CRITERIA:\nPatient must have pain.", 1, 2, 2),
+        ("EXCLUSIONS:", "EXCLUSIONS:\nCosmetic.\n\nStill exclusions.", 2, 2, 3),
+        ("SECTION 2: Appeals", "SECTION 2: Appeals\nFile within 30 days.", 3, 3, 3),
+    ]
+
+
+@pytest.mark.parametrize("chunker", [
+    DocumentChunker(),
+    DocumentChunker(max_chunk_size=40),
+    DocumentChunker(max_chunk_tokens=12, overlap_tokens=2),
+], ids=["default", "small-chars", "small-tokens"])
+def test_iter_sections_matches_chunk_by_sections(chunker):
+    expected = chunker.chunk_by_sections(_full_text(PAGES), chunker.page_offsets(PAGES))
+    
+    streamed = list(chunker.iter_sections(iter(PAGES)))
+    
+    assert _summary(streamed) == _summary(expected)
+
+
+def test_iter_sections_without_headers_matches_whole_document():
+    pages = [{"text": "Plain text with no headers."}, {"text": "A second page of prose."}]
+    chunker = DocumentChunker()
+    
+    expected = chunker.chunk_by_sections(_full_text(pages), chunker.page_offsets(pages))
+    streamed = list(chunker.iter_sections(iter(pages)))
+    
+    assert _summary(streamed) == _summary(expected)
+    assert streamed[0].page_numbers == [1, 2]
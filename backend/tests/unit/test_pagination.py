@@ -0,0 +1,40 @@
+"""Tests for keyset pagination cursors."""
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from src.utils.pagination import InvalidCursorError, decode_cursor, encode_cursor
+
+
+def test_round_trip_preserves_types():
+    created_at = datetime(2024, 3, 1, 12, 30, 45, 123456, tzinfo=timezone.utc)
+    row_id = uuid4()
+    
+    cursor = encode_cursor(created_at, row_id, 0.87, 42, "J7321")
+    
+    assert decode_cursor(cursor, datetime, type(row_id), float, int, str) == [
+        created_at, row_id, 0.87, 42, "J7321"
+    ]
+
+
+def test_cursor_is_url_safe_without_padding():
+    cursor = encode_cursor("??>>", 1)
+    
+    assert "=" not in cursor
+    assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_")
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "!!!!", encode_cursor("a", "b")])
+def test_malformed_or_mismatched_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, datetime, int, str)
+
+
+def test_wrong_value_type_is_rejected():
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(encode_cursor("yesterday"), datetime)
+
+
+def test_invalid_cursor_error_is_a_value_error():
+    assert issubclass(InvalidCursorError, ValueError)
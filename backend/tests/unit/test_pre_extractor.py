@@ -0,0 +1,82 @@
+"""Tests for deterministic pre-extraction of codes, dates, and policy numbers."""
+from datetime import date
+
+import pytest
+
+from src.services.ingestion.document_chunker import DocumentChunker
+from src.services.ingestion.pre_extractor import PreExtractor
+
+
+@pytest.fixture
+def extractor():
+    return PreExtractor()
+
+
+def test_policy_number_and_labeled_dates(extractor):
+    result = extractor.extract(
+        "Policy Number: MP-2024-017\n"
+        "Effective Date: January 5, 2024\n"
+        "Expiration date 12/31/2025\n"
+    )
+    
+    assert result.policy_number == "MP-2024-017"
+    assert result.effective_date == date(2024, 1, 5)
+    assert result.expiration_date == date(2025, 12, 31)
+    assert result.dates == [date(2024, 1, 5), date(2025, 12, 31)]
+
+
+def test_policy_number_falls_back_to_metadata(extractor):
+    result = extractor.extract("No identifiers here.", {"title": "Medical Policy No. CP-118"})
+    
+    assert result.policy_number == "CP-118"
+
+
+def test_invalid_dates_are_ignored(extractor):
+    assert extractor.extract("Effective 2024-02-30").dates == []
+
+
+@pytest.mark.parametrize("text, codes", [
+    ("CPT codes 27447 and 27446 apply.", ["27447", "27446"]),
+    ("Total knee arthroplasty (27447)", ["27447"]),
+    ("27130 Total hip arthroplasty", ["27130"]),
+    ("Covered range 27440-27447", ["27440", "27447"]),
+    ("Covered range 27440 through 27447", ["27440", "27447"]),
+    ("Lab test 0001U and measure 3074F", ["0001U", "3074F"]),
+])
+def test_cpt_codes_in_code_context(extractor, text, codes):
+    assert extractor.extract(text).cpt_codes == codes
+
+
+@pytest.mark.parametrize("text", [
+    "Call the plan at extension 12345.",
+    "Write to 100 Main St, Chicago, IL 60601.",
+    "Submit form 10234 with the request.",
+    "Members enrolled after 2024 pay $12345.00.",
+    "Approved in 12345 cases last year.",
+])
+def test_five_digit_numbers_without_code_context_are_not_cpt(extractor, text):
+    assert extractor.extract(text).cpt_codes == []
+
+
+def test_hcpcs_and_icd10_codes(extractor):
+    result = extractor.extract("Injection J7321 for diagnosis M17.11; see Section 3.2.")
+    
+    assert result.hcpcs_codes == ["J7321"]
+    assert result.icd10_codes == ["M17.11"]
+    assert result.procedure_codes == ["J7321"]
+    assert result.has_codes
+
+
+def test_extract_sections_matches_extract_per_section(extractor):
+    text = (
+        "Knee Arthroplasty\n"
+        "SECTION 1: Coverage\nCPT 27447 is covered. Effective Date: 2024-01-01\n"
+        "SECTION 2: Exclusions\nHCPCS J7321 for M17.11 is excluded.\n"
+        "SECTION 3: Contact\nCall ext. 55512.\n"
+    )
+    sections = DocumentChunker().chunk_by_sections(text)
+    
+    results = extractor.extract_sections(sections)
+    
+    assert results == [extractor.extract(section.text) for section in sections]
+    assert [result.has_codes for result in results] == [True, True, False]
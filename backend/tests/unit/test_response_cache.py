@@ -0,0 +1,40 @@
+"""Tests for LLM response cache keys."""
+from typing import List
+
+from pydantic import BaseModel
+
+from src.services.extraction.response_cache import ResponseCache
+
+
+class Result(BaseModel):
+    codes: List[str]
+
+
+class OtherResult(BaseModel):
+    codes: List[str]
+    confidence: float
+
+
+def test_make_key_is_deterministic():
+    scope = ResponseCache.scope("openai:gpt-4", "Extract codes.", Result)
+    
+    assert ResponseCache.make_key(scope, "CPT 27447") == ResponseCache.make_key(scope, "CPT 27447")
+    assert len(ResponseCache.make_key(scope, "CPT 27447")) == 64
+
+
+def test_make_key_depends_on_context():
+    scope = ResponseCache.scope("openai:gpt-4", "Extract codes.", Result)
+    
+    assert ResponseCache.make_key(scope, "CPT 27447") != ResponseCache.make_key(scope, "CPT 27446")
+
+
+def test_scope_depends_on_model_prompt_and_schema():
+    scopes = {
+        ResponseCache.scope("openai:gpt-4", "Extract codes.", Result),
+        ResponseCache.scope("openai:gpt-4o", "Extract codes.", Result),
+        ResponseCache.scope("openai:gpt-4", "Extract all codes.", Result),
+        ResponseCache.scope("openai:gpt-4", "Extract codes.", OtherResult),
+    }
+    
+    assert len(scopes) == 4
+    assert len({ResponseCache.make_key(scope, "CPT 27447") for scope in scopes}) == 4
@@ -0,0 +1,90 @@
+"""Tests for LLM error classification and Retry-After parsing."""
+import asyncio
+import random
+import time
+from email.utils import formatdate
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from pydantic_ai.exceptions import UnexpectedModelBehavior
+
+from src.services.extraction.retry import RetryPolicy, classify_error
+
+
+class StatusError(Exception):
+    """Provider error carrying an HTTP status and response headers."""
+    
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+class RateLimitError(Exception):
+    """Stands in for the provider SDK error of the same name."""
+    
+    def __init__(self, headers=None):
+        super().__init__("rate limited")
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+@pytest.mark.parametrize("status_code, retryable", [
+    (429, True), (500, True), (503, True), (529, True),
+    (400, False), (401, False), (404, False), (422, False),
+])
+def test_http_status_classification(status_code, retryable):
+    assert classify_error(StatusError(status_code)).retryable is retryable
+
+
+@pytest.mark.parametrize("error", [
+    asyncio.TimeoutError(),
+    ConnectionError(),
+    httpx.ConnectError("refused"),
+    RateLimitError(),
+])
+def test_transient_errors_are_retryable(error):
+    assert classify_error(error).retryable
+
+
+@pytest.mark.parametrize("error", [UnexpectedModelBehavior("bad output"), KeyError("x")])
+def test_other_errors_are_not_retryable(error):
+    assert not classify_error(error).retryable
+
+
+def test_retry_after_seconds():
+    assert classify_error(StatusError(429, {"retry-after": "7"})).retry_after == 7.0
+
+
+def test_retry_after_ms_takes_precedence():
+    headers = {"retry-after-ms": "1500", "retry-after": "7"}
+    
+    assert classify_error(RateLimitError(headers)).retry_after == 1.5
+
+
+def test_retry_after_http_date():
+    headers = {"retry-after": formatdate(time.time() + 30, usegmt=True)}
+    
+    assert 25 <= classify_error(StatusError(503, headers)).retry_after <= 31
+
+
+@pytest.mark.parametrize("headers", [{}, {"retry-after": "soon"}, {"retry-after": "-5"}])
+def test_missing_or_invalid_retry_after(headers):
+    retry_after = classify_error(StatusError(429, headers)).retry_after
+    
+    assert retry_after in (None, 0.0)
+
+
+def test_retry_after_ignored_for_non_retryable_status():
+    assert classify_error(StatusError(400, {"retry-after": "7"})).retry_after is None
+
+
+def test_next_delay_is_jittered_capped_and_floored_by_retry_after():
+    policy = RetryPolicy(max_retries=3, base_delay=1.0, max_delay=10.0, rng=random.Random(0))
+    
+    delay = 0.0
+    for _ in range(20):
+        delay = policy.next_delay(delay)
+        assert 1.0 <= delay <= 10.0
+    
+    assert policy.next_delay(1.0, retry_after=30.0) == 30.0